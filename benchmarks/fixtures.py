@@ -0,0 +1,146 @@
+# git_assist/benchmarks/fixtures.py
+
+import os
+import stat
+import subprocess
+import sys
+import textwrap
+
+SONAR_STUB = '''
+import os, sys
+lines = int(os.environ.get("BENCH_SONAR_LINES", "100000"))
+severities = ["INFO", "MAJOR", "MINOR", "CRITICAL", "BLOCKER"]
+out = sys.stdout
+for i in range(lines):
+    out.write(f"DEBUG: Issue rule=java:S{i % 9000} component=src/main/java/Foo{i % 500}.java "
+              f"line={i % 300} severity={severities[i % 5] if i % 7 == 0 else 'INFO'}\\n")
+'''
+
+SNYK_STUB = '''
+import json, os, sys
+projects = int(os.environ.get("BENCH_SNYK_PROJECTS", "20"))
+vulns = int(os.environ.get("BENCH_SNYK_VULNS", "500"))
+severities = ["low", "medium", "high", "critical"]
+out = sys.stdout
+out.write("[\\n")
+for p in range(projects):
+    items = [{"id": f"SNYK-JAVA-{v % (vulns // 2 or 1)}", "title": f"Vulnerability {v}",
+              "severity": severities[v % 3], "packageName": f"org.example:lib{v % 97}",
+              "version": f"1.{v % 10}.0", "fixedIn": [f"1.{v % 10}.1"], "maturity": "mature",
+              "url": f"https://security.snyk.io/vuln/SNYK-JAVA-{v}", "from": [f"project{p}", f"lib{v}"]}
+             for v in range(vulns)]
+    out.write(json.dumps({"projectName": f"project{p}", "vulnerabilities": items}, indent=2))
+    out.write(",\\n" if p < projects - 1 else "\\n")
+out.write("]\\n")
+'''
+
+MVN_STUB = '''
+import os, sys
+modules = int(os.environ.get("BENCH_MVN_MODULES", "30"))
+tests = int(os.environ.get("BENCH_MVN_TESTS", "200"))
+for m in range(modules):
+    print(f"[INFO] ------------------< org.example:module-{m} >------------------")
+    print(f"[INFO] Building module-{m} 1.0.0-SNAPSHOT [{m + 1}/{modules}]")
+    for i in range(200):
+        print(f"[INFO] Compiling source file {i} of module-{m}")
+    reports = f"module-{m}/target/surefire-reports"
+    os.makedirs(reports, exist_ok=True)
+    with open(f"{reports}/TEST-org.example.Module{m}Test.xml", "w") as f:
+        f.write(f'<testsuite name="org.example.Module{m}Test" tests="{tests}">')
+        for t in range(tests):
+            outcome = '<failure message="expected 1 but was 2"/>' if t % 97 == 0 else ""
+            f.write(f'<testcase name="test{t}" classname="org.example.Module{m}Test" time="0.0{t % 10}">'
+                    f'{outcome}</testcase>')
+        f.write("</testsuite>")
+print("[INFO] Reactor Summary for parent 1.0.0-SNAPSHOT:")
+for m in range(modules):
+    print(f"[INFO] module-{m} ........................................ SUCCESS [  {m % 7}.{m:03d} s]")
+print("[INFO] BUILD SUCCESS")
+print("[INFO] Total time:  01:02 min")
+'''
+
+
+def write_stub_binaries(bin_dir):
+    """Write fake mvn, sonar-scanner, snyk (and jq) executables into bin_dir."""
+    os.makedirs(bin_dir, exist_ok=True)
+    stubs = {"sonar-scanner": SONAR_STUB, "snyk": SNYK_STUB, "mvn": MVN_STUB, "jq": "pass\n"}
+    for name, body in stubs.items():
+        path = os.path.join(bin_dir, name)
+        with open(path, "w") as f:
+            f.write(f"#!{sys.executable}\n{textwrap.dedent(body)}")
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return bin_dir
+
+
+def _git(repo, *args, input=None):
+    subprocess.run(["git", "-C", repo] + list(args), check=True, input=input,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def create_repository(root, files=2000, branches=200, untracked=500, modified=200):
+    """Create a working clone plus bare origin with the requested number of files and merged branches."""
+    origin = os.path.join(root, "origin.git")
+    repo = os.path.join(root, "work")
+    subprocess.run(["git", "init", "-q", "--bare", origin], check=True)
+    subprocess.run(["git", "init", "-q", "-b", "main", repo], check=True)
+    _git(repo, "config", "user.email", "bench@example.com")
+    _git(repo, "config", "user.name", "Bench")
+    _git(repo, "remote", "add", "origin", origin)
+
+    with open(os.path.join(repo, ".gitignore"), "w") as f:
+        f.write("*.log\ntarget/\n")
+    for i in range(files):
+        path = os.path.join(repo, "src", "main", "java", f"pkg{i % 50}", f"File{i}.java")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(f"class File{i} {{}}\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "initial")
+
+    head = subprocess.check_output(["git", "-C", repo, "rev-parse", "HEAD"]).decode().strip()
+    updates = "".join(f"create refs/heads/feature/bench-{i} {head}\n" for i in range(branches))
+    _git(repo, "update-ref", "--stdin", input=updates.encode())
+    _git(repo, "push", "-q", "origin", "refs/heads/*:refs/heads/*")
+    _git(repo, "fetch", "-q", "origin")
+
+    for i in range(modified):
+        with open(os.path.join(repo, "src", "main", "java", f"pkg{i % 50}", f"File{i}.java"), "a") as f:
+            f.write("// changed\n")
+    for i in range(untracked):
+        # Every other untracked entry is ignored, exercising the ignore checks
+        extension = "log" if i % 2 else "java"
+        path = os.path.join(repo, "generated", f"dir{i % 20}", f"Gen{i}.{extension}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write("generated\n")
+    return repo
+
+
+def write_jacoco_report(path, packages=50, classes_per_package=40):
+    """Write a synthetic jacoco.xml; returns the number of classes written."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    total_missed = total_covered = 0
+    with open(path, "w") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<!DOCTYPE report PUBLIC "-//JACOCO//DTD Report 1.1//EN" "report.dtd"><report name="bench">')
+        for p in range(packages):
+            package_missed = package_covered = 0
+            f.write(f'<package name="org/example/pkg{p}">')
+            for c in range(classes_per_package):
+                missed, covered = (p + c) % 17, 40 + (p * c) % 23
+                package_missed += missed
+                package_covered += covered
+                f.write(f'<class name="org/example/pkg{p}/Class{c}" sourcefilename="Class{c}.java">')
+                for m in range(5):
+                    f.write(f'<method name="m{m}" desc="()V" line="{m * 10}">'
+                            f'<counter type="INSTRUCTION" missed="1" covered="8"/></method>')
+                f.write(f'<counter type="INSTRUCTION" missed="{missed}" covered="{covered}"/></class>')
+                f.write(f'<sourcefile name="Class{c}.java">')
+                for line in range(30):
+                    f.write(f'<line nr="{line}" mi="0" ci="3" mb="0" cb="0"/>')
+                f.write('</sourcefile>')
+            f.write(f'<counter type="INSTRUCTION" missed="{package_missed}" covered="{package_covered}"/></package>')
+            total_missed += package_missed
+            total_covered += package_covered
+        f.write(f'<counter type="INSTRUCTION" missed="{total_missed}" covered="{total_covered}"/></report>')
+    return packages * classes_per_package
@@ -0,0 +1,175 @@
+# git_assist/benchmarks/run.py
+"""Offline benchmarks for the hot paths of git-assistant.
+
+Generates a synthetic repository and puts stub mvn/sonar-scanner/snyk
+executables on PATH, so no network, Maven or Sonar install is needed.
+
+    python -m benchmarks.run --files 5000 --branches 300 --compare benchmarks/results/<previous>.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.fixtures import create_repository, write_jacoco_report, write_stub_binaries
+from modules.branch_cleaner import BranchCleaner
+from modules.maven_build import MavenBuild
+from modules.sonar_checker import SeverityCounter
+from modules.snyk_checker import SnykChecker
+from utils.git_status import GitStatus
+from utils.jacoco_parser import JacocoReport
+from utils.logger import Logger
+from utils.prompt_utils import PromptUtils
+from utils.shell_utils import ShellUtils
+
+
+@contextlib.contextmanager
+def silenced():
+    """Send stdout/stderr of this process and its child processes to /dev/null."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = os.dup(1), os.dup(2)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved[0], 1)
+        os.dup2(saved[1], 2)
+        for fd in saved + (devnull,):
+            os.close(fd)
+
+
+def measure(name, func, units, unit, repeat=1):
+    """Best-of-`repeat` wall time plus peak Python heap usage of func()."""
+    best = None
+    peak = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        started = time.perf_counter()
+        with silenced():
+            func()
+        elapsed = time.perf_counter() - started
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        best = elapsed if best is None else min(best, elapsed)
+    result = {
+        "name": name,
+        "seconds": round(best, 4),
+        "units": units,
+        "unit": unit,
+        "throughput": round(units / best, 1) if best else None,
+        "peak_kib": round(peak / 1024, 1),
+    }
+    print(f"{name:<18} {result['seconds']:>9.3f}s {result['throughput']:>12} {unit}/s {result['peak_kib']:>10} KiB")
+    return result
+
+
+def run_benchmarks(args, workdir):
+    bin_dir = write_stub_binaries(os.path.join(workdir, "bin"))
+    os.environ["PATH"] = bin_dir + os.pathsep + os.environ["PATH"]
+    os.environ["BENCH_SONAR_LINES"] = str(args.sonar_lines)
+    os.environ["BENCH_SNYK_PROJECTS"] = str(args.snyk_projects)
+    os.environ["BENCH_SNYK_VULNS"] = str(args.snyk_vulns)
+    os.environ["BENCH_MVN_MODULES"] = str(args.mvn_modules)
+    os.environ["BENCH_MVN_TESTS"] = str(args.mvn_tests)
+
+    repo = create_repository(workdir, files=args.files, branches=args.branches, untracked=args.untracked,
+                             modified=args.modified)
+    jacoco_path = os.path.join(workdir, "jacoco", "jacoco.xml")
+    classes = write_jacoco_report(jacoco_path, packages=args.jacoco_packages)
+    logger = Logger()
+    PromptUtils.set_answers({"delete_branches": "y"})
+    os.chdir(repo)
+
+    def committer_status():
+        status = GitStatus.capture()
+        status.ignored(status.untracked + status.modified)
+
+    def sonar_log():
+        ShellUtils.stream_command("sonar-scanner", [SeverityCounter()])
+
+    def snyk_report():
+        checker = SnykChecker(logger, report_dir=os.path.join(workdir, "snyk-report"), all_projects=True)
+        checker._generate_markdown_report(checker._get_results())
+
+    results = [
+        measure("committer_status", committer_status, args.untracked + args.modified, "paths", args.repeat),
+        measure("sonar_log", sonar_log, args.sonar_lines, "lines", args.repeat),
+        measure("jacoco_parse", lambda: JacocoReport.parse(jacoco_path), classes, "classes", args.repeat),
+        measure("snyk_report", snyk_report, args.snyk_projects * args.snyk_vulns, "vulns", args.repeat),
+        measure("maven_build", MavenBuild(logger, report_dir=os.path.join(workdir, "build-report")).run,
+                args.mvn_modules * args.mvn_tests, "tests", args.repeat),
+        # Deletes the branches, so it can only run once per generated repository
+        measure("branch_cleaner", BranchCleaner(logger).clean_merged_branches, args.branches, "branches"),
+    ]
+    logger.close()
+    return results
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {result["name"]: result for result in json.load(f)["results"]}
+    print(f"\nCompared with {baseline_path}:")
+    for result in results:
+        previous = baseline.get(result["name"])
+        if not previous:
+            continue
+        time_delta = (result["seconds"] - previous["seconds"]) / previous["seconds"] * 100 if previous["seconds"] else 0
+        memory_delta = result["peak_kib"] - previous["peak_kib"]
+        print(f"{result['name']:<18} time {time_delta:+7.1f}%   peak memory {memory_delta:+10.1f} KiB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline git-assistant benchmarks")
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--branches", type=int, default=200)
+    parser.add_argument("--untracked", type=int, default=500)
+    parser.add_argument("--modified", type=int, default=200)
+    parser.add_argument("--sonar-lines", type=int, default=200000)
+    parser.add_argument("--jacoco-packages", type=int, default=50)
+    parser.add_argument("--snyk-projects", type=int, default=20)
+    parser.add_argument("--snyk-vulns", type=int, default=500)
+    parser.add_argument("--mvn-modules", type=int, default=30)
+    parser.add_argument("--mvn-tests", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output-dir", default="benchmarks/results")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    output_dir = os.path.abspath(args.output_dir)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="git-assist-bench-") as workdir:
+        try:
+            results = run_benchmarks(args, workdir)
+        finally:
+            os.chdir(cwd)
+
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(output_path, "w") as f:
+        json.dump({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {key: value for key, value in vars(args).items() if key not in ("output_dir", "compare")},
+            "results": results,
+        }, f, indent=2)
+    print(f"\nResults written to {output_path}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
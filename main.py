@@ -1,50 +1,170 @@
 # git_assist/main.py
 
+import argparse
 import os
-from modules.maven_build import MavenBuild
-from modules.sonar_checker import SonarChecker
-from modules.snyk_checker import SnykChecker
-from modules.committer import Committer
-from modules.pusher import Pusher
-from modules.branch_cleaner import BranchCleaner
+import signal
+import sys
 from utils.logger import Logger
+from utils.profiler import Profiler
+from utils.step_registry import StepContext, StepRegistry
 
+# Menu number -> registered step name; plugin steps are numbered after these
+MENU_STEPS = {"1": "build", "2": "sonar", "3": "snyk", "4": "commit", "5": "push", "7": "clean", "9": "force-build"}
 
-def main():
-    # Ensure log directory and file exist
+
+def create_logger():
+    # Log files (and their directory) are created on the first logged message
     log_dir = "git-assist"
     log_file_path = os.path.join(log_dir, "git-assist.log")
-    os.makedirs(log_dir, exist_ok=True)
-    if not os.path.exists(log_file_path):
-        open(log_file_path, 'a').close()
-
-    logger = Logger(log_file=log_file_path)
-    sonar_report_dir = "git-assist/sonar-reports"
-    snyk_report_dir = "git-assist/snyk-reports"
-
-    builder = MavenBuild(logger)
-    sonar = SonarChecker(logger, report_dir=sonar_report_dir)
-    snyk = SnykChecker(logger, report_dir=snyk_report_dir)
-    committer = Committer(logger)
-    pusher = Pusher(logger)
-    cleaner = BranchCleaner(logger)
-
-    menu_options = {
-        "1": ("🔧 Run 'mvn clean install'", builder.run),
-        "2": ("🧪 Run SonarQube and Jacoco checks", sonar.run),
-        "3": ("🔎 Run Snyk test and generate report", snyk.run),
-        "4": ("📝 Stage and commit git changes", committer.stage_and_commit),
-        "5": ("🚀 Push to remote branch", pusher.push_to_remote),
-        "6": ("⚙️ Execute All (1, 2, 3, 4)", lambda: [
-            builder.run(),
-            sonar.run(),
-            snyk.run(),
-            committer.stage_and_commit(),
-            pusher.push_to_remote()
-        ]),
-        "7": ("🧹 Clean merged remote branches", cleaner.clean_merged_branches),
-        "8": ("❌ Exit", exit)
+    json_log_file_path = os.path.join(log_dir, "git-assist.jsonl")
+
+    return Logger(log_file=log_file_path, json_log_file=json_log_file_path)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Git Assistant. Without --steps the interactive menu is shown.")
+    parser.add_argument("-C", "--repo", help="Repository to run in (defaults to the current directory)")
+    parser.add_argument("--steps", help="Comma-separated steps to run headless: build,sonar,snyk,commit,push,clean")
+    parser.add_argument("--ticket", help="Jira ticket for the commit step")
+    parser.add_argument("--message", help="Commit message for the commit step")
+    parser.add_argument("--stage", choices=["all", "tracked", "none"], default="tracked",
+                        help="Files to stage before committing: all changes, tracked files only, or none")
+    parser.add_argument("--min-coverage", type=float,
+                        help="Minimum instruction coverage in percent (defaults to SONAR_MIN_COVERAGE)")
+    parser.add_argument("--allow-severities", default="",
+                        help="Comma-separated Snyk severities that must not fail the run (e.g. high)")
+    parser.add_argument("--continue-on-sonar-warnings", action="store_true",
+                        help="Don't fail the run when the Sonar/JaCoCo gate fails")
+    parser.add_argument("--allow-protected-push", action="store_true", help="Allow pushing to protected branches")
+    parser.add_argument("--delete-branches", action="store_true",
+                        help="Let the clean step delete merged remote branches (otherwise it only lists them)")
+    parser.add_argument("--allow-failed-watch-checks", action="store_true",
+                        help="Commit and push even when watch mode saw checks fail for exactly these changes")
+    parser.add_argument("--skip-unaffected", action="store_true",
+                        help="Skip named steps the pending change cannot affect or that passed in watch mode")
+    parser.add_argument("--repos", nargs="+",
+                        help="Repository paths or globs to run the headless steps in, in parallel")
+    parser.add_argument("--max-parallel", type=int, default=4, help="Repositories processed at once with --repos")
+    parser.add_argument("--profile", action="store_true",
+                        help="Record timing spans and write git-assist/profile/trace.json and slowest.txt")
+    parser.add_argument("--summary-file", default="git-assist/summary.json", help="Where to write the JSON summary")
+    parser.add_argument("--watch", action="store_true",
+                        help="Watch the working tree and run WATCH_CHECKS in the background after each edit")
+    args = parser.parse_args(argv)
+    if args.repos and not args.steps:
+        parser.error("--repos requires --steps")  # exits with status 2, like other usage errors
+    return args
+
+
+def run_headless(args):
+    from modules.headless_runner import HeadlessRunner
+
+    # Watch mode cancels runs with SIGTERM: stop the streamed commands as on Ctrl+C instead of orphaning them
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    logger = create_logger()
+    allowed_severities = [severity.strip() for severity in args.allow_severities.split(",") if severity.strip()]
+    context = StepContext(logger, min_coverage=args.min_coverage, allowed_severities=allowed_severities)
+    registry = StepRegistry(context).discover_plugins()
+    answers = {
+        "add_untracked": "y" if args.stage == "all" else "n",
+        "add_modified": "y" if args.stage in ("all", "tracked") else "n",
+        "check_directory": "y",
+        "fix_sonar_issues": "n" if args.continue_on_sonar_warnings else "y",
+        "delete_branches": "y" if args.delete_branches else "n",
+        # Checks that failed in watch mode for exactly this commit block it unless explicitly allowed
+        "commit_with_failed_checks": "y" if args.allow_failed_watch_checks else "n",
+        "push_with_failed_checks": "y" if args.allow_failed_watch_checks else "n",
     }
+    if args.ticket:
+        answers["jira_ticket"] = args.ticket
+    if args.message:
+        answers["commit_message"] = args.message
+    if args.allow_protected_push:
+        answers["push_protected"] = "y"
+
+    selected = [step.strip() for step in args.steps.split(",") if step.strip()]
+    exit_code = HeadlessRunner(logger, registry, answers, summary_path=args.summary_file,
+                               skip_unaffected=args.skip_unaffected).run(selected)
+    export_profile(logger)
+    logger.close()
+    return exit_code
+
+
+def run_watch():
+    from modules.watch_daemon import WatchDaemon
+
+    logger = create_logger()
+    WatchDaemon.from_context(StepContext(logger)).run()
+    logger.close()
+    return 0
+
+
+def export_profile(logger):
+    if Profiler.enabled:
+        trace_path, table_path = Profiler.export()
+        logger.highlight(f"⏱️ Profile written to {trace_path} and {table_path}")
+
+
+def run_fleet(args):
+    from modules.fleet_orchestrator import FleetOrchestrator
+
+    logger = create_logger()
+    headless_args = ["--steps", args.steps, "--stage", args.stage, "--allow-severities", args.allow_severities]
+    if args.min_coverage is not None:
+        headless_args += ["--min-coverage", str(args.min_coverage)]
+    if args.ticket:
+        headless_args += ["--ticket", args.ticket]
+    if args.message:
+        headless_args += ["--message", args.message]
+    if args.continue_on_sonar_warnings:
+        headless_args.append("--continue-on-sonar-warnings")
+    if args.profile:
+        headless_args.append("--profile")
+    if args.allow_protected_push:
+        headless_args.append("--allow-protected-push")
+    if args.delete_branches:
+        headless_args.append("--delete-branches")
+    if args.skip_unaffected:
+        headless_args.append("--skip-unaffected")
+    if args.allow_failed_watch_checks:
+        headless_args.append("--allow-failed-watch-checks")
+
+    orchestrator = FleetOrchestrator(logger, max_parallel=args.max_parallel)
+    exit_code = orchestrator.run(FleetOrchestrator.expand_repositories(args.repos), headless_args)
+    logger.close()
+    return exit_code
+
+
+def main():
+    logger = create_logger()
+    context = StepContext(logger)
+    registry = StepRegistry(context).discover_plugins()
+
+    def step(name):
+        # Resolved at selection time so the step's module is only imported when it is used
+        return lambda: registry.get(name)()
+
+    def execute_all():
+        from utils.step_scheduler import StepScheduler
+
+        skip = context.skip_reasons()
+        context.start_prewarm([name for name in ("build", "sonar", "snyk") if name not in skip])
+        (StepScheduler(logger)
+         .add_step("build", registry.get("build"), skip_reason=skip.get("build"))
+         .add_step("sonar", registry.get("sonar"), depends_on=["build"], skip_reason=skip.get("sonar"))
+         .add_step("snyk", registry.get("snyk"), skip_reason=skip.get("snyk"))
+         .add_step("commit", registry.get("commit"), depends_on=["sonar", "snyk"])
+         .add_step("push", registry.get("push"), depends_on=["commit"])
+         .run())
+
+    menu_options = {key: (registry.description(name), step(name)) for key, name in MENU_STEPS.items()}
+    menu_options["6"] = ("⚙️ Execute All (1, 2, 3, 4)", execute_all)
+    menu_options["8"] = ("❌ Exit", exit)
+    plugin_steps = [name for name in registry.names() if name not in MENU_STEPS.values()]
+    for number, name in enumerate(plugin_steps, start=10):
+        menu_options[str(number)] = (registry.description(name), step(name))
+    menu_options = dict(sorted(menu_options.items(), key=lambda item: int(item[0])))
 
     while True:
         logger.highlight("🎛️ Git Assistant Menu")
@@ -52,21 +172,35 @@ def main():
             print(f"  {key}) {desc}")
 
         choice = input("Enter your selection (e.g. 1 3 4): ").strip().split()
+        context.reset()
 
         for option in choice:
             action = menu_options.get(option)
             if action:
-                _, func = action
+                desc, func = action
                 try:
-                    func()
+                    with Profiler.span(f"{option}) {desc}", "menu"):
+                        func()
                 except Exception as e:
                     logger.error(f"❌ Error executing option {option}: {e}")
             else:
                 logger.warn(f"❓ Unknown option: {option}")
 
         print("")
+        export_profile(logger)
         logger.highlight("✅ Task(s) completed. Back to main menu...\n")
 
 
 if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    if args.repo:
+        os.chdir(args.repo)
+    if args.profile:
+        Profiler.enable()
+    if args.repos:
+        sys.exit(run_fleet(args))
+    if args.watch:
+        sys.exit(run_watch())
+    if args.steps:
+        sys.exit(run_headless(args))
     main()
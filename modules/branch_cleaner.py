@@ -1,56 +1,138 @@
 # git_assist/modules/branch_cleaner.py
 
+import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from utils.logger import Logger
 from utils.shell_utils import ShellUtils
+from utils.prompt_utils import PromptUtils
+from utils.profiler import Profiler
+from utils.config_reader import ConfigReader
+from utils.git_repository import GitRepository
+
+_UNABLE_TO_DELETE = re.compile(r"^error: unable to delete '(?P<branch>[^']+)': (?P<reason>.+)$")
 
 class BranchCleaner:
-    def __init__(self, logger: Logger):
+    def __init__(self, logger: Logger, batch_size: int = 50, max_parallel_pushes: int = 4, dry_run: bool = False,
+                 min_age_days: int = 0, authors=None, bases=None, protected=None):
         self.logger = logger
+        self.bases = bases or ConfigReader.load().base_branches
+        self.protected = protected if protected is not None else ConfigReader.load().protected_branches
+        self.batch_size = batch_size
+        self.max_parallel_pushes = max_parallel_pushes
+        self.dry_run = dry_run
+        self.min_age_days = min_age_days
+        self.authors = [author.lower() for author in authors or []]
+
+    @classmethod
+    def from_context(cls, context):
+        config = context.config
+        return cls(context.logger, dry_run=config.branch_cleaner_dry_run,
+                   min_age_days=config.branch_cleaner_min_age_days, authors=config.branch_cleaner_authors)
 
     def clean_merged_branches(self):
         self.logger.highlight("🧹 Cleaning up remote merged branches...")
 
         ShellUtils.run_command("git fetch --all --prune")
 
-        bases = ["develop", "dev", "main", "master"]
-        base_branch = None
-
-        for base in bases:
-            if ShellUtils.command_success(f"git show-ref --verify --quiet refs/remotes/origin/{base}"):
-                base_branch = base
-                break
+        repository = GitRepository.discover()
+        base_branch = next((base for base in self.bases
+                            if repository and repository.ref_exists(f"refs/remotes/origin/{base}")), None)
 
         if not base_branch:
-            self.logger.error("❌ No base branch found (develop, dev, main, master).")
+            self.logger.error(f"❌ No base branch found ({', '.join(self.bases)}).")
             return
 
         self.logger.highlight(f"📥 Pulling latest for base branch: {base_branch}")
         ShellUtils.run_command(f"git checkout {base_branch}")
         ShellUtils.run_command(f"git pull origin {base_branch}")
 
-        merged_branches_raw = ShellUtils.capture_output(f"git branch -r --merged origin/{base_branch}")
-        merged_branches = [
-            branch.strip().replace("origin/", "")
-            for branch in merged_branches_raw.splitlines()
-            if branch.strip() and not any(branch.strip().endswith(base) for base in bases)
-        ]
+        merged_branches = self._find_merged_branches(base_branch)
 
         if not merged_branches:
             self.logger.success("✅ No remote merged branches to delete.")
             return
 
         self.logger.highlight("🌿 Merged branches ready for deletion:")
-        for idx, branch in enumerate(merged_branches, start=1):
-            print(f" {idx}. {branch}")
+        for idx, (branch, age_days, author) in enumerate(merged_branches, start=1):
+            print(f" {idx}. {branch} ({age_days}d old, {author})")
 
-        confirm = input("Do you want to delete these merged branches from remote? (y/n): ").strip().lower()
+        if self.dry_run:
+            self.logger.warn(f"🧪 Dry run: {len(merged_branches)} branch(es) would be deleted. Nothing was pushed.")
+            return
+
+        confirm = PromptUtils.ask("Do you want to delete these merged branches from remote? (y/n): ",
+                                  "delete_branches").strip().lower()
         if confirm != 'y':
             self.logger.warn("⚠️ Deletion aborted by user.")
             return
 
-        for branch in merged_branches:
-            if ShellUtils.run_command(f"git push origin --delete {branch}"):
+        branches = [branch for branch, _, _ in merged_branches]
+        batches = [branches[i:i + self.batch_size] for i in range(0, len(branches), self.batch_size)]
+        with ThreadPoolExecutor(max_workers=self.max_parallel_pushes) as pool:
+            results = [result for batch_results in pool.map(self._delete_batch, batches) for result in batch_results]
+
+        deleted = 0
+        for branch, ok, reason in results:
+            if ok:
+                deleted += 1
                 self.logger.success(f"🗑️ Deleted: {branch}")
             else:
-                self.logger.warn(f"⚠️ Failed to delete: {branch}")
+                self.logger.warn(f"⚠️ Failed to delete: {branch} ({reason})")
+        self.logger.highlight(f"🧮 Deleted {deleted} of {len(results)} merged branch(es).")
+
+    def _find_merged_branches(self, base_branch):
+        """Merged remote branches as (name, age in days, author), read with a single for-each-ref call."""
+        output = ShellUtils.capture_output(
+            f"git for-each-ref --merged origin/{base_branch} "
+            "--format='%(refname:strip=3)%09%(committerdate:unix)%09%(authorname) %(authoremail)' refs/remotes/origin")
+        now = time.time()
+        merged_branches = []
+        for line in output.splitlines():
+            branch, timestamp, author = line.split("\t", 2)
+            if branch == "HEAD" or branch in self.bases or branch in self.protected:
+                continue
+            age_days = int((now - int(timestamp)) // 86400)
+            if age_days < self.min_age_days:
+                continue
+            if self.authors and not any(wanted in author.lower() for wanted in self.authors):
+                continue
+            merged_branches.append((branch, age_days, author))
+        return merged_branches
+
+    def _delete_batch(self, branches):
+        """Delete many refs in one push and report (branch, ok, reason) for each of them.
+
+        git refuses the whole push when one of the refs is already gone. Refs without
+        an outcome are pushed again without the ones that failed, or in halves when
+        git named no culprit, until each has an outcome.
+        """
+        with Profiler.span("git push --delete", "git", branches=len(branches)) as span:
+            result = subprocess.run(["git", "push", "--porcelain", "origin", "--delete"] + branches,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            span["exit_code"] = result.returncode
+
+        # Porcelain lines look like "-\t:refs/heads/<branch>\t[deleted]" or "!\t...\t[remote rejected] (reason)"
+        outcomes = {}
+        for line in result.stdout.splitlines():
+            parts = line.split("\t")
+            if len(parts) >= 3 and parts[1].startswith(":refs/heads/"):
+                outcomes[parts[1][len(":refs/heads/"):]] = (parts[0] == "-", parts[2])
+        # Refs checked before anything is sent: "error: unable to delete '<branch>': remote ref does not exist"
+        for line in result.stderr.splitlines():
+            match = _UNABLE_TO_DELETE.match(line)
+            if match and match["branch"] in branches:
+                outcomes[match["branch"]] = (False, match["reason"])
+
+        remaining = [branch for branch in branches if branch not in outcomes]
+        retried = []
+        if remaining and len(remaining) < len(branches):
+            retried = self._delete_batch(remaining)  # the refs that blocked this push have their outcome now
+        elif len(remaining) > 1:
+            middle = len(remaining) // 2
+            retried = self._delete_batch(remaining[:middle]) + self._delete_batch(remaining[middle:])
+        outcomes.update((branch, (ok, reason)) for branch, ok, reason in retried)
+
+        fallback_reason = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "no response from remote"
+        return [(branch,) + outcomes.get(branch, (False, fallback_reason)) for branch in branches]
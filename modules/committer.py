@@ -1,52 +1,62 @@
-import subprocess
 import os
 from utils.logger import Logger
 from utils.shell_utils import ShellUtils
 from utils.config_reader import ConfigReader
+from utils.git_status import GitStatus
+from utils.prompt_utils import PromptUtils
+from utils.watch_results import WatchResults
 
 class Committer:
     def __init__(self, logger: Logger):
         self.logger = logger
 
+    @classmethod
+    def from_context(cls, context):
+        return cls(context.logger)
+
     def stage_and_commit(self):
         self.logger.highlight("📁 Checking Git status...")
 
-        untracked_files = self._get_untracked_files()
-        modified_files = self._get_modified_files()
+        status = GitStatus.capture()
+        # git-assist's own log, caches and reports are never offered for staging
+        untracked_files = [path for path in status.untracked if not GitStatus.is_tool_output(path)]
+        modified_files = [path for path in status.modified if not GitStatus.is_tool_output(path)]
+        ignored = status.ignored(untracked_files + modified_files)
         files_to_add = []
 
         # Handle untracked files
         for file_path in untracked_files:
-            if not self._is_ignored(file_path):
-                add = input(f"Add untracked file '{file_path}'? (y/n): ")
+            if file_path not in ignored:
+                add = PromptUtils.ask(f"Add untracked file '{file_path}'? (y/n): ", "add_untracked")
                 if add.lower() == 'y':
                     files_to_add.append(file_path)
 
         # Handle modified but unstaged files
         for file_path in modified_files:
-            if not self._is_ignored(file_path):
-                add = input(f"Add modified file '{file_path}'? (y/n): ")
+            if file_path not in ignored:
+                add = PromptUtils.ask(f"Add modified file '{file_path}'? (y/n): ", "add_modified")
                 if add.lower() == 'y':
                     files_to_add.append(file_path)
 
         # Handle directories inside those files
         for line in untracked_files + modified_files:
             if os.path.isdir(line):
-                add_dir = input(f"Directory '{line}' has been modified. Check each file inside? (y/n): ")
+                add_dir = PromptUtils.ask(f"Directory '{line}' has been modified. Check each file inside? (y/n): ",
+                                          "check_directory")
                 if add_dir.lower() == "y":
-                    for root, dirs, files in os.walk(line):
-                        for file in files:
-                            file_full_path = os.path.join(root, file)
-                            if not self._is_ignored(file_full_path):
-                                add_file = input(f"Add file '{file_full_path}'? (y/n): ")
-                                if add_file.lower() == "y":
-                                    files_to_add.append(file_full_path)
+                    dir_files = [os.path.join(root, file) for root, dirs, files in os.walk(line) for file in files]
+                    ignored_dir_files = status.ignored(dir_files)
+                    for file_full_path in dir_files:
+                        if file_full_path not in ignored_dir_files:
+                            add_file = PromptUtils.ask(f"Add file '{file_full_path}'? (y/n): ", "add_untracked")
+                            if add_file.lower() == "y":
+                                files_to_add.append(file_full_path)
                 else:
                     files_to_add.append(line)
 
         # Handle .gitignore specifically
-        if self._is_gitignore_modified():
-            add = input("Add modified file '.gitignore'? (y/n): ")
+        if status.is_staged_modification(".gitignore"):
+            add = PromptUtils.ask("Add modified file '.gitignore'? (y/n): ", "add_modified")
             if add.lower() == 'y':
                 files_to_add.append(".gitignore")
 
@@ -56,20 +66,23 @@ class Committer:
         else:
             self.logger.highlight("📎 No new files staged.")
 
-        staged = self._get_staged_files()
+        staged = GitStatus.capture().staged
         if not staged:
             self.logger.success("✅ No staged changes to commit.")
             return
 
+        if not self._check_watch_results():
+            raise Exception("Commit cancelled: checks failed in watch mode.")
+
         # Jira ticket config
-        jira_ticket_prefix = ConfigReader.get_value("JIRA_TICKET_PREFIX", "FINDATA-")
-        jira_ticket = input(f"Enter Jira Ticket (e.g., {jira_ticket_prefix}123): ").strip()
+        jira_ticket_prefix = ConfigReader.load().jira_ticket_prefix
+        jira_ticket = PromptUtils.ask(f"Enter Jira Ticket (e.g., {jira_ticket_prefix}123): ", "jira_ticket").strip()
         while not jira_ticket.startswith(jira_ticket_prefix):
             self.logger.error(f"❌ Invalid Jira Ticket. Must start with {jira_ticket_prefix}")
-            jira_ticket = input("Try again: ").strip()
+            jira_ticket = PromptUtils.ask("Try again: ", "jira_ticket_retry").strip()
 
         # Commit message
-        commit_message = input("Enter commit message: ").strip()
+        commit_message = PromptUtils.ask("Enter commit message: ", "commit_message").strip()
         if not commit_message:
             self.logger.error("❌ Commit message cannot be empty!")
             return
@@ -78,37 +91,20 @@ class Committer:
         ShellUtils.run_command(f'git commit -m "{full_message}"', check=True)
         self.logger.success("✅ Commit successful.")
 
-    def _get_untracked_files(self):
-        try:
-            output = subprocess.check_output(["git", "ls-files", "--others", "--exclude-standard"])
-            return output.decode().strip().splitlines()
-        except subprocess.CalledProcessError:
-            return []
-
-    def _get_modified_files(self):
-        try:
-            output = subprocess.check_output(["git", "diff", "--name-only"])
-            return output.decode().strip().splitlines()
-        except subprocess.CalledProcessError:
-            return []
-
-    def _get_staged_files(self):
-        try:
-            output = subprocess.check_output(["git", "diff", "--cached", "--name-only"])
-            return output.decode().strip().splitlines()
-        except subprocess.CalledProcessError:
-            return []
-
-    def _is_ignored(self, file_path: str) -> bool:
-        try:
-            subprocess.check_output(["git", "check-ignore", "-q", file_path])
+    def _check_watch_results(self):
+        """Reuse watch-mode results when they cover exactly the staged changes; False cancels the commit."""
+        results = WatchResults()
+        if not ConfigReader.load().watch_reuse_results or not results.exists():
+            return True  # nothing to reuse: don't spend a git call on the tree id
+        checks = results.checks_for(WatchResults.index_tree())
+        if checks is None:
             return True
-        except subprocess.CalledProcessError:
-            return False
-
-    def _is_gitignore_modified(self):
-        try:
-            status = subprocess.check_output(["git", "status", "--porcelain", ".gitignore"]).decode().strip()
-            return status.startswith("M")
-        except subprocess.CalledProcessError:
+        passed, failed = checks
+        if not failed:
+            self.logger.success(f"✅ Watch mode already checked these changes: {', '.join(passed)} passed.")
+            return True
+        self.logger.warn(f"⚠️ Watch mode: {', '.join(failed)} failed for exactly these changes.")
+        if PromptUtils.ask("Commit anyway? (y/n): ", "commit_with_failed_checks").strip().lower() != "y":
+            self.logger.error("⛔ Commit cancelled.")
             return False
+        return True
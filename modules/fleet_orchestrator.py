@@ -0,0 +1,103 @@
+# git_assist/modules/fleet_orchestrator.py
+
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from utils.logger import Logger
+
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+class FleetOrchestrator:
+    """Run the headless pipeline in many repositories at once.
+
+    Every repository gets its own `main.py` process (so working directory,
+    prompts and loggers are fully isolated), at most `max_parallel` at a time.
+    Console output goes to `<repo>/git-assist/headless-console.log`; the
+    per-repo JSON summaries are merged into one fleet report.
+    """
+
+    def __init__(self, logger: Logger, max_parallel: int = 4, report_dir: str = "git-assist/fleet-reports"):
+        self.logger = logger
+        self.max_parallel = max_parallel
+        self.report_dir = Path(report_dir)
+
+    @staticmethod
+    def expand_repositories(patterns):
+        repositories = []
+        for pattern in patterns:
+            matches = sorted(glob.glob(os.path.expanduser(pattern))) or [pattern]
+            repositories.extend(os.path.abspath(match) for match in matches
+                                if os.path.isdir(os.path.join(match, ".git")))
+        return list(dict.fromkeys(repositories))
+
+    def run(self, repositories, headless_args):
+        if not repositories:
+            self.logger.error("❌ No git repositories matched.")
+            return 2
+
+        self.logger.highlight(f"🚢 Running {len(repositories)} repositories, {self.max_parallel} at a time...")
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as pool:
+            futures = {pool.submit(self._run_repository, repo, headless_args): repo for repo in repositories}
+            for future in as_completed(futures):
+                repo = futures[future]
+                results[repo] = future.result()
+                status = "✅" if results[repo]["exit_code"] == 0 else "❌"
+                self.logger.log(f"{status} {repo} (exit {results[repo]['exit_code']}, {results[repo]['duration']}s)")
+
+        self._write_reports(results)
+        return 0 if all(result["exit_code"] == 0 for result in results.values()) else 1
+
+    def _run_repository(self, repo, headless_args):
+        summary_path = os.path.join(repo, "git-assist", "summary.json")
+        console_log = os.path.join(repo, "git-assist", "headless-console.log")
+        os.makedirs(os.path.dirname(console_log), exist_ok=True)
+
+        started = time.monotonic()
+        with open(console_log, "w") as log:
+            process = subprocess.run(
+                [sys.executable, MAIN_SCRIPT, "--repo", repo, "--summary-file", summary_path] + headless_args,
+                stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT)
+        result = {"exit_code": process.returncode, "duration": round(time.monotonic() - started, 1),
+                  "console_log": console_log, "steps": {}}
+        try:
+            with open(summary_path) as f:
+                result["steps"] = json.load(f).get("steps", {})
+        except (OSError, ValueError):
+            pass
+        return result
+
+    def _write_reports(self, results):
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        with (self.report_dir / "fleet_summary.json").open("w") as f:
+            json.dump(results, f, indent=2)
+
+        lines = [
+            "# 🚢 Fleet Report\n\n",
+            f"**🕒 Generated on:** `{datetime.now().isoformat(sep=' ', timespec='seconds')}`\n\n",
+            "| Repository | Exit | Build | Coverage | Sonar (C/B/M) | Snyk (critical/high) | Duration |\n",
+            "|------------|------|-------|----------|---------------|----------------------|----------|\n",
+        ]
+        for repo in sorted(results):
+            result = results[repo]
+            steps = result["steps"]
+            build = steps.get("build", {}).get("status", "-")
+            sonar = steps.get("sonar", {}).get("details") or {}
+            snyk = steps.get("snyk", {}).get("details") or {}
+            coverage = f"{sonar['coverage']}%" if "coverage" in sonar else "-"
+            issues = f"{sonar['critical']}/{sonar['blocker']}/{sonar['major']}" if sonar else "-"
+            vulnerabilities = f"{snyk.get('critical', 0)}/{snyk.get('high', 0)}" if "snyk" in steps else "-"
+            lines.append(f"| {os.path.basename(repo)} | {result['exit_code']} | {build} | {coverage} | {issues} | "
+                         f"{vulnerabilities} | {result['duration']}s |\n")
+
+        report_path = self.report_dir / "fleet_report.md"
+        with report_path.open("w") as f:
+            f.write("".join(lines))
+        self.logger.highlight(f"📄 Fleet report written to {report_path}")
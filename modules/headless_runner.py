@@ -0,0 +1,96 @@
+# git_assist/modules/headless_runner.py
+
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from utils.logger import Logger
+from utils.prompt_utils import PromptUtils
+from utils.step_scheduler import StepScheduler
+from utils.step_registry import StepRegistry
+
+EXIT_OK = 0
+EXIT_STEP_FAILED = 1
+EXIT_USAGE = 2
+
+# Dependencies between pipeline steps; only those among the selected steps apply
+STEP_DEPENDENCIES = {
+    "build": [],
+    "force-build": ["build"],  # the same MavenBuild; never two builds at once
+    "sonar": ["build", "force-build"],
+    "snyk": [],
+    "commit": ["build", "force-build", "sonar", "snyk"],
+    "push": ["commit"],
+    "clean": ["push"],
+}
+
+
+class HeadlessRunner:
+    """Run pipeline steps without a person present.
+
+    Prompts are answered from `answers` (see PromptUtils); a prompt without an
+    answer fails its step instead of blocking. Writes a JSON summary and
+    returns a process exit code. The named steps always run unless
+    `skip_unaffected` is set, in which case impact analysis and watch-mode
+    results may skip them as in the interactive menu.
+    """
+
+    def __init__(self, logger: Logger, registry: StepRegistry, answers, summary_path: str = "git-assist/summary.json",
+                 skip_unaffected: bool = False):
+        self.logger = logger
+        self.registry = registry
+        self.answers = answers
+        self.summary_path = Path(summary_path)
+        self.skip_unaffected = skip_unaffected
+
+    def run(self, selected):
+        available = self.registry.names()
+        unknown = [name for name in selected if name not in available]
+        if unknown or not selected:
+            self.logger.error(f"❌ Unknown or missing step(s): {', '.join(unknown) or '(none)'}. "
+                              f"Available: {', '.join(available)}")
+            return EXIT_USAGE
+
+        PromptUtils.set_answers(self.answers)
+        steps = {name: self.registry.get(name) for name in selected}
+        skip = self.registry.context.skip_reasons() if self.skip_unaffected else {}
+        scheduler = StepScheduler(self.logger)
+        for name in selected:
+            depends_on = [dep for dep in STEP_DEPENDENCIES.get(name, []) if dep in selected]
+            scheduler.add_step(name, steps[name], depends_on=depends_on, skip_reason=skip.get(name))
+        self.registry.context.start_prewarm([name for name in selected if name not in skip])
+
+        started_at = datetime.now().isoformat(timespec="seconds")
+        started = time.monotonic()
+        try:
+            scheduler.run()
+            exit_code = EXIT_OK
+        except Exception:
+            exit_code = EXIT_STEP_FAILED
+
+        self._write_summary(scheduler, steps, started_at, time.monotonic() - started, exit_code)
+        return exit_code
+
+    def _write_summary(self, scheduler, steps, started_at, duration, exit_code):
+        summary_steps = {}
+        for name in steps:
+            error = scheduler.errors.get(name)
+            summary_steps[name] = {
+                "status": scheduler.results.get(name, StepScheduler.CANCELLED),
+                "duration": scheduler.durations.get(name),
+                "error": str(error) if error else None,
+                "skip_reason": scheduler.skipped.get(name),
+                "details": getattr(getattr(steps[name], "__self__", None), "last_result", None),
+            }
+        summary = {
+            "repository": os.getcwd(),
+            "started_at": started_at,
+            "duration": round(duration, 2),
+            "exit_code": exit_code,
+            "steps": summary_steps,
+        }
+        self.summary_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.summary_path.open("w") as f:
+            json.dump(summary, f, indent=2)
+        self.logger.highlight(f"📄 Summary written to {self.summary_path}")
@@ -1,17 +1,186 @@
 # git_assist/modules/maven_build.py
 
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
 from utils.logger import Logger
 from utils.shell_utils import ShellUtils
+from utils.build_cache import BuildCache
+from utils.maven_reactor import ReactorScope
+from utils.metrics_store import MetricsStore
+from utils.maven_log import ReactorLog
+from utils.surefire_parser import SurefireReport
+from utils.maven_prewarm import DependencyPrewarm, MavenEnvironment
 
 class MavenBuild:
-    def __init__(self, logger: Logger):
+    def __init__(self, logger: Logger, cache: BuildCache = None, scope: ReactorScope = None,
+                 metrics: MetricsStore = None, report_dir: str = "git-assist/build-reports",
+                 environment: MavenEnvironment = None, prewarm: DependencyPrewarm = None):
         self.logger = logger
+        self.environment = environment or MavenEnvironment(use_daemon=False)
+        self.prewarm = prewarm
+        self._last_log = None
+        self.last_result = None
+        self.report_dir = Path(report_dir)
+        self.summary_report_path = self.report_dir / "build_summary.md"
+        self.metrics = metrics
+        self.cache = cache
+        self.scope = scope
 
-    def run(self):
-        self.logger.highlight("🔧 Running mvn clean install...")
+    @classmethod
+    def from_context(cls, context):
+        return cls(context.logger, cache=BuildCache("git-assist/build-cache"), scope=context.scope,
+                   metrics=context.metrics, environment=MavenEnvironment.from_config(context.config),
+                   prewarm=context.prewarm)
+
+    def run(self, force: bool = False):
+        cache_key = self._cache_key()
+        if cache_key and not force and os.path.isdir("target"):
+            entry = self.cache.lookup(cache_key)
+            if entry:
+                built_at = datetime.fromtimestamp(entry["built_at"]).isoformat(sep=' ', timespec='seconds')
+                self.logger.success(f"♻️ Build inputs unchanged since the successful build at {built_at} "
+                                    f"({entry['duration']}s). Skipping mvn clean install.")
+                return
+
+        arguments = self._build_arguments()
+        if not arguments:
+            self.logger.success("✅ No reactor module changed since the base branch. Nothing to build.")
+            return
+        if sys.stdout.isatty():
+            # mvn only sees the pipe it is streamed through and would print without colors; ReactorLog strips them
+            arguments = f"-Dstyle.color=always {arguments}"
+
+        offline = False
+        if self.prewarm:
+            self.prewarm.start()  # no-op when it already ran for these POMs
+            offline = self.prewarm.wait()
+
+        started = time.monotonic()
+        try:
+            self._execute(self.environment.command(arguments, offline=offline))
+        except Exception:
+            if not (offline and self._last_log.offline_miss):
+                raise
+            # The pre-warm missed an artifact (e.g. one resolved only during the build): rebuild online
+            self.logger.warn("📡 The offline build is missing artifacts. Retrying online...")
+            self.prewarm.invalidate()
+            self._execute(self.environment.command(arguments))
+        duration = time.monotonic() - started
+        if cache_key:
+            self.cache.store(cache_key, duration)
+        self._record_duration(duration)
+
+    def _execute(self, command):
+        self.logger.highlight(f"🔧 Running {command}...")
+        started = time.monotonic()
+        started_at = time.time()
+        self._last_log = reactor_log = ReactorLog()
         try:
-            ShellUtils.run_command("mvn clean install", check=True)
+            ShellUtils.stream_command(command, [ShellUtils.echo, reactor_log], check=True)
             self.logger.success("✅ Maven build successful")
         except Exception as e:
             self.logger.error(f"❌ Maven build failed: {e}")
+            self._summarize(command, reactor_log, started_at, time.monotonic() - started)
             raise
+        self._summarize(command, reactor_log, started_at, time.monotonic() - started)
+
+    def _summarize(self, command, reactor_log: ReactorLog, started_at, duration):
+        """Log and write the build telemetry: reactor module timings plus this build's Surefire results."""
+        try:
+            tests = SurefireReport.parse(SurefireReport.find(newer_than=int(started_at)))
+            self._write_markdown_summary(command, reactor_log, tests, duration)
+        except Exception as e:
+            self.logger.warn(f"⚠️ Could not summarize the build: {e}")
+            return
+
+        slowest = reactor_log.slowest_modules(1)
+        if slowest:
+            self.logger.highlight(f"⏱️ Slowest module: {slowest[0][0]} ({slowest[0][1]:.1f}s)")
+        if tests.cases:
+            self.logger.highlight(f"🧪 Tests: {tests.count()} run, {tests.count('failure')} failed, "
+                                  f"{tests.count('error')} errors, {tests.count('skipped')} skipped")
+        for case in tests.failures():
+            self.logger.error(f"❌ {case.classname}.{case.name}: {case.message or case.outcome}")
+        self.last_result = {
+            "modules": {name: {"status": status, "duration": module_duration}
+                        for name, (status, module_duration) in reactor_log.modules.items()},
+            "tests": tests.count(),
+            "failed_tests": [f"{case.classname}.{case.name}" for case in tests.failures()],
+        }
+
+    def _write_markdown_summary(self, command, reactor_log: ReactorLog, tests: SurefireReport, duration):
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        lines = ["# 🔧 Maven Build Summary\n\n",
+                 f"**🕒 Generated on:** `{datetime.now().isoformat(sep=' ', timespec='seconds')}`\n\n",
+                 f"**Command:** `{command}` · **Result:** {reactor_log.result or 'UNKNOWN'} · "
+                 f"**Duration:** {duration:.1f}s\n\n"]
+
+        if reactor_log.modules:
+            lines.append("## 🏗️ Reactor Modules\n\n")
+            lines.append("| Module | Status | Duration |\n")
+            lines.append("|--------|--------|----------|\n")
+            for name, (status, module_duration) in reactor_log.modules.items():
+                shown = f"{module_duration:.1f}s" if module_duration is not None else "-"
+                lines.append(f"| {name} | {status} | {shown} |\n")
+            lines.append("\n")
+        for project, reason in reactor_log.failures.items():
+            lines.append(f"**❌ {project}:** {reason}\n\n")
+
+        if tests.cases:
+            lines.append(f"## 🧪 Tests\n\n**Run:** {tests.count()} · **Failed:** {tests.count('failure')} · "
+                         f"**Errors:** {tests.count('error')} · **Skipped:** {tests.count('skipped')}\n\n")
+            failures = tests.failures()
+            if failures:
+                lines.append("| Failed Test | Module | Message |\n")
+                lines.append("|-------------|--------|---------|\n")
+                for case in failures:
+                    message = (case.message or case.outcome).replace("|", "\\|").replace("\n", " ")[:200]
+                    lines.append(f"| {case.classname}.{case.name} | {case.module} | {message} |\n")
+                lines.append("\n")
+            lines.append("**🐢 Slowest test classes:**\n\n")
+            lines.append("| Class | Module | Time |\n")
+            lines.append("|-------|--------|------|\n")
+            for (module, classname), class_time in tests.slowest_classes():
+                lines.append(f"| {classname} | {module} | {class_time:.2f}s |\n")
+            lines.append("\n**🐢 Slowest test cases:**\n\n")
+            lines.append("| Test | Time |\n")
+            lines.append("|------|------|\n")
+            for case in tests.slowest_cases():
+                lines.append(f"| {case.classname}.{case.name} | {case.time:.2f}s |\n")
+            lines.append("\n")
+
+        with self.summary_report_path.open("w") as f:
+            f.write("".join(lines))
+
+    def _record_duration(self, duration):
+        if not self.metrics:
+            return
+        try:
+            self.metrics.record_duration(MetricsStore.current_revision(), "build", duration)
+        except Exception as e:
+            self.logger.warn(f"⚠️ Metrics history unavailable: {e}")
+
+    def force_run(self):
+        self.run(force=True)
+
+    def _build_arguments(self):
+        if not self.scope or self.scope.resolve().full_build:
+            return "clean install"
+        if not self.scope.modules:
+            return None
+        goals = "install" if self.scope.skip_clean else "clean install"
+        project_list = ",".join(sorted(self.scope.changed_modules))
+        # -amd also builds every reactor module depending on the changed ones
+        return f"{goals} -pl {project_list} -amd"
+
+    def _cache_key(self):
+        if not self.cache:
+            return None
+        try:
+            return self.cache.compute_key()
+        except Exception as e:
+            self.logger.warn(f"⚠️ Could not fingerprint build inputs, build cache disabled for this run: {e}")
+            return None
@@ -3,29 +3,48 @@
 import subprocess
 from utils.logger import Logger
 from utils.shell_utils import ShellUtils
+from utils.prompt_utils import PromptUtils
+from utils.config_reader import ConfigReader
+from utils.git_repository import GitRepository
+from utils.watch_results import WatchResults
 
 class Pusher:
     def __init__(self, logger: Logger):
         self.logger = logger
 
+    @classmethod
+    def from_context(cls, context):
+        return cls(context.logger)
+
     def push_to_remote(self):
-        try:
-            branch = ShellUtils.capture_output("git rev-parse --abbrev-ref HEAD")
-        except subprocess.CalledProcessError as e:
-            # Handle the case where `git rev-parse` fails and return a custom error message
-            self.logger.error(f"❌ Error: {e.stderr.strip()}")
+        repository = GitRepository.discover()
+        if not repository:
+            self.logger.error("❌ Error: not a git repository.")
             return
+        branch = repository.current_branch()
 
-        protected_branches = ["main", "master", "develop", "dev"]
+        protected_branches = ConfigReader.load().protected_branches
 
         if branch in protected_branches:
             self.logger.warn(f"⚠️ You are on a protected branch: {branch}")
-            confirm = input(f"Do you really want to push to '{branch}'? (y/n): ").strip().lower()
+            confirm = PromptUtils.ask(f"Do you really want to push to '{branch}'? (y/n): ",
+                                      "push_protected").strip().lower()
             if confirm != 'y':
                 self.logger.error("⛔ Push cancelled.")
                 return
 
-        self.logger.highlight(f"🚀 Pushing to origin/{branch}...")
+        if not self._check_watch_results():
+            raise Exception("Push cancelled: checks failed in watch mode.")
+
+        ahead_behind = repository.ahead_behind("HEAD", f"refs/remotes/origin/{branch}")
+        if ahead_behind:
+            ahead, behind = ahead_behind
+            self.logger.highlight(f"🚀 Pushing {ahead} commit(s) to origin/{branch}...")
+            if behind:
+                self.logger.warn(f"⚠️ origin/{branch} has {behind} commit(s) not in your branch; "
+                                 "the push may be rejected.")
+        else:
+            self.logger.highlight(f"🚀 Pushing to origin/{branch}...")
         try:
             # Try pushing to the remote repository
             ShellUtils.run_command(f"git push -u origin {branch}", capture_output=True)
@@ -33,3 +52,22 @@ class Pusher:
         except subprocess.CalledProcessError as e:
             # Error in case push fails
             self.logger.error(f"❌ Push failed: {e.stderr.strip() if e.stderr else 'Unknown error'}")
+            raise Exception("Push failed.")
+
+    def _check_watch_results(self):
+        """Reuse watch-mode results when the working tree is exactly what is being pushed; False cancels the push."""
+        results = WatchResults()
+        if not ConfigReader.load().watch_reuse_results or not results.exists():
+            return True  # nothing to reuse: don't spend a git call on the tree id
+        checks = results.checks_for(WatchResults.head_tree())
+        if checks is None:
+            return True
+        passed, failed = checks
+        if not failed:
+            self.logger.success(f"✅ Watch mode already checked this commit: {', '.join(passed)} passed.")
+            return True
+        self.logger.warn(f"⚠️ Watch mode: {', '.join(failed)} failed for this commit.")
+        if PromptUtils.ask("Push anyway? (y/n): ", "push_with_failed_checks").strip().lower() != "y":
+            self.logger.error("⛔ Push cancelled.")
+            return False
+        return True
@@ -1,37 +1,75 @@
 # git_assist/modules/snyk_checker.py
 import os
 import json
+import time
+from datetime import datetime
 from pathlib import Path
 from subprocess import CalledProcessError
-from typing import Any
 from utils.logger import Logger
 from utils.shell_utils import ShellUtils
+from utils.prompt_utils import PromptUtils
+from utils.snyk_cache import SnykCache
+from utils.snyk_results import SnykResults
+from utils.config_reader import ConfigReader
+from utils.metrics_store import MetricsStore
 
 class SnykChecker:
-    def __init__(self, logger: Logger, report_dir: str = "git-assist/sonar-report"):
+    def __init__(self, logger: Logger, report_dir: str = "git-assist/sonar-report", cache: SnykCache = None,
+                 all_projects: bool = False, allowed_severities=None, metrics: MetricsStore = None):
         self.logger = logger
+        self.metrics = metrics
+        self.allowed_severities = allowed_severities
+        self.last_result = None
+        self.all_projects = all_projects
         self.report_dir = Path(report_dir)
         self.report_file = self.report_dir / "snyk_report.md"
+        self.cache = cache
+
+    @classmethod
+    def from_context(cls, context):
+        config = context.config
+        return cls(context.logger, report_dir="git-assist/snyk-reports",
+                   cache=SnykCache("git-assist/snyk-cache", config.snyk_cache_ttl_hours),
+                   all_projects=config.snyk_all_projects,
+                   allowed_severities=context.overrides.get("allowed_severities"), metrics=context.metrics)
 
     def run(self):
         self.logger.highlight("🔍 Running Snyk security check...")
+        started = time.monotonic()
         try:
-            # Run snyk and capture JSON output (even on non-zero exit codes)
-            snyk_output = ShellUtils.run_command("snyk test --json", check=False, capture_output=True)
-            snyk_data = json.loads(snyk_output)
-            vulnerabilities = snyk_data.get("vulnerabilities", [])
+            results = self._get_results()
+            for error in results.errors:
+                self.logger.warn(f"⚠️ Snyk reported an error for a project: {error}")
+            if results.errors:
+                # An errored project was never tested: don't report it as clean or record it in the history
+                self.last_result = {"errors": len(results.errors)}
+                self.logger.error(f"⛔ Snyk could not test {len(results.errors)} of {results.project_count} "
+                                  "project(s). Aborting.")
+                raise Exception(f"Snyk test failed: {results.errors[0]}")
+
+            base_branch, new_findings = self._compare_with_history(results, time.monotonic() - started)
 
             # Generate markdown report
-            self._generate_markdown_report(vulnerabilities)
+            self._generate_markdown_report(results, base_branch, new_findings)
+
+            self.last_result = {severity: len(vulns) for severity, vulns in results.by_severity.items()}
+            if base_branch:
+                self.last_result["new_vs_base"] = len(new_findings)
 
             # Check severity levels
-            severities = [v["severity"] for v in vulnerabilities]
-            if "critical" in severities:
+            new_severe = [vuln for vuln in new_findings or [] if vuln.get("severity") in ("critical", "high")]
+            if new_severe and ConfigReader.load().fail_on_regression:
+                self.logger.error(f"⛔ {len(new_severe)} new critical/high vulnerabilities "
+                                  f"compared with {base_branch}.")
+                raise Exception("New critical/high vulnerabilities compared with the base branch.")
+            elif self.allowed_severities is not None:
+                self._apply_severity_policy(results)
+            elif results.has_severity("critical"):
                 self.logger.error("⛔ Critical vulnerabilities found! Aborting.")
                 raise Exception("Critical vulnerabilities found.")
-            elif "high" in severities:
+            elif results.has_severity("high"):
                 self.logger.warn("⚠️ High severity vulnerabilities found.")
-                user_input = input("Do you want to continue anyway? (y/n): ")
+                user_input = PromptUtils.ask("Do you want to continue anyway? (y/n): ", "continue_on_high")
                 if user_input.lower() != "y":
                     self.logger.error("⛔ Aborting due to high vulnerabilities.")
                     raise Exception("Aborted due to high severity vulnerabilities.")
@@ -46,28 +84,96 @@ class SnykChecker:
         except Exception as e:
             raise e
 
-    def _generate_markdown_report(self, vulnerabilities: list[dict[str, Any]]):
+    def _compare_with_history(self, results: SnykResults, duration):
+        """Record this run; returns (base branch, findings new since its latest run) or (None, None)."""
+        if not self.metrics:
+            return None, None
+        try:
+            revision = MetricsStore.current_revision()
+            base_branch = self.metrics.find_base_branch(revision, ConfigReader.load().base_branches, "snyk")
+            new_findings = None
+            if base_branch:
+                new_findings = self.metrics.new_snyk_findings(revision[0], base_branch, results.vulnerabilities)
+                if new_findings:
+                    self.logger.warn(f"🆕 {len(new_findings)} vulnerabilities not present on {base_branch}.")
+            self.metrics.record_snyk(revision, results.vulnerabilities, duration)
+            return base_branch, new_findings
+        except Exception as e:
+            self.logger.warn(f"⚠️ Metrics history unavailable: {e}")
+            return None, None
+
+    def _apply_severity_policy(self, results: SnykResults):
+        """Non-interactive gate: fail on any critical/high severity not explicitly allowed."""
+        blocked = [severity for severity in ("critical", "high")
+                   if results.has_severity(severity) and severity not in self.allowed_severities]
+        if blocked:
+            self.logger.error(f"⛔ Disallowed vulnerability severities found: {', '.join(blocked)}. Aborting.")
+            raise Exception(f"Disallowed vulnerability severities found: {', '.join(blocked)}.")
+        self.logger.success("✅ Snyk test passed the configured severity policy.")
+
+    def _get_results(self):
+        fingerprint = self._fingerprint()
+        if fingerprint:
+            entry = self.cache.lookup(fingerprint)
+            if entry:
+                tested_at = datetime.fromtimestamp(entry["tested_at"]).isoformat(sep=' ', timespec='seconds')
+                self.logger.highlight(f"♻️ Dependency manifests unchanged since the Snyk test at {tested_at}. "
+                                      "Reusing its results.")
+                return SnykResults.from_vulnerabilities(entry["vulnerabilities"], entry.get("project_count", 1))
+
+        # Stream snyk's JSON output into the parser (even on non-zero exit codes)
+        results = SnykResults()
+        command = "snyk test --all-projects --json" if self.all_projects else "snyk test --json"
+        ShellUtils.stream_command(command, [results.feed], check=False, merge_stderr=False)
+        results.close()
+        # A project that errored (auth, network, CLI failure) has no vulnerabilities; never cache that as clean
+        if fingerprint and not results.errors:
+            self.cache.store(fingerprint, results.vulnerabilities, results.project_count)
+        return results
+
+    def _fingerprint(self):
+        if not self.cache:
+            return None
+        try:
+            return self.cache.fingerprint(self.all_projects)
+        except Exception as e:
+            self.logger.warn(f"⚠️ Could not fingerprint dependency manifests, "
+                             f"Snyk cache disabled for this run: {e}")
+            return None
+
+    def _generate_markdown_report(self, results: SnykResults, base_branch=None, new_findings=None):
         if not self.report_dir.exists():
             self.report_dir.mkdir(parents=True)
 
+        lines = ["# 🔐 Snyk Vulnerability Report\n\n"]
+        if not results.vulnerabilities:
+            lines.append("✅ No vulnerabilities found.\n")
+        else:
+            lines.append(f"**Projects tested:** {results.project_count} · "
+                         f"**Unique vulnerabilities:** {len(results.vulnerabilities)}\n\n")
+            new_keys = {(vuln.get("id"), vuln.get("packageName")) for vuln in new_findings or []}
+            if base_branch:
+                lines.append(f"**🆕 New since `{base_branch}`:** {len(new_keys)} (marked 🆕 below)\n\n")
+            for severity, vulnerabilities in results.grouped():
+                lines.append(f"## {severity.capitalize()} ({len(vulnerabilities)})\n\n")
+                # Table headers
+                lines.append("| Title | Severity | Package | Version | Fixed In | Maturity | More Info |\n")
+                lines.append("|-------|----------|---------|---------|----------|----------|-----------|\n")
+
+                # Table rows
+                for vuln in vulnerabilities:
+                    title = vuln.get("title", "Unknown")
+                    if (vuln.get("id"), vuln.get("packageName")) in new_keys:
+                        title = f"🆕 {title}"
+                    package = vuln.get("packageName", "N/A")
+                    version = vuln.get("version", "N/A")
+                    fixed_in = ", ".join(vuln.get("fixedIn", [])) or "Not specified"
+                    maturity = vuln.get("maturity", "N/A").capitalize()
+                    url = vuln.get("url", "N/A")
+
+                    lines.append(f"| {title} | {severity.capitalize()} | {package} | {version} | {fixed_in} | "
+                                 f"{maturity} | [Link]({url}) |\n")
+                lines.append("\n")
+
         with self.report_file.open("w") as f:
-            f.write("# 🔐 Snyk Vulnerability Report\n\n")
-            if not vulnerabilities:
-                f.write("✅ No vulnerabilities found.\n")
-                return
-
-            # Write table headers
-            f.write("| Title | Severity | Package | Version | Fixed In | Maturity | More Info |\n")
-            f.write("|-------|----------|---------|---------|----------|----------|-----------|\n")
-
-            # Fill in table rows
-            for vuln in vulnerabilities:
-                title = vuln.get("title", "Unknown")
-                severity = vuln.get("severity", "unknown").capitalize()
-                package = vuln.get("packageName", "N/A")
-                version = vuln.get("version", "N/A")
-                fixed_in = ", ".join(vuln.get("fixedIn", [])) or "Not specified"
-                maturity = vuln.get("maturity", "N/A").capitalize()
-                url = vuln.get("url", "N/A")
-
-                f.write(f"| {title} | {severity} | {package} | {version} | {fixed_in} | {maturity} | [Link]({url}) |\n")
\ No newline at end of file
+            f.write("".join(lines))
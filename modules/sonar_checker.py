@@ -1,21 +1,54 @@
 # git_assist/modules/sonar_checker.py
 
 import os
-import re
+import time
 from pathlib import Path
 from datetime import datetime
 from utils.logger import Logger
 from utils.shell_utils import ShellUtils
+from utils.prompt_utils import PromptUtils
+from utils.jacoco_parser import JacocoReport, COUNTER_TYPES
+from utils.maven_reactor import ReactorScope
+from utils.config_reader import ConfigReader
+from utils.sonar_api import SonarWebApi
+from utils.metrics_store import MetricsStore
+
+
+class SeverityCounter:
+    """Stream consumer counting issue severities in sonar-scanner's verbose output."""
+
+    def __init__(self):
+        self.critical = self.blocker = self.major = 0
+
+    def __call__(self, line: str):
+        if "severity=CRITICAL" in line:
+            self.critical += 1
+        elif "severity=BLOCKER" in line:
+            self.blocker += 1
+        elif "severity=MAJOR" in line:
+            self.major += 1
 
 
 class SonarChecker:
-    def __init__(self, logger: Logger, report_dir: str = "git-assist/sonar-report"):
+    def __init__(self, logger: Logger, report_dir: str = "git-assist/sonar-report", scan_timeout: float = None,
+                 echo_output: bool = False, scope: ReactorScope = None, min_coverage: float = None,
+                 metrics: MetricsStore = None):
         self.logger = logger
+        self.metrics = metrics
+        self.min_coverage = min_coverage
+        self.last_result = None
+        self.scope = scope
+        self.scan_timeout = scan_timeout
+        self.echo_output = echo_output
         self.report_dir = Path(report_dir)
         self.jacoco_xml_path = self.report_dir / "jacoco.xml"
         self.summary_report_path = self.report_dir / "sonar_summary.md"
         self.sonar_log_path = self.report_dir / "sonar_verbose.log"
-        self._prepare_report_directory()
+
+    @classmethod
+    def from_context(cls, context):
+        return cls(context.logger, report_dir="git-assist/sonar-reports", scope=context.scope,
+                   min_coverage=context.overrides.get("min_coverage"), metrics=context.metrics)
 
     def _prepare_report_directory(self):
         if not self.report_dir.exists():
@@ -24,35 +57,64 @@ class SonarChecker:
 
     def run(self):
         self.logger.highlight("🧪 Running SonarQube and Jacoco checks...")
+        started = time.monotonic()
 
         self._check_prerequisites()
+        self._prepare_report_directory()
 
-        # Run SonarQube and capture verbose output
-        sonar_output = ShellUtils.run_command(
-            "sonar-scanner -Dsonar.verbose=true -Dproject.settings=sonar-project.properties",
-            check=True,
-            capture_output=True
-        )
+        config = ConfigReader.load()
+        use_api = config.sonar_issue_source == "api"
 
-        # Save log
+        # Run SonarQube, streaming its output into the log and (in log mode) the issue counter.
+        # The verbose output is only needed when issues are counted from the log.
+        issue_counter = SeverityCounter()
+        verbose = "" if use_api else " -Dsonar.verbose=true"
         with self.sonar_log_path.open("w") as log_file:
-            log_file.write(sonar_output)
+            consumers = [log_file.write] if use_api else [log_file.write, issue_counter]
+            if self.echo_output:
+                consumers.append(ShellUtils.echo)
+            ShellUtils.stream_command(
+                f"sonar-scanner{verbose} -Dproject.settings=sonar-project.properties"
+                + self._scope_arguments(),
+                consumers,
+                check=True,
+                timeout=self.scan_timeout
+            )
 
         # Copy Jacoco report if it exists
         if os.path.exists("target/site/jacoco/jacoco.xml"):
             ShellUtils.run_command(f"cp target/site/jacoco/jacoco.xml {self.jacoco_xml_path}")
 
-        coverage = self._parse_coverage()
-        critical, blocker, major = self._parse_issues_from_log(sonar_output)
+        coverage_report = self._parse_coverage()
+        coverage = coverage_report.coverage()
+        quality_gate = None
+        if use_api:
+            self.logger.highlight("⏳ Waiting for the SonarQube server to process the analysis...")
+            api = SonarWebApi(token=os.environ.get("SONAR_TOKEN"), timeout=config.sonar_ce_timeout_seconds)
+            quality_gate, severities, dashboard_url = api.fetch_results()
+            critical, blocker, major = (severities.get(severity, 0) for severity in ("CRITICAL", "BLOCKER", "MAJOR"))
+            self.logger.highlight(f"🚦 Quality gate: {quality_gate} ({dashboard_url})")
+        else:
+            critical, blocker, major = issue_counter.critical, issue_counter.blocker, issue_counter.major
 
         self.logger.highlight(f"📊 Coverage: {coverage}%")
         self.logger.highlight(f"🔴 Critical: {critical}, 🛑 Blocker: {blocker}, ⚠️ Major: {major}")
 
-        self._write_markdown_summary(coverage, critical, blocker, major)
+        severities = {"CRITICAL": critical, "BLOCKER": blocker, "MAJOR": major}
+        history_lines, regressed = self._compare_with_history(coverage_report, severities,
+                                                              time.monotonic() - started)
+
+        self._write_markdown_summary(coverage_report, critical, blocker, major, quality_gate, history_lines)
+        self.last_result = {"coverage": coverage, "critical": critical, "blocker": blocker, "major": major,
+                            "quality_gate": quality_gate, "regressed": regressed}
 
-        if coverage < 80 or critical > 0 or blocker > 0 or major > 2:
+        min_coverage = self.min_coverage if self.min_coverage is not None else config.sonar_min_coverage
+        if ((regressed and config.fail_on_regression) or quality_gate == "ERROR" or coverage < min_coverage
+                or critical > config.sonar_max_critical or blocker > config.sonar_max_blocker
+                or major > config.sonar_max_major):
             self.logger.warn("⚠️ Validation failed: low coverage or critical issues found.")
-            user_input = input("Do you want to fix these issues before proceeding? (y/n): ")
+            user_input = PromptUtils.ask("Do you want to fix these issues before proceeding? (y/n): ",
+                                         "fix_sonar_issues")
             if user_input.lower() == "y":
                 self.logger.error("⛔ Aborting due to SonarQube/Jacoco issues.")
                 raise Exception("Validation failed.")
@@ -68,43 +130,114 @@ class SonarChecker:
             if not ShellUtils.run_command(f"which {tool}", capture_output=True):
                 raise EnvironmentError(f"❌ Required tool '{tool}' not found in PATH.")
 
+    def _scoped_modules(self):
+        if not self.scope or self.scope.resolve().full_build:
+            return None
+        return sorted(self.scope.modules)
+
+    def _scope_arguments(self):
+        modules = self._scoped_modules()
+        if not modules:
+            return ""
+        inclusions = ",".join(f"{module}/**" for module in modules)
+        return f' "-Dsonar.inclusions={inclusions}"'
+
+    def _find_jacoco_reports(self):
+        """Module-level jacoco.xml files of a (multi-module) build, or the copied report as fallback."""
+        modules = self._scoped_modules()
+        if modules:
+            module_reports = [path for path in (Path(module) / "target/site/jacoco/jacoco.xml" for module in modules)
+                              if path.is_file()]
+        else:
+            module_reports = sorted(Path(".").glob("**/target/site/jacoco/jacoco.xml"))
+        if module_reports:
+            return module_reports
+        return [self.jacoco_xml_path] if self.jacoco_xml_path.is_file() else []
+
     def _parse_coverage(self):
-        if not self.jacoco_xml_path.is_file():
+        reports = self._find_jacoco_reports()
+        if not reports:
             raise FileNotFoundError(f"❌ Jacoco report missing at {self.jacoco_xml_path}.")
 
-        with self.jacoco_xml_path.open("r") as file:
-            content = file.read()
-
-        coverage_match = re.search(r'<counter type="INSTRUCTION" missed="(\d+)" covered="(\d+)"', content)
-        if not coverage_match:
-            raise ValueError("❌ Unable to parse coverage from Jacoco report.")
-
-        missed, covered = map(int, coverage_match.groups())
-        total = missed + covered
-        return round((covered / total) * 100, 2) if total else 0
-
-    def _parse_issues_from_log(self, log_output: str):
-        # Initialize counters
-        critical = blocker = major = 0
-
-        for line in log_output.splitlines():
-            if "severity=CRITICAL" in line:
-                critical += 1
-            elif "severity=BLOCKER" in line:
-                blocker += 1
-            elif "severity=MAJOR" in line:
-                major += 1
-
-        return critical, blocker, major
-
-    def _write_markdown_summary(self, coverage, critical, blocker, major):
+        return JacocoReport.parse(*reports)
+
+    def _compare_with_history(self, coverage_report, severities, duration):
+        """Record this run and compare it with the base branch's latest run; returns (markdown lines, regressed)."""
+        if not self.metrics:
+            return [], False
+        modules = self._scoped_modules()
+        if modules:
+            # Coverage of the changed modules only; recording it as the repository's would skew the history
+            self.logger.highlight("🕰️ Coverage history not updated: only the changed modules were analysed.")
+            return [f"**🕰️ Coverage history:** not recorded, this run covers only {', '.join(modules)}.\n\n"], False
+        try:
+            revision = MetricsStore.current_revision()
+            repo, branch, _ = revision
+            lines, regressed = [], False
+            base_branch = self.metrics.find_base_branch(revision, ConfigReader.load().base_branches, "sonar")
+            if base_branch:
+                base_counters, base_severities = self.metrics.last_sonar(repo, base_branch)
+                lines.append(f"**📈 Compared with `{base_branch}`:**\n\n")
+                lines.append("| Metric | Base | Now | Delta |\n")
+                lines.append("|--------|------|-----|-------|\n")
+                for counter_type in COUNTER_TYPES:
+                    if counter_type in base_counters and counter_type in coverage_report.totals.counters:
+                        base_missed, base_covered = base_counters[counter_type]
+                        base_total = base_missed + base_covered
+                        base_percent = round(base_covered / base_total * 100, 2) if base_total else 0
+                        now_percent = coverage_report.totals.percent(counter_type)
+                        delta = round(now_percent - base_percent, 2)
+                        regressed = regressed or (counter_type == "INSTRUCTION" and delta < 0)
+                        lines.append(f"| {counter_type.capitalize()} coverage | {base_percent}% | {now_percent}% | "
+                                     f"{delta:+}% |\n")
+                for severity, count in severities.items():
+                    delta = count - base_severities.get(severity, 0)
+                    regressed = regressed or delta > 0
+                    lines.append(f"| {severity.capitalize()} issues | {base_severities.get(severity, 0)} | {count} | "
+                                 f"{delta:+} |\n")
+                lines.append("\n")
+                if regressed:
+                    self.logger.warn(f"📉 This run is worse than the latest run on {base_branch}.")
+
+            trend = self.metrics.coverage_trend(repo, branch)
+            if trend:
+                history = " → ".join(f"{percent}%" for _, _, percent in trend)
+                lines.append(f"**🕰️ Coverage history on `{branch}`:** "
+                             f"{history} → {coverage_report.coverage()}%\n\n")
+            self.metrics.record_sonar(revision, coverage_report.totals.counters, severities, duration)
+            return lines, regressed
+        except Exception as e:
+            self.logger.warn(f"⚠️ Metrics history unavailable: {e}")
+            return [], False
+
+    def _write_markdown_summary(self, coverage_report, critical, blocker, major, quality_gate=None,
+                                history_lines=()):
         with self.summary_report_path.open("w") as f:
             f.write("# 🧾 SonarQube & Jacoco Report Summary\n\n")
             f.write(f"**🕒 Generated on:** `{datetime.now().isoformat(sep=' ', timespec='seconds')}`\n\n")
-            f.write(f"**📊 Code Coverage:** `{coverage}%`\n\n")
+            if quality_gate:
+                f.write(f"**🚦 Quality Gate:** `{quality_gate}`\n\n")
+            f.write(f"**📊 Code Coverage:** `{coverage_report.coverage()}%`\n\n")
+            f.write("| Counter | Covered | Missed | Coverage |\n")
+            f.write("|---------|---------|--------|----------|\n")
+            for counter_type in COUNTER_TYPES:
+                if counter_type in coverage_report.totals.counters:
+                    missed, covered = coverage_report.totals.counters[counter_type]
+                    f.write(f"| {counter_type.capitalize()} | {covered} | {missed} | "
+                            f"{coverage_report.totals.percent(counter_type)}% |\n")
+            f.write("\n")
+            lowest_packages = coverage_report.lowest_packages()
+            if lowest_packages:
+                f.write("**📉 Lowest covered packages (instructions):**\n\n")
+                f.write("| Package | Coverage |\n")
+                f.write("|---------|----------|\n")
+                for package, counters in lowest_packages:
+                    f.write(f"| {package or '(default)'} | {counters.percent()}% |\n")
+                f.write("\n")
             f.write("| Severity | Count |\n")
             f.write("|----------|-------|\n")
             f.write(f"| 🔴 Critical | {critical} |\n")
             f.write(f"| 🛑 Blocker  | {blocker} |\n")
             f.write(f"| ⚠️ Major     | {major} |\n\n")
+            f.write("".join(history_lines))
             f.write(f"📄 **Verbose log:** [`sonar_verbose.log`]({self.sonar_log_path})\n")
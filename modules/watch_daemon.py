@@ -0,0 +1,134 @@
+# git_assist/modules/watch_daemon.py
+
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from utils.logger import Logger
+from utils.tree_watcher import TreeWatcher
+from utils.watch_results import WatchResults
+
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+class WatchDaemon:
+    """Re-run the checks in the background whenever the working tree settles after edits.
+
+    Each run is a low-priority headless `main.py` process (nice, and idle I/O
+    class where `ionice` exists) that is killed once a new burst of edits has
+    settled into a different tree.
+    Results are stored per working-tree hash in WatchResults, where the
+    interactive and headless gates pick them up.
+    """
+
+    def __init__(self, logger: Logger, checks, debounce: float = 2.0, nice: int = 10, poll_interval: float = 1.0,
+                 watch_dir: str = "git-assist/watch"):
+        self.logger = logger
+        self.checks = checks
+        self.debounce = debounce
+        self.nice = nice
+        self.poll_interval = poll_interval
+        self.watch_dir = Path(watch_dir)
+        self.results = WatchResults(str(self.watch_dir / "results.json"))
+        self._process = None
+        self._tree = None
+        self._started = None
+
+    @classmethod
+    def from_context(cls, context):
+        config = context.config
+        return cls(context.logger, config.watch_checks, debounce=config.watch_debounce_seconds,
+                   nice=config.watch_nice, poll_interval=config.watch_poll_interval_seconds)
+
+    def run(self):
+        watcher = TreeWatcher(poll_interval=self.poll_interval)
+        self.logger.highlight(f"👀 Watching {watcher.root} ({watcher.backend}); checks: {', '.join(self.checks)}. "
+                              "Press Ctrl+C to stop.")
+        dirty = True  # check the tree as it is right now
+        try:
+            while True:
+                changed = watcher.wait(timeout=self.debounce if dirty or self._process else None)
+                if changed:
+                    dirty = True
+                    continue
+                if dirty:
+                    # Quiet for `debounce` seconds: the burst of edits is over
+                    dirty = False
+                    self._start()
+                self._collect()
+        except KeyboardInterrupt:
+            self.logger.highlight("👋 Watch mode stopped.")
+        finally:
+            self._cancel()
+            watcher.close()
+
+    def _start(self):
+        try:
+            tree = WatchResults.tree_hash()
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.logger.warn(f"⚠️ Could not hash the working tree: {e}")
+            return
+        if tree == self._tree:
+            return  # only ignored files changed
+        self._cancel()
+        self._tree = tree
+        if self.results.get(tree) is not None:
+            return  # checked before, e.g. an edit that was undone
+
+        self.watch_dir.mkdir(parents=True, exist_ok=True)
+        command = [sys.executable, MAIN_SCRIPT, "--steps", ",".join(self.checks),
+                   "--summary-file", str(self.watch_dir / "summary.json")]
+        if shutil.which("ionice"):
+            command = ["ionice", "-c", "3"] + command
+        self.logger.highlight(f"🔄 Checking tree {tree[:12]} in the background...")
+        self._started = time.monotonic()
+        with (self.watch_dir / "console.log").open("w") as log:
+            self._process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                                             start_new_session=True, preexec_fn=lambda: os.nice(self.nice))
+
+    def _cancel(self):
+        if not self._process or self._process.poll() is not None:
+            self._process = None
+            return
+        self.logger.warn(f"⏹️ Files changed; cancelling the checks of tree {self._tree[:12]}.")
+        try:
+            os.killpg(self._process.pid, signal.SIGTERM)
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            os.killpg(self._process.pid, signal.SIGKILL)
+            self._process.wait()
+        except ProcessLookupError:
+            pass
+        self._process = None
+
+    def _collect(self):
+        if not self._process or self._process.poll() is None:
+            return
+        self._process = None
+        try:
+            with (self.watch_dir / "summary.json").open() as f:
+                steps = json.load(f)["steps"]
+        except (OSError, ValueError, KeyError):
+            self.logger.error(f"❌ Background checks produced no summary; see {self.watch_dir / 'console.log'}")
+            return
+        try:
+            tree = WatchResults.tree_hash()
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.logger.warn(f"⚠️ Could not hash the working tree: {e}")
+            tree = None  # e.g. index.lock held by a commit; don't store results that may not match
+        if tree != self._tree:
+            self._tree = None  # changed while the checks ran; the next settled tree is checked again
+            return
+
+        self.results.store(self._tree, {name: {key: step.get(key) for key in ("status", "duration", "details")}
+                                        for name, step in steps.items()})
+        outcome = ", ".join(f"{name} {step['status']}" for name, step in steps.items())
+        took = round(time.monotonic() - self._started, 1)
+        if all(step["status"] in ("success", "skipped") for step in steps.values()):
+            self.logger.success(f"✅ Tree {self._tree[:12]} checked in {took}s: {outcome}")
+        else:
+            self.logger.warn(f"⚠️ Tree {self._tree[:12]} checked in {took}s: {outcome}")
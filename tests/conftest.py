@@ -0,0 +1,49 @@
+# git_assist/tests/conftest.py
+
+import os
+import stat
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """Keep the developer's ~/.git-assist and GIT_ASSIST_* variables out of the tests."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    for variable in [name for name in os.environ if name.startswith("GIT_ASSIST_")]:
+        monkeypatch.delenv(variable)
+
+
+@pytest.fixture
+def fake_tool(tmp_path, monkeypatch):
+    """Install a Python script as an executable on PATH: fake_tool("snyk", "print('{}')")."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    def install(name, body):
+        path = bin_dir / name
+        path.write_text(f"#!{sys.executable}\n{textwrap.dedent(body)}")
+        path.chmod(path.stat().st_mode | stat.S_IXUSR)
+        return path
+
+    return install
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """An empty git repository as the working directory, with a committer identity set."""
+    for variable in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(variable, "Test")
+    for variable in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(variable, "test@example.com")
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    monkeypatch.chdir(repo)
+    return repo
@@ -0,0 +1,45 @@
+# git_assist/tests/test_branch_cleaner.py
+
+import subprocess
+
+import pytest
+
+from modules.branch_cleaner import BranchCleaner
+from utils.logger import Logger
+
+
+def git(*args):
+    return subprocess.run(["git"] + list(args), check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def remote(git_repo, tmp_path):
+    subprocess.run(["git", "init", "-q", "--bare", str(tmp_path / "remote.git")], check=True)
+    git("remote", "add", "origin", str(tmp_path / "remote.git"))
+    git("commit", "-q", "--allow-empty", "-m", "initial")
+    git("push", "-q", "origin", *[f"HEAD:refs/heads/{name}" for name in ("main", "a", "c", "d")])
+
+    def branches():
+        return sorted(line.split("refs/heads/")[1] for line in git("ls-remote", "--heads", "origin").splitlines())
+
+    return branches
+
+
+def test_missing_ref_does_not_block_the_rest_of_the_batch(remote):
+    cleaner = BranchCleaner(Logger(), bases=["main"])
+
+    results = cleaner._delete_batch(["a", "b", "c", "d"])
+
+    assert remote() == ["main"]
+    assert [(branch, ok) for branch, ok, _ in results] == [("a", True), ("b", False), ("c", True), ("d", True)]
+    assert results[1][2] == "remote ref does not exist"
+
+
+def test_protected_and_base_branches_are_never_candidates(remote):
+    git("push", "-q", "origin", "HEAD:refs/heads/release", "HEAD:refs/heads/feature")
+    git("fetch", "-q", "origin")
+    cleaner = BranchCleaner(Logger(), bases=["main"], protected=["release"])
+
+    merged = cleaner._find_merged_branches("main")
+
+    assert sorted(branch for branch, _, _ in merged) == ["a", "c", "d", "feature"]
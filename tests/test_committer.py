@@ -0,0 +1,25 @@
+# git_assist/tests/test_committer.py
+
+import subprocess
+
+from modules.committer import Committer
+from utils.logger import Logger
+from utils.prompt_utils import PromptUtils
+
+
+def test_stage_all_never_commits_tool_output(git_repo, monkeypatch):
+    monkeypatch.setenv("GIT_ASSIST_JIRA_TICKET_PREFIX", "APP-")
+    monkeypatch.setenv("GIT_ASSIST_WATCH_REUSE_RESULTS", "false")
+    (git_repo / "App.java").write_text("class App {}\n")
+    (git_repo / "git-assist" / "build-cache").mkdir(parents=True)
+    (git_repo / "git-assist" / "git-assist.log").write_text("log\n")
+    (git_repo / "git-assist" / "build-cache" / "cache.json").write_text("{}\n")
+    (git_repo / ".scannerwork").mkdir()
+    (git_repo / ".scannerwork" / "report-task.txt").write_text("ceTaskId=1\n")
+    monkeypatch.setattr(PromptUtils, "_answers", {"add_untracked": "y", "add_modified": "y", "check_directory": "y",
+                                                  "jira_ticket": "APP-1", "commit_message": "Add app"})
+
+    Committer(Logger()).stage_and_commit()
+
+    committed = subprocess.check_output(["git", "ls-tree", "-r", "--name-only", "HEAD"]).decode().split()
+    assert committed == ["App.java"]
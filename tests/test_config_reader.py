@@ -0,0 +1,77 @@
+# git_assist/tests/test_config_reader.py
+
+import os
+
+import pytest
+
+from utils.config_reader import ConfigReader
+
+
+@pytest.fixture
+def layers(tmp_path, monkeypatch):
+    """Write the user (~/.git-assist/config.txt) and repository (.git-assist.txt) layers."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    monkeypatch.chdir(repo)
+    user_config = tmp_path / "home" / ".git-assist" / "config.txt"
+    user_config.parent.mkdir(parents=True)
+
+    def write(user=None, repository=None):
+        for path, content in ((user_config, user), (repo / ".git-assist.txt", repository)):
+            if content is not None:
+                path.write_text(content)
+                # Bump the mtime explicitly; several writes can land within one timestamp tick
+                mtime = path.stat().st_mtime + 1
+                os.utime(path, (mtime, mtime))
+
+    return write
+
+
+def test_layers_override_each_other_in_order(layers, monkeypatch):
+    layers(user="SONAR_MAX_MAJOR=5\nJIRA_TICKET_PREFIX=USER-\n# comment\n\nSNYK_ALL_PROJECTS=true\n",
+           repository="SONAR_MAX_MAJOR=7\nBASE_BRANCHES=trunk, release\n")
+    monkeypatch.setenv("GIT_ASSIST_JIRA_TICKET_PREFIX", "ENV-")
+
+    config = ConfigReader.load()
+
+    assert config.sonar_max_major == 7
+    assert config.jira_ticket_prefix == "ENV-"
+    assert config.snyk_all_projects is True
+    assert config.base_branches == ["trunk", "release"]
+    assert config.maven_daemon is False  # built-in default, also in the tool's config.txt
+
+
+def test_config_is_reparsed_only_when_a_layer_changes(layers, monkeypatch):
+    layers(repository="SONAR_MAX_MAJOR=3\n")
+    first = ConfigReader.load()
+
+    assert ConfigReader.load() is first
+
+    layers(repository="SONAR_MAX_MAJOR=4\n")
+    assert ConfigReader.load().sonar_max_major == 4
+    monkeypatch.setenv("GIT_ASSIST_SONAR_MAX_MAJOR", "9")
+    assert ConfigReader.load().sonar_max_major == 9
+
+
+@pytest.mark.parametrize("line, message", [
+    ("SONAR_MAX_MAJOR=-1", "SONAR_MAX_MAJOR: must not be negative"),
+    ("SONAR_MIN_COVERAGE=120", "SONAR_MIN_COVERAGE: must be between 0 and 100"),
+    ("MAVEN_PREWARM_THREADS=0", "MAVEN_PREWARM_THREADS: must be positive"),
+    ("METRICS_HISTORY=maybe", "METRICS_HISTORY: expected true/false"),
+    ("SONAR_MAX_CRITICAL=many", "SONAR_MAX_CRITICAL"),
+])
+def test_invalid_values_name_the_key(layers, line, message):
+    layers(repository=line + "\n")
+
+    with pytest.raises(ValueError, match=message):
+        ConfigReader.load()
+
+
+def test_unknown_keys_are_reported_with_a_suggestion(layers, capsys):
+    layers(repository="SONAR_MAX_MAJRO=1\nCOMPLETELY_UNKNOWN=x\n")
+
+    ConfigReader.load()
+
+    errors = capsys.readouterr().err
+    assert "Unknown config key SONAR_MAX_MAJRO" in errors and "did you mean SONAR_MAX_MAJOR?" in errors
+    assert "Unknown config key COMPLETELY_UNKNOWN" in errors
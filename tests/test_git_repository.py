@@ -0,0 +1,47 @@
+# git_assist/tests/test_git_repository.py
+
+import os
+import subprocess
+
+from utils.git_repository import GitRepository
+
+
+def git(*args, date="2024-01-01T00:00:00"):
+    env = {"GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@example.com", "GIT_COMMITTER_NAME": "t",
+           "GIT_COMMITTER_EMAIL": "t@example.com", "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date}
+    return subprocess.run(["git"] + list(args), check=True, capture_output=True, text=True,
+                          env={**os.environ, **env}).stdout.strip()
+
+
+def commit(message, date="2024-01-01T00:00:00"):
+    git("commit", "-q", "--allow-empty", "-m", message, date=date)
+    return git("rev-parse", "HEAD")
+
+
+def test_ahead_behind_with_skewed_commit_dates(git_repo):
+    commit("base")
+    git("branch", "upstream")
+    for number in range(4):
+        # Local commits dated far in the past, older than the shared base
+        commit(f"local {number}", date="2001-01-01T00:00:00")
+    git("checkout", "-q", "upstream")
+    commit("upstream", date="2030-01-01T00:00:00")
+    git("checkout", "-q", "-")
+
+    repository = GitRepository.discover()
+
+    assert repository.ahead_behind("HEAD", "refs/heads/upstream") == (4, 1)
+    assert repository.ahead_behind("HEAD", "refs/heads/missing") is None
+
+
+def test_refs_are_read_from_loose_and_packed_refs(git_repo):
+    first = commit("first")
+    git("branch", "packed")
+    git("pack-refs", "--all")
+    second = commit("second")
+
+    repository = GitRepository.discover()
+
+    assert repository.head() == (git("symbolic-ref", "--short", "HEAD"), second)
+    assert repository.resolve("refs/heads/packed") == first
+    assert not repository.ref_exists("refs/heads/missing")
@@ -0,0 +1,56 @@
+# git_assist/tests/test_git_status.py
+
+import subprocess
+
+from utils.git_status import GitStatus
+
+SHA = "0" * 40
+
+
+def test_parse_porcelain_v2_entries():
+    output = "\0".join([
+        f"1 .M N... 100644 100644 100644 {SHA} {SHA} src/Main Class.java",
+        f"1 M. N... 100644 100644 100644 {SHA} {SHA} .gitignore",
+        f"1 AM N... 000000 100644 100644 {SHA} {SHA} pom.xml",
+        f"2 R. N... 100644 100644 100644 {SHA} {SHA} R100 docs/new name.md",
+        "docs/old name.md",
+        f"u UU N... 100644 100644 100644 100644 {SHA} {SHA} {SHA} conflict file.txt",
+        "? notes with spaces.txt",
+        "! target/app.jar",
+        "",
+    ])
+
+    status = GitStatus.parse(output)
+
+    assert status.untracked == ["notes with spaces.txt"]
+    assert status.modified == ["src/Main Class.java", "pom.xml", "conflict file.txt"]
+    assert status.staged == [".gitignore", "pom.xml", "docs/new name.md", "conflict file.txt"]
+    assert status.is_staged_modification(".gitignore")
+    assert not status.is_staged_modification("pom.xml")
+    assert "docs/old name.md" not in status.index_status
+
+
+def test_capture_and_ignore_rules(git_repo):
+    (git_repo / ".gitignore").write_text("*.log\n")
+    (git_repo / "old name.txt").write_text("content\n")
+    subprocess.run(["git", "add", "."], check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "initial"], check=True)
+    subprocess.run(["git", "mv", "old name.txt", "new name.txt"], check=True)
+    (git_repo / "sub dir").mkdir()
+    (git_repo / "sub dir" / "new file.java").write_text("class A {}\n")
+    (git_repo / "build.log").write_text("log\n")
+
+    status = GitStatus.capture()
+
+    assert status.staged == ["new name.txt"]
+    assert status.untracked == ["sub dir/new file.java"]
+    assert status.ignored(["build.log", "sub dir/new file.java", "other.log"]) == {"build.log", "other.log"}
+
+
+def test_capture_outside_a_repository_is_empty(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+
+    status = GitStatus.capture()
+
+    assert (status.untracked, status.modified, status.staged) == ([], [], [])
@@ -0,0 +1,83 @@
+# git_assist/tests/test_headless_runner.py
+
+import json
+import time
+
+import pytest
+
+from modules.headless_runner import EXIT_OK, HeadlessRunner
+from utils.logger import Logger
+from utils.step_registry import StepContext, StepRegistry
+
+
+class RecordingStep:
+    ran = []
+
+    @classmethod
+    def from_context(cls, context):
+        return cls()
+
+    def run(self):
+        RecordingStep.ran.append("snyk")
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    RecordingStep.ran = []
+    monkeypatch.setattr(StepRegistry, "_load_class", staticmethod(lambda target: RecordingStep))
+    context = StepContext(Logger())
+    monkeypatch.setattr(context, "skip_reasons", lambda: {"snyk": "no dependency manifest changed"})
+    return StepRegistry(context)
+
+
+def test_named_steps_run_even_when_unaffected(tmp_path, registry):
+    summary = tmp_path / "summary.json"
+
+    assert HeadlessRunner(Logger(), registry, {}, summary_path=str(summary)).run(["snyk"]) == EXIT_OK
+
+    assert RecordingStep.ran == ["snyk"]
+    assert json.loads(summary.read_text())["steps"]["snyk"]["skip_reason"] is None
+
+
+def test_skip_unaffected_is_opt_in(tmp_path, registry):
+    summary = tmp_path / "summary.json"
+    runner = HeadlessRunner(Logger(), registry, {}, summary_path=str(summary), skip_unaffected=True)
+
+    assert runner.run(["snyk"]) == EXIT_OK
+
+    assert RecordingStep.ran == []
+    assert json.loads(summary.read_text())["steps"]["snyk"]["skip_reason"] == "no dependency manifest changed"
+
+
+class PipelineStep:
+    events = []
+
+    @classmethod
+    def from_context(cls, context):
+        return cls()
+
+    def _record(self, name):
+        PipelineStep.events.append(f"{name} started")
+        time.sleep(0.05)
+        PipelineStep.events.append(f"{name} finished")
+
+    def force_run(self):
+        self._record("force-build")
+
+    def run(self):
+        self._record("sonar")
+
+    def stage_and_commit(self):
+        self._record("commit")
+
+
+def test_force_build_runs_before_the_steps_that_need_a_build(tmp_path, monkeypatch):
+    PipelineStep.events = []
+    monkeypatch.setattr(StepRegistry, "_load_class", staticmethod(lambda target: PipelineStep))
+    registry = StepRegistry(StepContext(Logger()))
+
+    runner = HeadlessRunner(Logger(), registry, {}, summary_path=str(tmp_path / "summary.json"))
+
+    assert runner.run(["force-build", "sonar", "commit"]) == EXIT_OK
+    assert PipelineStep.events == ["force-build started", "force-build finished", "sonar started",
+                                   "sonar finished", "commit started", "commit finished"]
@@ -0,0 +1,51 @@
+# git_assist/tests/test_impact_analyzer.py
+
+import subprocess
+
+from utils.impact_analyzer import ImpactAnalyzer
+
+
+def git(*args):
+    subprocess.run(["git"] + list(args), check=True, capture_output=True)
+
+
+def pushed_repository(git_repo):
+    (git_repo / "pom.xml").write_text("<project/>\n")
+    git("add", "pom.xml")
+    git("commit", "-q", "-m", "initial")
+    git("update-ref", "refs/remotes/origin/main", "HEAD")
+
+
+def test_tool_output_is_not_a_pending_change(git_repo):
+    pushed_repository(git_repo)
+    (git_repo / "git-assist" / "snyk-cache").mkdir(parents=True)
+    (git_repo / "git-assist" / "git-assist.log").write_text("log\n")
+    (git_repo / "git-assist" / "snyk-cache" / "snyk_results.json").write_text("{}\n")
+    (git_repo / ".scannerwork").mkdir()
+    (git_repo / ".scannerwork" / "report-task.txt").write_text("ceTaskId=1\n")
+
+    impact = ImpactAnalyzer().analyze()
+
+    assert impact.changed_paths == []
+    assert set(impact.skip_reasons) == {"build", "sonar", "snyk"}
+
+
+def test_only_documentation_changed_skips_build_and_sonar(git_repo):
+    pushed_repository(git_repo)
+    (git_repo / "README.md").write_text("# App\n")
+    (git_repo / "git-assist").mkdir()
+    (git_repo / "git-assist" / "git-assist.log").write_text("log\n")
+
+    impact = ImpactAnalyzer().analyze()
+
+    assert impact.changed_paths == ["README.md"]
+    assert impact.skip_reasons == {"snyk": "no dependency manifest changed",
+                                   "build": "only non-source files changed",
+                                   "sonar": "only non-source files changed"}
+
+
+def test_source_change_runs_build_and_sonar(git_repo):
+    pushed_repository(git_repo)
+    (git_repo / "App.java").write_text("class App {}\n")
+
+    assert ImpactAnalyzer().analyze().skip_reasons == {"snyk": "no dependency manifest changed"}
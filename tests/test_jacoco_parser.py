@@ -0,0 +1,80 @@
+# git_assist/tests/test_jacoco_parser.py
+
+import pytest
+
+from utils.jacoco_parser import JacocoReport
+
+CORE_REPORT = """<?xml version="1.0" encoding="UTF-8"?>
+<report name="core">
+  <sessioninfo id="s" start="0" dump="0"/>
+  <package name="com/example/core">
+    <class name="com/example/core/Service" sourcefilename="Service.java">
+      <method name="run" desc="()V" line="3">
+        <counter type="INSTRUCTION" missed="1" covered="9"/>
+      </method>
+      <counter type="INSTRUCTION" missed="10" covered="30"/>
+      <counter type="BRANCH" missed="2" covered="2"/>
+    </class>
+    <class name="com/example/core/Util" sourcefilename="Util.java">
+      <counter type="INSTRUCTION" missed="0" covered="20"/>
+    </class>
+    <sourcefile name="Service.java">
+      <line nr="3" mi="0" ci="3" mb="0" cb="0"/>
+      <counter type="INSTRUCTION" missed="10" covered="30"/>
+    </sourcefile>
+    <counter type="INSTRUCTION" missed="10" covered="50"/>
+    <counter type="BRANCH" missed="2" covered="2"/>
+  </package>
+  <counter type="INSTRUCTION" missed="10" covered="50"/>
+  <counter type="BRANCH" missed="2" covered="2"/>
+</report>
+"""
+
+WEB_REPORT = """<?xml version="1.0" encoding="UTF-8"?>
+<report name="web">
+  <group name="api">
+    <package name="com/example/web">
+      <class name="com/example/web/Controller">
+        <counter type="INSTRUCTION" missed="30" covered="10"/>
+      </class>
+      <counter type="INSTRUCTION" missed="30" covered="10"/>
+    </package>
+  </group>
+  <counter type="INSTRUCTION" missed="30" covered="10"/>
+</report>
+"""
+
+
+def write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content)
+    return path
+
+
+def test_report_totals_and_rollups(tmp_path):
+    report = JacocoReport.parse(write(tmp_path, "core.xml", CORE_REPORT))
+
+    assert report.totals.counters == {"INSTRUCTION": (10, 50), "BRANCH": (2, 2)}
+    assert report.coverage() == 83.33
+    assert report.coverage("BRANCH") == 50.0
+    assert report.coverage("LINE") == 0
+    assert report.packages["com.example.core"].counters["INSTRUCTION"] == (10, 50)
+    # Method and source file counters are not class rollups
+    assert report.classes["com.example.core.Service"].counters == {"INSTRUCTION": (10, 30), "BRANCH": (2, 2)}
+    assert report.classes["com.example.core.Util"].percent() == 100.0
+
+
+def test_module_reports_are_aggregated(tmp_path):
+    report = JacocoReport.parse(write(tmp_path, "core.xml", CORE_REPORT), write(tmp_path, "web.xml", WEB_REPORT))
+
+    assert report.totals.counters["INSTRUCTION"] == (40, 60)
+    assert report.coverage() == 60.0
+    assert [name for name, _ in report.lowest_packages(limit=1)] == ["com.example.web"]
+    assert set(report.classes) == {"com.example.core.Service", "com.example.core.Util", "com.example.web.Controller"}
+
+
+def test_report_without_totals_is_rejected(tmp_path):
+    path = write(tmp_path, "empty.xml", '<report name="empty"><package name="a"/></report>')
+
+    with pytest.raises(ValueError, match="Unable to parse coverage"):
+        JacocoReport.parse(path)
@@ -0,0 +1,30 @@
+# git_assist/tests/test_logger.py
+
+import os
+
+from utils.logger import Logger
+
+
+def test_rotation_is_checked_for_every_line_of_a_batch(tmp_path):
+    log_file = tmp_path / "git-assist.log"
+    logger = Logger(log_file=str(log_file), max_bytes=200, backup_count=3)
+
+    for number in range(60):
+        logger.log(f"message {number:02d}")  # 11 bytes each, all queued before the writer wakes up
+    logger.close()
+
+    files = [log_file] + [tmp_path / f"git-assist.log.{index}" for index in (1, 2, 3)]
+    assert all(os.path.getsize(path) < 200 + 11 for path in files)
+    assert log_file.read_text().splitlines()[-1] == "message 59"
+
+
+def test_messages_after_close_are_still_written(tmp_path):
+    log_file = tmp_path / "git-assist.log"
+    logger = Logger(log_file=str(log_file), json_log_file=str(tmp_path / "git-assist.jsonl"))
+    logger.log("before close")
+    logger.close()
+
+    logger.warn("after close")
+
+    assert log_file.read_text() == "before close\nafter close\n"
+    assert '"after close"' in (tmp_path / "git-assist.jsonl").read_text()
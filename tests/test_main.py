@@ -0,0 +1,20 @@
+# git_assist/tests/test_main.py
+
+import pytest
+
+from main import parse_args
+from modules.headless_runner import EXIT_USAGE
+
+
+def test_repos_without_steps_is_a_usage_error():
+    with pytest.raises(SystemExit) as exit_info:
+        parse_args(["--repos", "services/*"])
+
+    assert exit_info.value.code == EXIT_USAGE
+
+
+def test_headless_flags_default_to_the_safe_answers():
+    args = parse_args(["--steps", "commit,push,clean"])
+
+    assert not (args.delete_branches or args.allow_failed_watch_checks or args.skip_unaffected)
+    assert args.stage == "tracked"
@@ -0,0 +1,26 @@
+# git_assist/tests/test_maven_log.py
+
+from utils.maven_log import ReactorLog
+
+COLORED_OUTPUT = """\
+[\x1b[1;34mINFO\x1b[m] \x1b[1mReactor Summary for parent 1.0:\x1b[m
+[\x1b[1;34mINFO\x1b[m] core ............................................... \x1b[1;32mSUCCESS\x1b[m [  1.250 s]
+[\x1b[1;34mINFO\x1b[m] web ................................................ \x1b[1;31mFAILURE\x1b[m [01:02 min]
+[\x1b[1;34mINFO\x1b[m] app ................................................ \x1b[33mSKIPPED\x1b[m
+[\x1b[1;34mINFO\x1b[m] \x1b[1;31mBUILD FAILURE\x1b[m
+[\x1b[1;34mINFO\x1b[m] Total time:  01:04 min
+[\x1b[1;31mERROR\x1b[m] Failed to execute goal org.apache.maven.plugins:maven-surefire-plugin:3.2.5:test \
+(default-test) on project web: There are test failures.
+"""
+
+
+def test_colored_reactor_summary_is_parsed():
+    log = ReactorLog()
+    for line in COLORED_OUTPUT.splitlines(keepends=True):
+        log(line)
+
+    assert log.modules == {"core": ("SUCCESS", 1.25), "web": ("FAILURE", 62.0), "app": ("SKIPPED", None)}
+    assert log.result == "FAILURE"
+    assert log.total_time == 64.0
+    assert log.failures == {"web": "There are test failures."}
+    assert log.slowest_modules(1) == [("web", 62.0)]
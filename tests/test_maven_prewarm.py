@@ -0,0 +1,89 @@
+# git_assist/tests/test_maven_prewarm.py
+
+import json
+import time
+
+import pytest
+
+from modules.maven_build import MavenBuild
+from utils.logger import Logger
+from utils.maven_prewarm import DependencyPrewarm, MavenEnvironment
+
+FAKE_MVN = """
+import json, os, sys, time
+with open(os.environ["MVN_CALLS"], "a") as f:
+    f.write(json.dumps(sys.argv[1:]) + "\\n")
+if "dependency:go-offline" in sys.argv:
+    time.sleep(float(os.environ.get("PREWARM_SECONDS", "0")))
+    print("[INFO] BUILD SUCCESS")
+elif "-o" in sys.argv and os.environ.get("MISSING_OFFLINE"):
+    print("[ERROR] Failed to execute goal on project app: Cannot access mirror (file:///m2) in offline mode "
+          "and the artifact org.example:lib:jar:1.0 has not been downloaded from it before.")
+    sys.exit(1)
+else:
+    print("[INFO] BUILD SUCCESS")
+"""
+
+
+@pytest.fixture
+def maven(git_repo, tmp_path, fake_tool, monkeypatch):
+    (git_repo / "pom.xml").write_text("<project/>\n")
+    (tmp_path / "mirror").mkdir()
+    calls = tmp_path / "mvn-calls.jsonl"
+    monkeypatch.setenv("MVN_CALLS", str(calls))
+    fake_tool("mvn", FAKE_MVN)
+    environment = MavenEnvironment(mirror_url=(tmp_path / "mirror").as_uri(), use_daemon=False)
+    prewarm = DependencyPrewarm(Logger(), environment, threads=2)
+
+    def mvn_calls():
+        return [json.loads(line) for line in calls.read_text().splitlines()] if calls.exists() else []
+
+    return environment, prewarm, mvn_calls
+
+
+def test_mirror_settings_are_written_once(maven, tmp_path):
+    environment, _, _ = maven
+
+    assert (tmp_path / "mirror").as_uri() in environment.settings_file.read_text()
+    environment.settings_file.unlink()
+    assert "-s" in environment.command("install").split()
+    assert not environment.settings_file.exists()
+
+
+def test_build_runs_offline_after_a_successful_prewarm(maven):
+    environment, prewarm, mvn_calls = maven
+
+    MavenBuild(Logger(), environment=environment, prewarm=prewarm).run()
+
+    prewarm_call, build_call = mvn_calls()
+    assert "dependency:go-offline" in prewarm_call and "-Dmaven.artifact.threads=2" in prewarm_call
+    assert build_call[-2:] == ["clean", "install"] and "-o" in build_call
+    assert prewarm.is_fresh()
+
+
+def test_offline_miss_retries_online(maven, monkeypatch):
+    environment, prewarm, mvn_calls = maven
+    monkeypatch.setenv("MISSING_OFFLINE", "1")
+
+    MavenBuild(Logger(), environment=environment, prewarm=prewarm).run()
+
+    _, offline_call, online_call = mvn_calls()
+    assert "-o" in offline_call
+    assert "-o" not in online_call and online_call[-2:] == ["clean", "install"]
+    assert not prewarm.is_fresh()
+
+
+def test_stop_kills_a_running_prewarm(maven, monkeypatch):
+    _, prewarm, mvn_calls = maven
+    monkeypatch.setenv("PREWARM_SECONDS", "60")
+
+    prewarm.start()
+    deadline = time.monotonic() + 10
+    while not mvn_calls() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    started = time.monotonic()
+    prewarm.stop()
+
+    assert prewarm.wait() is False
+    assert time.monotonic() - started < 10
+    assert not prewarm.is_fresh()
@@ -0,0 +1,30 @@
+# git_assist/tests/test_metrics_store.py
+
+import os
+import subprocess
+
+import pytest
+
+from utils import metrics_store
+from utils.metrics_store import MetricsStore
+
+
+@pytest.fixture
+def committed_repo(git_repo):
+    subprocess.run(["git", "checkout", "-q", "-b", "feature"], check=True)
+    subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", "initial"], check=True)
+    commit = subprocess.check_output(["git", "rev-parse", "HEAD"]).decode().strip()
+    return os.path.realpath(git_repo), commit
+
+
+def test_current_revision_from_git_dir(committed_repo):
+    repo, commit = committed_repo
+
+    assert MetricsStore.current_revision() == (repo, "feature", commit)
+
+
+def test_current_revision_from_the_git_cli(committed_repo, monkeypatch):
+    repo, commit = committed_repo
+    monkeypatch.setattr(metrics_store.GitRepository, "discover", staticmethod(lambda path=".": None))
+
+    assert MetricsStore.current_revision() == (repo, "feature", commit)
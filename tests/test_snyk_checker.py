@@ -0,0 +1,72 @@
+# git_assist/tests/test_snyk_checker.py
+
+import json
+
+import pytest
+
+from modules.snyk_checker import SnykChecker
+from utils.logger import Logger
+from utils.snyk_cache import SnykCache
+
+SNYK = """
+import json, os, sys
+with open(os.environ["SNYK_CALLS"], "a") as calls:
+    calls.write(" ".join(sys.argv[1:]) + "\\n")
+sys.stdout.write(os.environ["SNYK_OUTPUT"])
+"""
+
+CLEAN_OUTPUT = {"projectName": "app", "vulnerabilities": [
+    {"id": "SNYK-1", "title": "Minor", "severity": "low", "packageName": "org.example:lib", "version": "1.0"}]}
+ERROR_OUTPUT = {"ok": False, "error": "Authentication failed. Please check the API token."}
+
+
+def make_checker(tmp_path, all_projects=False):
+    cache = SnykCache(str(tmp_path / "cache"))
+    return SnykChecker(Logger(), report_dir=str(tmp_path / "reports"), cache=cache, all_projects=all_projects)
+
+
+def snyk_calls(tmp_path):
+    calls = tmp_path / "calls.log"
+    return calls.read_text().splitlines() if calls.exists() else []
+
+
+def setup_snyk(fake_tool, monkeypatch, tmp_path, output):
+    fake_tool("snyk", SNYK)
+    monkeypatch.setenv("SNYK_CALLS", str(tmp_path / "calls.log"))
+    monkeypatch.setenv("SNYK_OUTPUT", json.dumps(output))
+
+
+def test_second_run_with_unchanged_manifests_is_a_cache_hit(git_repo, tmp_path, fake_tool, monkeypatch):
+    (git_repo / "pom.xml").write_text("<project/>")
+    setup_snyk(fake_tool, monkeypatch, tmp_path, CLEAN_OUTPUT)
+
+    make_checker(tmp_path).run()
+    checker = make_checker(tmp_path)
+    checker.run()
+
+    assert len(snyk_calls(tmp_path)) == 1
+    assert checker.last_result == {"low": 1}
+
+
+def test_failed_snyk_run_fails_and_is_not_cached(git_repo, tmp_path, fake_tool, monkeypatch):
+    (git_repo / "pom.xml").write_text("<project/>")
+    setup_snyk(fake_tool, monkeypatch, tmp_path, ERROR_OUTPUT)
+
+    for _ in range(2):
+        checker = make_checker(tmp_path)
+        with pytest.raises(Exception, match="Authentication failed"):
+            checker.run()
+
+    assert checker.last_result == {"errors": 1}
+    assert len(snyk_calls(tmp_path)) == 2
+    assert not (tmp_path / "cache" / "snyk_results.json").exists()
+
+
+def test_all_projects_mode_has_its_own_cache_entry(git_repo, tmp_path, fake_tool, monkeypatch):
+    (git_repo / "pom.xml").write_text("<project/>")
+    setup_snyk(fake_tool, monkeypatch, tmp_path, CLEAN_OUTPUT)
+
+    make_checker(tmp_path).run()
+    make_checker(tmp_path, all_projects=True).run()
+
+    assert snyk_calls(tmp_path) == ["test --json", "test --all-projects --json"]
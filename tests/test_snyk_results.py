@@ -0,0 +1,60 @@
+# git_assist/tests/test_snyk_results.py
+
+import json
+
+import pytest
+
+from utils.snyk_results import SnykResults
+
+TRICKY_TITLE = 'Prototype "pollution" in {merge} \\ path\\'
+ALL_PROJECTS = json.dumps([
+    {"projectName": "core", "vulnerabilities": [
+        {"id": "SNYK-1", "title": TRICKY_TITLE, "severity": "high", "packageName": "lodash"},
+        {"id": "SNYK-2", "title": "} unbalanced { braces", "severity": "low", "packageName": "lib"}]},
+    {"projectName": "web", "vulnerabilities": [
+        {"id": "SNYK-1", "title": TRICKY_TITLE, "severity": "high", "packageName": "lodash"},
+        {"id": "SNYK-3", "title": "Escaped \\\\\" quote", "severity": "critical", "packageName": "web-lib"}]},
+    {"ok": False, "error": "Could not detect package manager for {path}", "path": "tools"},
+], indent=2)
+
+
+def feed_in_chunks(output, size):
+    results = SnykResults()
+    for start in range(0, len(output), size):
+        results.feed(output[start:start + size])
+    return results.close()
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100000])
+def test_chunk_boundaries_do_not_change_the_result(size):
+    results = feed_in_chunks(ALL_PROJECTS, size)
+
+    assert results.project_count == 3
+    assert [vuln["id"] for vuln in results.vulnerabilities] == ["SNYK-1", "SNYK-2", "SNYK-3"]
+    assert results.vulnerabilities[0]["title"] == TRICKY_TITLE
+    assert results.errors == ["Could not detect package manager for {path}"]
+    assert {severity: len(vulns) for severity, vulns in results.by_severity.items()} == {
+        "high": 1, "low": 1, "critical": 1}
+
+
+def test_single_project_output_and_grouping():
+    output = json.dumps({"vulnerabilities": [
+        {"id": "B", "title": "b", "severity": "medium", "packageName": "z"},
+        {"id": "A", "title": "a", "severity": "medium", "packageName": "a"},
+        {"id": "C", "title": "c", "severity": "critical", "packageName": "c"},
+        {"id": "D", "title": "d", "severity": "unusual", "packageName": "d"}]})
+
+    results = feed_in_chunks(output, 5)
+
+    grouped = [(severity, [vuln["id"] for vuln in vulns]) for severity, vulns in results.grouped()]
+    assert grouped == [("critical", ["C"]), ("medium", ["A", "B"]), ("unusual", ["D"])]
+    assert results.has_severity("critical") and not results.has_severity("high")
+
+
+@pytest.mark.parametrize("output", ['{"vulnerabilities": [', '{"title": "unterminated', "", "Snyk CLI crashed"])
+def test_truncated_or_missing_json_is_an_error(output):
+    results = SnykResults()
+    results.feed(output)
+
+    with pytest.raises(json.JSONDecodeError):
+        results.close()
@@ -0,0 +1,119 @@
+# git_assist/tests/test_sonar_api.py
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from utils import sonar_api
+from utils.http_client import HttpError
+from utils.sonar_api import SonarWebApi
+
+
+class StubSonar(BaseHTTPRequestHandler):
+    """SonarQube Web API stub: the CE task is PENDING/IN_PROGRESS before it succeeds."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+    pending_polls = 2
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.server.requests.append((url.path, query, self.client_address))
+        if url.path == "/sonar/api/ce/task":
+            polls = sum(1 for path, _, _ in self.server.requests if path == url.path)
+            status = "SUCCESS" if polls > self.pending_polls else ("PENDING" if polls == 1 else "IN_PROGRESS")
+            body = {"task": {"id": query["id"], "status": status, "analysisId": "AN-1"}}
+        elif url.path == "/sonar/api/qualitygates/project_status":
+            body = {"projectStatus": {"status": "ERROR" if query["analysisId"] == "AN-1" else "NONE"}}
+        elif url.path == "/sonar/api/issues/search":
+            body = {"facets": [{"property": "severities",
+                                "values": [{"val": "CRITICAL", "count": 2}, {"val": "MAJOR", "count": 5}]}]}
+        else:
+            self.send_error(404)
+            return
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubSonar)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(sonar_api.time, "sleep", delays.append)
+    return delays
+
+
+def write_report_task(tmp_path, server_url):
+    path = tmp_path / "report-task.txt"
+    path.write_text(f"projectKey=org.example:app\nserverUrl={server_url}\nbranch=feature/x\n"
+                    f"dashboardUrl={server_url}/dashboard?id=app\nceTaskId=TASK-1\n"
+                    f"ceTaskUrl={server_url}/api/ce/task?id=TASK-1\n")
+    return path
+
+
+def test_fetch_results_polls_with_backoff_over_one_connection(tmp_path, server, sleeps):
+    server_url = f"http://127.0.0.1:{server.server_port}/sonar"
+    api = SonarWebApi(str(write_report_task(tmp_path, server_url)), token="secret", initial_delay=1, max_delay=3)
+
+    gate, severities, dashboard = api.fetch_results()
+
+    assert gate == "ERROR"
+    assert severities == {"CRITICAL": 2, "MAJOR": 5}
+    assert dashboard == f"{server_url}/dashboard?id=app"
+    assert sleeps == [1, 2]
+    paths = [path for path, _, _ in server.requests]
+    assert paths == ["/sonar/api/ce/task"] * 3 + ["/sonar/api/qualitygates/project_status",
+                                                  "/sonar/api/issues/search"]
+    assert server.requests[-1][1]["branch"] == "feature/x"
+    assert len({address for _, _, address in server.requests}) == 1  # keep-alive connection reused
+
+
+def test_report_task_parsing_keeps_values_containing_equals(tmp_path):
+    path = tmp_path / "report-task.txt"
+    path.write_text("ceTaskUrl=http://sonar/api/ce/task?id=AX=1\nprojectKey=app\n")
+
+    values = SonarWebApi(str(path)).read_report_task()
+
+    assert values == {"ceTaskUrl": "http://sonar/api/ce/task?id=AX=1", "projectKey": "app"}
+
+
+def test_backoff_is_capped_and_times_out(tmp_path, server, sleeps, monkeypatch):
+    monkeypatch.setattr(StubSonar, "pending_polls", 100)
+    clock = iter(range(0, 10000, 5))
+    monkeypatch.setattr(sonar_api.time, "monotonic", lambda: next(clock))
+    api = SonarWebApi(str(write_report_task(tmp_path, f"http://127.0.0.1:{server.server_port}/sonar")),
+                      timeout=60, initial_delay=1, max_delay=4)
+
+    with pytest.raises(TimeoutError):
+        api.fetch_results()
+
+    assert sleeps[:4] == [1, 2, 4, 4]
+
+
+def test_http_errors_carry_the_status(tmp_path, server):
+    api = SonarWebApi(str(write_report_task(tmp_path, f"http://127.0.0.1:{server.server_port}/missing")))
+
+    with pytest.raises(HttpError) as error:
+        api.fetch_results()
+
+    assert error.value.status == 404
@@ -0,0 +1,29 @@
+# git_assist/tests/test_sonar_checker.py
+
+import pytest
+
+from modules.sonar_checker import SonarChecker
+from utils.logger import Logger
+
+
+class Scope:
+    def __init__(self, modules):
+        self.modules = set(modules)
+        self.full_build = not modules
+
+    def resolve(self):
+        return self
+
+
+class Metrics:
+    def __getattr__(self, name):
+        pytest.fail(f"metrics history used for a scoped run: {name}")
+
+
+def test_scoped_coverage_is_not_recorded_as_the_repository_coverage():
+    checker = SonarChecker(Logger(), scope=Scope(["core", "web"]), metrics=Metrics())
+
+    lines, regressed = checker._compare_with_history(coverage_report=None, severities={}, duration=1.0)
+
+    assert regressed is False
+    assert lines == ["**🕰️ Coverage history:** not recorded, this run covers only core, web.\n\n"]
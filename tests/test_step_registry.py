@@ -0,0 +1,38 @@
+# git_assist/tests/test_step_registry.py
+
+import sys
+
+from utils.logger import Logger
+from utils.step_registry import StepContext, StepRegistry
+
+
+def install_plugin(tmp_path, monkeypatch):
+    """A distribution with one step whose module fails on import."""
+    (tmp_path / "exploding_step.py").write_text("raise ImportError('imported too early')\n")
+    dist_info = tmp_path / "exploding_step-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: exploding-step\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(
+        "[git_assist.steps]\nexplode = exploding_step:ExplodingStep\n\n"
+        "[git_assist.step_descriptions]\nexplode = 💥 Explode\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+
+def test_menu_descriptions_do_not_import_plugins(tmp_path, monkeypatch):
+    install_plugin(tmp_path, monkeypatch)
+
+    registry = StepRegistry(StepContext(Logger())).discover_plugins()
+
+    assert "explode" in registry.names()
+    assert registry.description("explode") == "💥 Explode"
+    assert "exploding_step" not in sys.modules
+
+
+def test_unusable_metrics_db_disables_history(tmp_path, monkeypatch, capsys):
+    (tmp_path / "not-a-dir").write_text("")
+    monkeypatch.setenv("GIT_ASSIST_METRICS_DB", str(tmp_path / "not-a-dir" / "metrics.db"))
+    context = StepContext(Logger())
+
+    assert context.metrics is None
+    assert context.metrics is None
+    assert capsys.readouterr().out.count("Metrics history unavailable") == 1
@@ -0,0 +1,105 @@
+# git_assist/tests/test_step_scheduler.py
+
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from utils.logger import Logger
+from utils.shell_utils import ShellUtils
+from utils.step_scheduler import StepScheduler
+
+
+def test_ctrl_c_kills_commands_streamed_by_workers():
+    def interrupt():
+        deadline = time.monotonic() + 10
+        while not ShellUtils._running and time.monotonic() < deadline:
+            time.sleep(0.02)
+        os.kill(os.getpid(), signal.SIGINT)
+
+    threading.Thread(target=interrupt, daemon=True).start()
+    scheduler = StepScheduler(Logger()).add_step("build", lambda: ShellUtils.stream_command("sleep 30", []))
+
+    started = time.monotonic()
+    with pytest.raises(KeyboardInterrupt):
+        scheduler.run()
+
+    assert time.monotonic() - started < 10
+    assert not ShellUtils._running
+
+
+def record(events, name, fail=False):
+    def step():
+        events.append(name)
+        if fail:
+            raise RuntimeError(f"{name} broke")
+    return step
+
+
+def test_steps_start_after_their_dependencies():
+    events = []
+    scheduler = (StepScheduler(Logger())
+                 .add_step("push", record(events, "push"), depends_on=["commit"])
+                 .add_step("commit", record(events, "commit"), depends_on=["build", "snyk"])
+                 .add_step("build", record(events, "build"))
+                 .add_step("snyk", record(events, "snyk")))
+
+    results = scheduler.run()
+
+    assert events.index("commit") > max(events.index("build"), events.index("snyk"))
+    assert events[-1] == "push"
+    assert set(results.values()) == {StepScheduler.SUCCESS}
+    assert set(scheduler.durations) == {"build", "snyk", "commit", "push"}
+
+
+def test_independent_steps_run_in_parallel():
+    barrier = threading.Barrier(2, timeout=5)
+    scheduler = StepScheduler(Logger()).add_step("build", barrier.wait).add_step("snyk", barrier.wait)
+
+    assert scheduler.run() == {"build": StepScheduler.SUCCESS, "snyk": StepScheduler.SUCCESS}
+
+
+def test_failure_cancels_dependents_transitively_but_not_unrelated_steps():
+    events = []
+    scheduler = (StepScheduler(Logger())
+                 .add_step("build", record(events, "build", fail=True))
+                 .add_step("sonar", record(events, "sonar"), depends_on=["build"])
+                 .add_step("commit", record(events, "commit"), depends_on=["sonar"])
+                 .add_step("snyk", record(events, "snyk")))
+
+    with pytest.raises(Exception, match="Step\\(s\\) failed: build"):
+        scheduler.run()
+
+    assert sorted(events) == ["build", "snyk"]
+    assert scheduler.results == {"build": "failed", "sonar": "cancelled", "commit": "cancelled", "snyk": "success"}
+    assert str(scheduler.errors["build"]) == "build broke"
+
+
+def test_skipped_steps_do_not_run_but_satisfy_dependents():
+    events = []
+    scheduler = (StepScheduler(Logger())
+                 .add_step("build", record(events, "build"), skip_reason="only non-source files changed")
+                 .add_step("sonar", record(events, "sonar"), depends_on=["build"]))
+
+    assert scheduler.run() == {"build": "skipped", "sonar": "success"}
+    assert events == ["sonar"]
+    assert scheduler.skipped == {"build": "only non-source files changed"}
+
+
+def test_invalid_graphs_are_rejected_before_anything_runs():
+    events = []
+    cycle = (StepScheduler(Logger())
+             .add_step("a", record(events, "a"), depends_on=["b"])
+             .add_step("b", record(events, "b"), depends_on=["a"]))
+    with pytest.raises(ValueError, match="cycle"):
+        cycle.run()
+
+    unknown = StepScheduler(Logger()).add_step("sonar", record(events, "sonar"), depends_on=["build"])
+    with pytest.raises(ValueError, match="unknown step 'build'"):
+        unknown.run()
+
+    with pytest.raises(ValueError, match="already registered"):
+        StepScheduler(Logger()).add_step("build", print).add_step("build", print)
+    assert events == []
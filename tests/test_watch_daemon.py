@@ -0,0 +1,29 @@
+# git_assist/tests/test_watch_daemon.py
+
+import json
+import subprocess
+
+from modules.watch_daemon import WatchDaemon
+from utils.logger import Logger
+from utils.watch_results import WatchResults
+
+
+class FinishedProcess:
+    def poll(self):
+        return 0
+
+
+def test_git_failure_while_collecting_keeps_watching(tmp_path, monkeypatch):
+    daemon = WatchDaemon(Logger(), ["build"], watch_dir=str(tmp_path))
+    (tmp_path / "summary.json").write_text(json.dumps({"steps": {"build": {"status": "success"}}}))
+    daemon._process, daemon._tree, daemon._started = FinishedProcess(), "abc123", 0
+
+    def locked_index():
+        raise subprocess.CalledProcessError(128, "git add", "fatal: Unable to create '.git/index.lock'")
+
+    monkeypatch.setattr(WatchResults, "tree_hash", staticmethod(locked_index))
+
+    daemon._collect()
+
+    assert daemon._tree is None
+    assert not daemon.results.exists()
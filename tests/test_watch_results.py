@@ -0,0 +1,33 @@
+# git_assist/tests/test_watch_results.py
+
+import subprocess
+
+from utils.watch_results import WatchResults
+
+
+def loose_objects(repo):
+    return {path for path in (repo / ".git" / "objects").glob("??/*")}
+
+
+def test_tree_hash_covers_untracked_files_without_touching_the_index(git_repo):
+    (git_repo / "App.java").write_text("class App {}\n")
+    (git_repo / "git-assist").mkdir()
+    (git_repo / "git-assist" / "summary.json").write_text("{}\n")
+
+    tree = WatchResults.tree_hash()
+
+    listing = subprocess.check_output(["git", "ls-tree", "--name-only", tree]).decode().split()
+    assert listing == ["App.java"]
+    assert subprocess.check_output(["git", "ls-files"]).decode() == ""
+
+
+def test_unchanged_files_are_not_hashed_again(git_repo):
+    (git_repo / "App.java").write_text("class App {}\n")
+    first = WatchResults.tree_hash()
+    objects = loose_objects(git_repo)
+
+    assert WatchResults.tree_hash() == first
+    assert loose_objects(git_repo) == objects
+
+    (git_repo / "App.java").write_text("class App { int x; }\n")
+    assert WatchResults.tree_hash() != first
@@ -0,0 +1,80 @@
+# git_assist/utils/build_cache.py
+
+import hashlib
+import json
+import subprocess
+import time
+from pathlib import Path
+
+BUILD_INPUT_PATHSPECS = ["pom.xml", ":(glob)**/pom.xml", ":(glob)**/src/**", ".mvn"]
+
+
+class BuildCache:
+    """Remembers successful builds keyed by a fingerprint of the build inputs.
+
+    The fingerprint covers the index state and working-tree changes of every
+    pom.xml and src/ file, untracked sources, and the Maven/JDK version.
+    Entries are evicted when older than `max_age_days` or beyond `max_entries`.
+    """
+
+    def __init__(self, cache_dir: str = "git-assist/build-cache", max_entries: int = 20, max_age_days: int = 14):
+        self.cache_file = Path(cache_dir) / "builds.json"
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 24 * 3600
+
+    def compute_key(self, tool_version_command: str = "mvn -v"):
+        digest = hashlib.sha256()
+        for command in (
+            ["git", "ls-files", "-s", "--"] + BUILD_INPUT_PATHSPECS,
+            ["git", "diff", "--binary", "--"] + BUILD_INPUT_PATHSPECS,
+        ):
+            digest.update(subprocess.check_output(command))
+
+        untracked = subprocess.check_output(
+            ["git", "ls-files", "--others", "--exclude-standard", "--"] + BUILD_INPUT_PATHSPECS).decode()
+        if untracked.strip():
+            digest.update(untracked.encode())
+            digest.update(subprocess.check_output(["git", "hash-object", "--stdin-paths"], input=untracked.encode()))
+
+        version = subprocess.run(tool_version_command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        digest.update(version.stdout)
+        return digest.hexdigest()
+
+    def _load(self):
+        if not self.cache_file.is_file():
+            return {}
+        try:
+            with self.cache_file.open("r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        entries = {key: entry for key, entry in entries.items()
+                   if now - entry["last_used"] <= self.max_age_seconds}
+        newest = sorted(entries.items(), key=lambda item: item[1]["last_used"], reverse=True)[:self.max_entries]
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with tmp_file.open("w") as f:
+            json.dump(dict(newest), f, indent=2)
+        tmp_file.replace(self.cache_file)
+
+    def lookup(self, key):
+        entries = self._load()
+        entry = entries.get(key)
+        if not entry or time.time() - entry["last_used"] > self.max_age_seconds:
+            return None
+        entry["last_used"] = time.time()
+        self._save(entries)
+        return entry
+
+    def store(self, key, duration: float):
+        entries = self._load()
+        now = time.time()
+        entries[key] = {"built_at": now, "last_used": now, "duration": round(duration, 1)}
+        self._save(entries)
+
+    def clear(self):
+        if self.cache_file.is_file():
+            self.cache_file.unlink()
@@ -1,18 +1,161 @@
+import difflib
 import os
+import sys
+import threading
+
+
+def _parse_bool(value):
+    lowered = value.strip().lower()
+    if lowered in ("true", "yes", "1", "on"):
+        return True
+    if lowered in ("false", "no", "0", "off"):
+        return False
+    raise ValueError(f"expected true/false, got '{value}'")
+
+
+def _parse_list(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _non_negative(value):
+    if value < 0:
+        raise ValueError(f"must not be negative, got {value}")
+    return value
+
+
+def _positive(value):
+    if value <= 0:
+        raise ValueError(f"must be positive, got {value}")
+    return value
+
+
+def _percentage(value):
+    if not 0 <= value <= 100:
+        raise ValueError(f"must be between 0 and 100, got {value}")
+    return value
+
+
+def _issue_source(value):
+    if value not in ("log", "api"):
+        raise ValueError(f"expected 'log' or 'api', got '{value}'")
+    return value
+
+
+# key -> (parser, default, validator)
+SCHEMA = {
+    "JIRA_TICKET_PREFIX": (str, "FINDATA-", None),
+    "INCREMENTAL_BUILD": (_parse_bool, False, None),
+    "SNYK_CACHE_TTL_HOURS": (float, 24.0, _non_negative),
+    "SNYK_ALL_PROJECTS": (_parse_bool, False, None),
+    "BRANCH_CLEANER_DRY_RUN": (_parse_bool, False, None),
+    "BRANCH_CLEANER_MIN_AGE_DAYS": (int, 0, _non_negative),
+    "BRANCH_CLEANER_AUTHORS": (_parse_list, [], None),
+    "SONAR_MIN_COVERAGE": (float, 80.0, _percentage),
+    "SONAR_MAX_CRITICAL": (int, 0, _non_negative),
+    "SONAR_MAX_BLOCKER": (int, 0, _non_negative),
+    "SONAR_MAX_MAJOR": (int, 2, _non_negative),
+    "SONAR_ISSUE_SOURCE": (str, "log", _issue_source),
+    "SONAR_CE_TIMEOUT_SECONDS": (float, 300.0, _non_negative),
+    "METRICS_HISTORY": (_parse_bool, True, None),
+    "METRICS_DB": (str, "~/.git-assist/metrics.db", None),
+    "FAIL_ON_REGRESSION": (_parse_bool, False, None),
+    "IMPACT_ANALYSIS": (_parse_bool, True, None),
+    "IMPACT_MANIFEST_PATTERNS": (_parse_list, ["pom.xml", ".snyk"], None),
+    "IMPACT_IGNORE_PATTERNS": (_parse_list, ["*.md", "docs/*", ".gitignore", "src/test/resources/*", "LICENSE*",
+                                             ".github/*"], None),
+    "WATCH_CHECKS": (_parse_list, ["build", "sonar", "snyk"], None),
+    "WATCH_DEBOUNCE_SECONDS": (float, 2.0, _non_negative),
+    "WATCH_POLL_INTERVAL_SECONDS": (float, 1.0, _non_negative),
+    "WATCH_NICE": (int, 10, _non_negative),
+    "WATCH_REUSE_RESULTS": (_parse_bool, True, None),
+    "MAVEN_PREWARM": (_parse_bool, False, None),
+    "MAVEN_PREWARM_THREADS": (int, 8, _positive),
+    "MAVEN_LOCAL_REPOSITORY": (str, "", None),
+    "MAVEN_MIRROR_URL": (str, "", None),
+    "MAVEN_DAEMON": (_parse_bool, False, None),
+    "PROTECTED_BRANCHES": (_parse_list, ["main", "master", "develop", "dev"], None),
+    "BASE_BRANCHES": (_parse_list, ["develop", "dev", "main", "master"], None),
+}
+
+ENV_PREFIX = "GIT_ASSIST_"
+
+
+class Config:
+    """Typed, validated settings; each SCHEMA key is exposed as a lowercase attribute."""
+
+    def __init__(self, raw_values):
+        self.raw_values = raw_values
+        for key, (parser, default, validator) in SCHEMA.items():
+            value = default
+            if key in raw_values:
+                try:
+                    value = parser(raw_values[key])
+                    if validator:
+                        value = validator(value)
+                except ValueError as e:
+                    raise ValueError(f"❌ Invalid value for {key}: {e}") from None
+            setattr(self, key.lower(), value)
+
 
 class ConfigReader:
-    @staticmethod
-    def get_value(key, default=None):
-        config_path = os.path.join(os.path.dirname(__file__), "..", "config.txt")
-        config_path = os.path.abspath(config_path)
+    """Parses the configuration layers once and reloads only when one of the files changes.
 
-        if not os.path.isfile(config_path):
-            print(f"Config file not found at {config_path}. Using default value.")
-            return default
+    Layers, lowest to highest precedence: built-in defaults, the tool's config.txt,
+    the user's ~/.git-assist/config.txt, the repository's .git-assist.txt, and
+    GIT_ASSIST_<KEY> environment variables.
+    """
 
-        with open(config_path, "r") as file:
+    _lock = threading.Lock()
+    _cache_key = None
+    _config = None
+
+    @staticmethod
+    def layer_paths():
+        tool_config = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "config.txt"))
+        user_config = os.path.join(os.path.expanduser("~"), ".git-assist", "config.txt")
+        repo_config = os.path.abspath(".git-assist.txt")
+        return [tool_config, user_config, repo_config]
+
+    @staticmethod
+    def _parse_file(path):
+        values = {}
+        with open(path, "r") as file:
             for line in file:
-                if line.strip().startswith(f"{key}="):
-                    return line.strip().split("=", 1)[1]
-        print(f"Key '{key}' not found in config file. Using default value.")
-        return default
\ No newline at end of file
+                line = line.strip()
+                if line and not line.startswith("#") and "=" in line:
+                    key, value = line.split("=", 1)
+                    values[key.strip()] = value.strip()
+        return values
+
+    @staticmethod
+    def load():
+        paths = ConfigReader.layer_paths()
+        mtimes = tuple((path, os.path.getmtime(path)) for path in paths if os.path.isfile(path))
+        env_values = {key[len(ENV_PREFIX):]: value for key, value in os.environ.items() if key.startswith(ENV_PREFIX)}
+        cache_key = (mtimes, tuple(sorted(env_values.items())))
+
+        with ConfigReader._lock:
+            if ConfigReader._config is None or cache_key != ConfigReader._cache_key:
+                raw_values = {}
+                for path, _ in mtimes:
+                    values = ConfigReader._parse_file(path)
+                    ConfigReader._warn_unknown_keys(values, path)
+                    raw_values.update(values)
+                ConfigReader._warn_unknown_keys(env_values, f"{ENV_PREFIX}* environment variables")
+                raw_values.update(env_values)
+                ConfigReader._config = Config(raw_values)
+                ConfigReader._cache_key = cache_key
+            return ConfigReader._config
+
+    @staticmethod
+    def _warn_unknown_keys(values, source):
+        """Misspelled keys would otherwise be ignored silently and leave the default in effect."""
+        for key in values:
+            if key not in SCHEMA:
+                suggestion = difflib.get_close_matches(key, SCHEMA, n=1)
+                hint = f" (did you mean {suggestion[0]}?)" if suggestion else ""
+                print(f"⚠️ Unknown config key {key} in {source}{hint}", file=sys.stderr)
+
+    @staticmethod
+    def get_value(key, default=None):
+        return ConfigReader.load().raw_values.get(key, default)
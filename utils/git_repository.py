@@ -0,0 +1,152 @@
+# git_assist/utils/git_repository.py
+
+import subprocess
+import threading
+from pathlib import Path
+from utils.profiler import Profiler
+
+class GitReadError(Exception):
+    """Raised when a ref cannot be answered from `.git` directly."""
+
+
+class GitRepository:
+    """Read-only access to refs straight from `.git`, without starting git processes.
+
+    Covers HEAD, loose refs and `packed-refs` (cached by mtime); reftable and
+    SHA-256 repositories fall back to the git CLI. History questions such as
+    ahead/behind counts are always answered by git itself.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, git_dir: Path, common_dir: Path, work_tree: Path):
+        self.git_dir = git_dir
+        self.common_dir = common_dir
+        self.toplevel = str(work_tree)
+        self.native = self._supports_native_reads()
+        self._lock = threading.Lock()
+        self._packed_refs = (None, {})
+
+    @classmethod
+    def discover(cls, path="."):
+        """Repository containing `path` (one shared instance per repository); None outside a repository."""
+        directory = Path(path).resolve()
+        for candidate in [directory] + list(directory.parents):
+            dot_git = candidate / ".git"
+            if dot_git.is_dir():
+                git_dir = dot_git
+            elif dot_git.is_file():
+                # Worktrees and submodules use a "gitdir: <path>" file
+                content = dot_git.read_text().strip()
+                if not content.startswith("gitdir:"):
+                    continue
+                git_dir = (candidate / content[len("gitdir:"):].strip()).resolve()
+            else:
+                continue
+            common_dir = git_dir
+            if (git_dir / "commondir").is_file():
+                common_dir = (git_dir / (git_dir / "commondir").read_text().strip()).resolve()
+            with cls._instances_lock:
+                if git_dir not in cls._instances:
+                    cls._instances[git_dir] = cls(git_dir, common_dir, candidate)
+                return cls._instances[git_dir]
+        return None
+
+    def _supports_native_reads(self):
+        config = self.common_dir / "config"
+        try:
+            text = config.read_text().lower()
+        except OSError:
+            return False
+        return "objectformat" not in text and "refstorage" not in text and not (self.common_dir / "reftable").exists()
+
+    @staticmethod
+    def _git(*args):
+        with Profiler.span(f"git {args[0]}", "git") as span:
+            result = subprocess.run(["git"] + list(args), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            span["exit_code"] = result.returncode
+        if result.returncode != 0:
+            return None
+        return result.stdout.decode().strip()
+
+    # Refs
+
+    def _ref_dir(self, refname):
+        # Per-worktree refs (HEAD, refs/bisect, ...) live in the worktree's own git dir
+        shared = refname.startswith("refs/") and not refname.startswith(
+            ("refs/bisect/", "refs/worktree/", "refs/rewritten/"))
+        return self.common_dir if shared else self.git_dir
+
+    def _read_packed_refs(self):
+        path = self.common_dir / "packed-refs"
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        with self._lock:
+            cached_mtime, refs = self._packed_refs
+            if cached_mtime == mtime:
+                return refs
+            refs = {}
+            with path.open() as f:
+                for line in f:
+                    if line.startswith(("#", "^")):
+                        continue  # header and peeled tag lines
+                    sha, _, name = line.rstrip("\n").partition(" ")
+                    refs[name] = sha
+            self._packed_refs = (mtime, refs)
+            return refs
+
+    def _read_ref(self, refname, depth=0):
+        """(symbolic target or None, sha or None) for a full ref name such as HEAD or refs/remotes/origin/main."""
+        if depth > 5:
+            raise GitReadError(f"Symbolic ref loop at {refname}")
+        try:
+            content = (self._ref_dir(refname) / refname).read_text().strip()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None, self._read_packed_refs().get(refname)
+        if content.startswith("ref:"):
+            target = content[len("ref:"):].strip()
+            return target, self._read_ref(target, depth + 1)[1]
+        return None, content
+
+    def head(self):
+        """(branch name or None when detached, commit sha or None before the first commit)."""
+        if not self.native:
+            return (self._git("symbolic-ref", "--quiet", "--short", "HEAD"),
+                    self._git("rev-parse", "--verify", "--quiet", "HEAD"))
+        target, sha = self._read_ref("HEAD")
+        if target and target.startswith("refs/heads/"):
+            target = target[len("refs/heads/"):]
+        return target, sha
+
+    def current_branch(self):
+        """Like `git rev-parse --abbrev-ref HEAD`: the branch name, or "HEAD" when detached."""
+        branch, _ = self.head()
+        return branch or "HEAD"
+
+    def resolve(self, refname):
+        """Commit sha a full ref name points to, or None if it does not exist."""
+        if not self.native:
+            return self._git("rev-parse", "--verify", "--quiet", f"{refname}^{{commit}}")
+        return self._read_ref(refname)[1]
+
+    def ref_exists(self, refname):
+        return self.resolve(refname) is not None
+
+    # History
+
+    def ahead_behind(self, local_ref, upstream_ref):
+        """(commits only in local_ref, commits only in upstream_ref) from `git rev-list --left-right --count`.
+
+        Returns None if either ref does not exist.
+        """
+        local, upstream = self.resolve(local_ref), self.resolve(upstream_ref)
+        if not local or not upstream:
+            return None
+        output = self._git("rev-list", "--left-right", "--count", f"{local}...{upstream}")
+        if output is None:
+            return None
+        ahead, behind = output.split()
+        return int(ahead), int(behind)
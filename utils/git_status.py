@@ -0,0 +1,84 @@
+# git_assist/utils/git_status.py
+
+import subprocess
+from utils.profiler import Profiler
+
+# Written by git-assist and the tools it runs (logs, caches, summaries, scanner work dirs); never a user change
+TOOL_OUTPUT_DIRS = ("git-assist", ".scannerwork")
+
+
+class GitStatus:
+    """In-memory index of the working tree built from a single `git status` call.
+
+    Ignore checks are answered in bulk through `git check-ignore --stdin` and cached.
+    """
+
+    def __init__(self, untracked=None, modified=None, staged=None, index_status=None):
+        self.untracked = untracked or []
+        self.modified = modified or []
+        self.staged = staged or []
+        self.index_status = index_status or {}
+        self._ignored = {}
+
+    @classmethod
+    def capture(cls):
+        with Profiler.span("git status --porcelain=v2", "git") as span:
+            try:
+                output = subprocess.check_output(
+                    ["git", "status", "--porcelain=v2", "-z", "--untracked-files=all"])
+            except subprocess.CalledProcessError:
+                return cls()
+            span["output_bytes"] = len(output)
+        return cls.parse(output.decode())
+
+    @classmethod
+    def parse(cls, output: str):
+        untracked, modified, staged, index_status = [], [], [], {}
+        entries = iter(output.split("\0"))
+        for entry in entries:
+            if not entry:
+                continue
+            kind = entry[0]
+            if kind == "?":
+                untracked.append(entry[2:])
+                continue
+            if kind not in "12u":
+                continue
+            # Ordinary (1), renamed/copied (2) and unmerged (u) entries differ in field count
+            field_count = {"1": 9, "2": 10, "u": 11}[kind]
+            fields = entry.split(" ", field_count - 1)
+            xy, path = fields[1], fields[-1]
+            if kind == "2":
+                next(entries, None)  # original path of the rename/copy
+            if kind == "u":
+                modified.append(path)
+                staged.append(path)
+                continue
+            index_status[path] = xy[0]
+            if xy[0] != ".":
+                staged.append(path)
+            if xy[1] != ".":
+                modified.append(path)
+        return cls(untracked, modified, staged, index_status)
+
+    @staticmethod
+    def is_tool_output(path: str) -> bool:
+        return path.split("/", 1)[0] in TOOL_OUTPUT_DIRS
+
+    def is_staged_modification(self, path: str) -> bool:
+        return self.index_status.get(path) == "M"
+
+    def ignored(self, paths) -> set:
+        """Return the subset of paths matched by the ignore rules, using one git call for unknown paths."""
+        unknown = [path for path in dict.fromkeys(paths) if path not in self._ignored]
+        if unknown:
+            with Profiler.span("git check-ignore --stdin", "git", paths=len(unknown)) as span:
+                result = subprocess.run(["git", "check-ignore", "--stdin", "-z"],
+                                        input="\0".join(unknown).encode() + b"\0",
+                                        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+                span["exit_code"] = result.returncode
+            # Exit code 1 just means none of the paths are ignored
+            matched = set(result.stdout.decode().split("\0")) if result.returncode == 0 else set()
+            for path in unknown:
+                self._ignored[path] = path in matched
+        return {path for path in paths if self._ignored[path]}
@@ -0,0 +1,82 @@
+# git_assist/utils/http_client.py
+
+import base64
+import http.client
+import json
+import queue
+import ssl
+from urllib.parse import urlencode, urlsplit
+
+
+class HttpError(Exception):
+    def __init__(self, status, reason, body):
+        super().__init__(f"HTTP {status} {reason}: {body[:200]}")
+        self.status = status
+        self.body = body
+
+
+class HttpClient:
+    """Minimal JSON client keeping a small pool of keep-alive connections to one server."""
+
+    def __init__(self, base_url: str, token: str = None, pool_size: int = 2, timeout: float = 30):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.headers = {"Accept": "application/json", "Connection": "keep-alive"}
+        if token:
+            # SonarQube tokens are sent as the basic-auth user name with an empty password
+            self.headers["Authorization"] = "Basic " + base64.b64encode(f"{token}:".encode()).decode()
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+
+    def _new_connection(self):
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout,
+                                               context=ssl.create_default_context())
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def _release(self, connection):
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def get_json(self, path: str, params=None):
+        url = self.base_path + path + (f"?{urlencode(params)}" if params else "")
+        connection = self._acquire()
+        try:
+            try:
+                connection.request("GET", url, headers=self.headers)
+                response = connection.getresponse()
+            except (http.client.HTTPException, ConnectionError):
+                # The server may have closed an idle keep-alive connection; retry once on a fresh one
+                connection.close()
+                connection = self._new_connection()
+                connection.request("GET", url, headers=self.headers)
+                response = connection.getresponse()
+            body = response.read().decode("utf-8", errors="replace")
+        except Exception:
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+        if response.status >= 400:
+            raise HttpError(response.status, response.reason, body)
+        return json.loads(body) if body else {}
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
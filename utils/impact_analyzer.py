@@ -0,0 +1,59 @@
+# git_assist/utils/impact_analyzer.py
+
+import fnmatch
+import subprocess
+from utils.config_reader import ConfigReader
+from utils.git_status import GitStatus
+
+
+class ChangeImpact:
+    def __init__(self, changed_paths, skip_reasons):
+        self.changed_paths = changed_paths
+        self.skip_reasons = skip_reasons
+
+
+class ImpactAnalyzer:
+    """Decides which checks a pending change needs, using path rules from the config.
+
+    The pending change is everything not yet pushed: staged, unstaged and untracked
+    files plus commits ahead of the upstream (or of origin/<base branch>), without
+    git-assist's own output such as its log and caches.
+    """
+
+    def __init__(self, config=None):
+        self.config = config or ConfigReader.load()
+
+    @staticmethod
+    def _matches(path, patterns):
+        return any(fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(path, f"*/{pattern}") for pattern in patterns)
+
+    def _unpushed_paths(self):
+        refs = ["@{upstream}"] + [f"origin/{base}" for base in self.config.base_branches]
+        for ref in refs:
+            result = subprocess.run(["git", "diff", "--name-only", f"{ref}...HEAD"],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            if result.returncode == 0:
+                return result.stdout.decode().splitlines()
+        return None
+
+    def analyze(self):
+        unpushed = self._unpushed_paths()
+        if unpushed is None:
+            # Without an upstream or base branch to compare with, run everything
+            return ChangeImpact(None, {})
+
+        status = GitStatus.capture()
+        changed = sorted(path for path in set(unpushed + status.staged + status.modified + status.untracked)
+                         if not GitStatus.is_tool_output(path))
+        if not changed:
+            reason = "no pending changes"
+            return ChangeImpact(changed, {"build": reason, "sonar": reason, "snyk": reason})
+
+        skip_reasons = {}
+        if not any(self._matches(path, self.config.impact_manifest_patterns) for path in changed):
+            skip_reasons["snyk"] = "no dependency manifest changed"
+        if all(self._matches(path, self.config.impact_ignore_patterns) for path in changed):
+            reason = "only non-source files changed"
+            skip_reasons["build"] = reason
+            skip_reasons["sonar"] = reason
+        return ChangeImpact(changed, skip_reasons)
@@ -0,0 +1,89 @@
+# git_assist/utils/jacoco_parser.py
+
+import xml.etree.ElementTree as ET
+
+COUNTER_TYPES = ("INSTRUCTION", "BRANCH", "LINE", "COMPLEXITY", "METHOD", "CLASS")
+
+
+class CoverageCounters:
+    """Missed/covered totals per JaCoCo counter type."""
+
+    def __init__(self):
+        self.counters = {}
+
+    def add(self, counter_type, missed, covered):
+        current_missed, current_covered = self.counters.get(counter_type, (0, 0))
+        self.counters[counter_type] = (current_missed + missed, current_covered + covered)
+
+    def merge(self, other):
+        for counter_type, (missed, covered) in other.counters.items():
+            self.add(counter_type, missed, covered)
+
+    def percent(self, counter_type="INSTRUCTION"):
+        missed, covered = self.counters.get(counter_type, (0, 0))
+        total = missed + covered
+        return round((covered / total) * 100, 2) if total else 0
+
+    def __bool__(self):
+        return bool(self.counters)
+
+
+class JacocoReport:
+    """Streaming parser for one or more jacoco.xml files.
+
+    Elements are cleared as soon as they are closed, so memory use does not grow
+    with the report size. Produces report-level totals plus per-package and
+    per-class rollups; several module reports are aggregated into one result.
+    """
+
+    def __init__(self):
+        self.totals = CoverageCounters()
+        self.packages = {}
+        self.classes = {}
+
+    @classmethod
+    def parse(cls, *paths):
+        report = cls()
+        for path in paths:
+            report._parse_file(path)
+        return report
+
+    def _parse_file(self, path):
+        file_totals = CoverageCounters()
+        stack = []
+        package = None
+        for event, element in ET.iterparse(str(path), events=("start", "end")):
+            if event == "start":
+                stack.append(element)
+                if element.tag == "package":
+                    package = element.get("name", "").replace("/", ".")
+                continue
+
+            stack.pop()
+            parent = stack[-1].tag if stack else None
+            if element.tag == "counter":
+                counter_type = element.get("type")
+                missed, covered = int(element.get("missed", 0)), int(element.get("covered", 0))
+                if parent == "report":
+                    file_totals.add(counter_type, missed, covered)
+                elif parent == "package":
+                    self.packages.setdefault(package, CoverageCounters()).add(counter_type, missed, covered)
+                elif parent == "class":
+                    class_name = stack[-1].get("name", "").replace("/", ".")
+                    self.classes.setdefault(class_name, CoverageCounters()).add(counter_type, missed, covered)
+            elif element.tag in ("class", "sourcefile", "package", "group"):
+                element.clear()
+                if stack:
+                    # Drop the finished child from its parent so siblings don't pile up
+                    stack[-1].remove(element)
+
+        if not file_totals:
+            raise ValueError(f"❌ Unable to parse coverage from Jacoco report {path}.")
+        self.totals.merge(file_totals)
+
+    def coverage(self, counter_type="INSTRUCTION"):
+        return self.totals.percent(counter_type)
+
+    def lowest_packages(self, counter_type="INSTRUCTION", limit=10):
+        ranked = sorted(self.packages.items(), key=lambda item: item[1].percent(counter_type))
+        return ranked[:limit]
@@ -1,4 +1,117 @@
+import atexit
+import json
+import os
+import queue
 import sys
+import threading
+from datetime import datetime
+
+
+class _LogWriter:
+    """Background writer that keeps one handle open and flushes in batches.
+
+    Rotates the file once it grows past `max_bytes` or `max_lines` (0 disables
+    either limit), keeping `backup_count` numbered copies (`git-assist.log.1`,
+    `.2`, ...) instead of truncating. Lines written after `close()` go straight
+    to the file.
+    """
+
+    def __init__(self, path, max_bytes=5 * 1024 * 1024, backup_count=3, flush_interval=0.5, max_lines=0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_lines = max_lines
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._open("a")
+        self._thread = threading.Thread(target=self._run, name=f"log-writer:{os.path.basename(path)}", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _open(self, mode):
+        self._handle = open(self.path, mode, encoding="utf-8")
+        self._bytes = os.path.getsize(self.path)
+        self._lines = self._count_lines() if self.max_lines else 0
+
+    def _count_lines(self):
+        with open(self.path, "rb") as f:
+            return sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1024 * 1024), b""))
+
+    def _should_rotate(self):
+        return (self.max_bytes and self._bytes >= self.max_bytes) or (self.max_lines and self._lines >= self.max_lines)
+
+    def write(self, text):
+        with self._lock:
+            if not self._closed:
+                self._queue.put(text)
+                return
+            # Logged after close() (atexit handlers, late worker threads): the writer thread is gone, write directly
+            self._thread.join()
+            try:
+                self._open("a")
+                self._write_records([text])
+                self._handle.close()
+            except Exception as e:
+                print(f"Error writing to log file: {e}")
+
+    def _write_records(self, records):
+        # Rotation is checked per record so a large batch cannot overshoot the limits
+        for text in records:
+            self._handle.write(text)
+            self._bytes += len(text.encode("utf-8"))
+            self._lines += text.count("\n")
+            if self._should_rotate():
+                self._rotate()
+        self._handle.flush()
+
+    def _run(self):
+        stop = False
+        while not stop:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            # Drain whatever else is already queued so it goes out in one write
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stop = True
+                batch = [text for text in batch if text is not None]
+            try:
+                self._write_records(batch)
+            except Exception as e:
+                print(f"Error writing to log file: {e}")
+                # Don't throw further exceptions if we can't log
+        self._handle.close()
+
+    def _rotate(self):
+        self._handle.close()
+        mode = "a"
+        try:
+            if self.backup_count > 0:
+                for index in range(self.backup_count - 1, 0, -1):
+                    source = f"{self.path}.{index}"
+                    if os.path.exists(source):
+                        os.replace(source, f"{self.path}.{index + 1}")
+                os.replace(self.path, f"{self.path}.1")
+            else:
+                mode = "w"
+        finally:
+            # Even if renaming failed, keep a handle open so later lines are not dropped
+            self._open(mode)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
 
 
 class Logger:
@@ -10,18 +123,16 @@ class Logger:
         "reset": "\033[0m"
     }
 
-    def __init__(self, log_file=None):
+    def __init__(self, log_file=None, json_log_file=None, max_bytes=5 * 1024 * 1024, backup_count=3, max_lines=0):
         self.enable_colors = sys.stdout.isatty()
         self.log_file = log_file
-        if log_file:
-            # Create directory if it doesn't exist
-            import os
-            log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
-                os.makedirs(log_dir)
-            # Create or clear the log file
-            with open(log_file, 'w') as f:
-                pass  # Just create/clear the file
+        self.json_log_file = json_log_file
+        self.max_bytes = max_bytes
+        self.max_lines = max_lines
+        self.backup_count = backup_count
+        # Writers (file handle + thread) are only created when the first message is logged
+        self._writers = {}
+        self._writers_lock = threading.Lock()
 
     def _color(self, text, color):
         if self.enable_colors:
@@ -30,34 +141,48 @@ class Logger:
 
     def log(self, message):
         print(message)
-        self._write_to_file(message)
+        self._write_to_file(message, "info")
 
     def highlight(self, message):
         colored_message = self._color(message, "blue")
         print(colored_message)
-        self._write_to_file(message)  # Write uncolored text to file
+        self._write_to_file(message, "highlight")  # Write uncolored text to file
 
     def success(self, message):
         colored_message = self._color(message, "green")
         print(colored_message)
-        self._write_to_file(message)
+        self._write_to_file(message, "success")
 
     def warn(self, message):
         colored_message = self._color(message, "yellow")
         print(colored_message)
-        self._write_to_file(message)
+        self._write_to_file(message, "warn")
 
     def error(self, message):
         colored_message = self._color(message, "red")
         print(colored_message)
-        self._write_to_file(message)
+        self._write_to_file(message, "error")
+
+    def close(self):
+        """Flush pending messages and release the log file handles; later messages are written synchronously."""
+        for writer in self._writers.values():
+            writer.close()
+
+    def _writer(self, path):
+        with self._writers_lock:
+            if path not in self._writers:
+                # Create directory if it doesn't exist
+                log_dir = os.path.dirname(path)
+                if log_dir and not os.path.exists(log_dir):
+                    os.makedirs(log_dir)
+                self._writers[path] = _LogWriter(path, max_bytes=self.max_bytes, backup_count=self.backup_count,
+                                                max_lines=self.max_lines)
+            return self._writers[path]
 
-    def _write_to_file(self, message):
-        """Write message to log file if one is specified"""
+    def _write_to_file(self, message, level="info"):
+        """Queue message for the plain-text and JSON-lines logs, if configured"""
         if self.log_file:
-            try:
-                with open(self.log_file, 'a') as f:
-                    f.write(f"{message}\n")
-            except Exception as e:
-                print(f"Error writing to log file: {e}")
-                # Don't throw further exceptions if we can't log
\ No newline at end of file
+            self._writer(self.log_file).write(f"{message}\n")
+        if self.json_log_file:
+            record = {"ts": datetime.now().isoformat(timespec="milliseconds"), "level": level, "message": message}
+            self._writer(self.json_log_file).write(json.dumps(record, ensure_ascii=False) + "\n")
@@ -0,0 +1,66 @@
+# git_assist/utils/maven_log.py
+
+import re
+
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+_LEVEL = re.compile(r"^\[(INFO|WARNING|ERROR)\] ?")
+_MODULE_RESULT = re.compile(
+    r"^(?P<name>\S.*?)\s+\.*\s*(?P<status>SUCCESS|FAILURE|SKIPPED)"
+    r"(?:\s+\[\s*(?P<time>[\d:.,]+)\s+(?P<unit>s|min|h)\])?\s*$")
+_TOTAL_TIME = re.compile(r"^Total time:\s+(?P<time>[\d:.,]+)\s+(?P<unit>s|min|h)")
+_FAILED_GOAL = re.compile(r"^Failed to execute goal .* on project (?P<project>[^:]+): (?P<reason>.*)")
+
+
+def _seconds(value, unit):
+    """Maven durations look like "1.234 s", "01:02 min" (mm:ss) or "01:02 h" (hh:mm)."""
+    value = value.replace(",", ".")
+    if unit == "s":
+        return float(value)
+    major, _, minor = value.partition(":")
+    minor = float(minor or 0)
+    return int(major) * 3600 + minor * 60 if unit == "h" else int(major) * 60 + minor
+
+
+class ReactorLog:
+    """Stream consumer extracting the reactor summary from `mvn` output while it runs.
+
+    `modules` maps each reactor project name to (status, seconds) in build order;
+    single-module builds print no reactor summary, so only `result` and
+    `total_time` are set for them.
+    """
+
+    def __init__(self):
+        self.modules = {}
+        self.result = None
+        self.total_time = None
+        self.failures = {}
+        self.offline_miss = False
+        self._in_summary = False
+
+    def __call__(self, line: str):
+        line = _LEVEL.sub("", _ANSI.sub("", line.rstrip("\n")))
+        if "in offline mode" in line:
+            # e.g. "Cannot access central (...) in offline mode and the artifact ... has not been downloaded"
+            self.offline_miss = True
+        if line.startswith("Reactor Summary"):
+            self._in_summary = True
+        elif line in ("BUILD SUCCESS", "BUILD FAILURE"):
+            self._in_summary = False
+            self.result = line[len("BUILD "):]
+        elif self._in_summary:
+            match = _MODULE_RESULT.match(line)
+            if match:
+                duration = _seconds(match["time"], match["unit"]) if match["time"] else None
+                self.modules[match["name"]] = (match["status"], duration)
+        elif line.startswith("Total time:"):
+            match = _TOTAL_TIME.match(line)
+            if match:
+                self.total_time = _seconds(match["time"], match["unit"])
+        elif line.startswith("Failed to execute goal"):
+            match = _FAILED_GOAL.match(line)
+            if match:
+                self.failures.setdefault(match["project"], match["reason"])
+
+    def slowest_modules(self, limit=5):
+        timed = [(name, duration) for name, (_, duration) in self.modules.items() if duration is not None]
+        return sorted(timed, key=lambda item: item[1], reverse=True)[:limit]
@@ -0,0 +1,188 @@
+# git_assist/utils/maven_prewarm.py
+
+import atexit
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import signal
+import subprocess
+import threading
+import time
+from pathlib import Path
+from xml.sax.saxutils import escape
+from utils.logger import Logger
+from utils.profiler import Profiler
+
+SETTINGS_TEMPLATE = """<settings>
+  <mirrors>
+    <mirror>
+      <id>git-assist-mirror</id>
+      <mirrorOf>*</mirrorOf>
+      <url>{url}</url>
+    </mirror>
+  </mirrors>
+</settings>
+"""
+
+
+class MavenEnvironment:
+    """How Maven is invoked: `mvnd` when available, an optional shared local repository and mirror.
+
+    A mirror such as `file:///srv/m2-mirror` replaces every remote repository,
+    which also allows trying the pre-warm and offline builds without network.
+    Its settings.xml is written once, when the environment is created.
+    """
+
+    def __init__(self, local_repository: str = "", mirror_url: str = "", use_daemon: bool = True,
+                 settings_dir: str = "git-assist/maven"):
+        self.local_repository = os.path.expanduser(local_repository) if local_repository else ""
+        self.mirror_url = mirror_url
+        self.use_daemon = use_daemon
+        self.settings_file = Path(settings_dir) / "settings.xml"
+        if self.mirror_url:
+            self.settings_file.parent.mkdir(parents=True, exist_ok=True)
+            self.settings_file.write_text(SETTINGS_TEMPLATE.format(url=escape(self.mirror_url)))
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(config.maven_local_repository, config.maven_mirror_url, config.maven_daemon)
+
+    def executable(self):
+        return "mvnd" if self.use_daemon and shutil.which("mvnd") else "mvn"
+
+    def command(self, arguments: str, offline: bool = False):
+        options = []
+        if self.local_repository:
+            options.append(shlex.quote(f"-Dmaven.repo.local={self.local_repository}"))
+        if self.mirror_url:
+            options.append(f"-s {shlex.quote(str(self.settings_file))}")
+        if offline:
+            options.append("-o")
+        return " ".join([self.executable()] + options + [arguments])
+
+
+class DependencyPrewarm:
+    """Downloads the reactor's dependencies and plugins in the background, many at a time.
+
+    Runs `dependency:go-offline` over the reactor in parallel (`-T`) with
+    `threads` concurrent artifact downloads. A successful run is remembered
+    per fingerprint of the POMs, Maven settings and local repository; until
+    one of them changes, builds can run offline. Progress goes to `log_file`
+    only; the outcome is reported by `wait()`, so nothing is printed between
+    prompts. A pre-warm still running when git-assist exits is killed.
+    """
+
+    def __init__(self, logger: Logger, environment: MavenEnvironment, threads: int = 8,
+                 state_file: str = "git-assist/build-cache/prewarm.json",
+                 log_file: str = "git-assist/build-reports/prewarm.log"):
+        self.logger = logger
+        self.environment = environment
+        self.threads = threads
+        self.state_file = Path(state_file)
+        self.log_file = Path(log_file)
+        self._thread = None
+        self._process = None
+        self._stopped = False
+        self._succeeded = False
+        self._error = None
+        self._duration = None
+        self._lock = threading.Lock()
+
+    def fingerprint(self):
+        digest = hashlib.sha256()
+        poms = sorted(path for path in Path(".").glob("**/pom.xml") if "target" not in path.parts)
+        for path in poms + [Path(".mvn/extensions.xml"), Path(".mvn/maven.config")]:
+            if path.is_file():
+                digest.update(str(path).encode() + b"\0" + path.read_bytes())
+        digest.update(f"{self.environment.local_repository}\0{self.environment.mirror_url}".encode())
+        return digest.hexdigest()
+
+    def _load_state(self):
+        try:
+            with self.state_file.open() as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def is_fresh(self):
+        return self._load_state().get("fingerprint") == self.fingerprint()
+
+    def invalidate(self):
+        if self.state_file.is_file():
+            self.state_file.unlink()
+
+    def start(self):
+        """Start resolving in the background, unless it is running or already done for these POMs."""
+        with self._lock:
+            if self._thread or self._stopped or self.is_fresh():
+                return
+            self.logger.highlight(f"📦 Pre-warming Maven dependencies in the background ({self.threads} threads, "
+                                  f"log: {self.log_file})...")
+            self._thread = threading.Thread(target=self._run, name="maven-prewarm", daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def wait(self):
+        """Wait for a running pre-warm; True when dependencies are available for an offline build."""
+        with self._lock:
+            thread = self._thread
+        if not thread:
+            return self.is_fresh()
+        if thread.is_alive():
+            self.logger.highlight("⏳ Waiting for the dependency pre-warm to finish...")
+        thread.join()
+        with self._lock:
+            self._thread = None
+        if self._succeeded:
+            self.logger.success(f"✅ Maven dependencies pre-warmed in {self._duration:.1f}s.")
+        else:
+            self.logger.warn(f"⚠️ Dependency pre-warm failed, builds stay online (see {self.log_file}): "
+                             f"{self._error}")
+        return self._succeeded
+
+    def stop(self):
+        """Kill a running pre-warm together with its mvn processes."""
+        with self._lock:
+            self._stopped = True
+            process = self._process
+        if not process or process.poll() is not None:
+            return
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+        except ProcessLookupError:
+            pass
+
+    def _run(self):
+        fingerprint = self.fingerprint()
+        command = self.environment.command(
+            f"-B -T 1C dependency:go-offline -DexcludeReactor=true "
+            f"-Dmaven.artifact.threads={self.threads} -Daether.connector.basic.threads={self.threads}")
+        started = time.monotonic()
+        try:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            with Profiler.span("mvn dependency:go-offline", "maven", threads=self.threads) as span, \
+                    self.log_file.open("w") as log:
+                with self._lock:
+                    if self._stopped:
+                        raise RuntimeError("stopped")
+                    # Own process group, so stop() also reaches the JVM the shell starts
+                    self._process = subprocess.Popen(command, shell=True, stdin=subprocess.DEVNULL, stdout=log,
+                                                     stderr=subprocess.STDOUT, start_new_session=True)
+                span["exit_code"] = self._process.wait()
+            if span["exit_code"] != 0:
+                raise RuntimeError(f"{command} exited with code {span['exit_code']}")
+
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            with self.state_file.open("w") as f:
+                json.dump({"fingerprint": fingerprint, "finished_at": time.time()}, f)
+        except Exception as e:
+            self._succeeded, self._error = False, e
+            return
+        self._succeeded = True
+        self._duration = time.monotonic() - started
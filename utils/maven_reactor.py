@@ -0,0 +1,137 @@
+# git_assist/utils/maven_reactor.py
+
+import os
+import subprocess
+import xml.etree.ElementTree as ET
+from utils.config_reader import ConfigReader
+from utils.git_repository import GitRepository
+
+
+def _strip_namespace(root):
+    for element in root.iter():
+        if isinstance(element.tag, str) and "}" in element.tag:
+            element.tag = element.tag.split("}", 1)[1]
+    return root
+
+
+class MavenReactor:
+    """Module graph of a multi-module Maven build, read from the pom files.
+
+    Modules are keyed by their directory relative to the reactor root ("" for the root).
+    """
+
+    def __init__(self, root="."):
+        self.root = root
+        self.coordinates = {}   # module dir -> "groupId:artifactId"
+        self.dependencies = {}  # module dir -> set of "groupId:artifactId"
+        self._load_module("")
+
+    def _load_module(self, module_dir):
+        pom_path = os.path.join(self.root, module_dir, "pom.xml")
+        if module_dir in self.coordinates or not os.path.isfile(pom_path):
+            return
+        pom = _strip_namespace(ET.parse(pom_path).getroot())
+        group_id = pom.findtext("groupId") or pom.findtext("parent/groupId")
+        self.coordinates[module_dir] = f"{group_id}:{pom.findtext('artifactId')}"
+
+        deps = {f"{dep.findtext('groupId')}:{dep.findtext('artifactId')}"
+                for dep in pom.findall("dependencies/dependency")}
+        if pom.find("parent") is not None:
+            deps.add(f"{pom.findtext('parent/groupId')}:{pom.findtext('parent/artifactId')}")
+        self.dependencies[module_dir] = deps
+
+        module_names = [module.text.strip() for module in pom.iter("module") if module.text]
+        for name in module_names:
+            self._load_module(os.path.normpath(os.path.join(module_dir, name)).replace(os.sep, "/"))
+
+    def module_for_path(self, path):
+        """Deepest module whose directory contains path."""
+        best = ""
+        for module_dir in self.coordinates:
+            if module_dir and (path == module_dir or path.startswith(module_dir + "/")) and len(module_dir) > len(best):
+                best = module_dir
+        return best
+
+    def with_dependents(self, modules):
+        """The given modules plus every reactor module depending on them, transitively."""
+        selected = set(modules)
+        changed = True
+        while changed:
+            changed = False
+            selected_coords = {self.coordinates[module_dir] for module_dir in selected}
+            for module_dir, deps in self.dependencies.items():
+                if module_dir not in selected and deps & selected_coords:
+                    selected.add(module_dir)
+                    changed = True
+        return selected
+
+
+class ReactorScope:
+    """Which reactor modules a change touches, relative to the base branch.
+
+    Resolved once per run and shared by MavenBuild and SonarChecker so both
+    limit themselves to the same set of modules.
+    """
+
+    def __init__(self, root="."):
+        self.root = root
+        self.reset()
+
+    def reset(self):
+        """Forget the resolved scope so the next resolve() looks at the tree again."""
+        self._resolved = False
+        self.full_build = True
+        self.changed_modules = set()
+        self.modules = set()
+        self.skip_clean = False
+
+    def resolve(self):
+        if self._resolved:
+            return self
+        self._resolved = True
+
+        reactor = MavenReactor(self.root)
+        if len(reactor.coordinates) <= 1:
+            return self  # single-module project: nothing to narrow
+
+        base = self._base_ref()
+        if not base:
+            return self
+
+        changed_paths = set(self._git_lines(["git", "diff", "--name-only", f"{base}...HEAD"]))
+        changed_paths.update(self._git_lines(["git", "diff", "--name-only", "HEAD"]))
+        changed_paths.update(self._git_lines(["git", "ls-files", "--others", "--exclude-standard"]))
+
+        changed_modules = set()
+        for path in changed_paths:
+            module_dir = reactor.module_for_path(path)
+            if module_dir:
+                changed_modules.add(module_dir)
+            elif path == "pom.xml" or path.startswith((".mvn/", "src/")):
+                return self  # root build configuration changed: build everything
+
+        # Deleted or renamed files can leave stale classes behind, so only then keep `clean`
+        removed = self._git_lines(["git", "diff", "--name-only", "--diff-filter=DR", f"{base}...HEAD"])
+        removed += self._git_lines(["git", "diff", "--name-only", "--diff-filter=DR", "HEAD"])
+
+        self.full_build = False
+        self.changed_modules = changed_modules
+        self.modules = reactor.with_dependents(changed_modules)
+        self.skip_clean = not removed
+        return self
+
+    def _base_ref(self):
+        repository = GitRepository.discover(self.root)
+        if not repository:
+            return None
+        for base in ConfigReader.load().base_branches:
+            if repository.ref_exists(f"refs/remotes/origin/{base}"):
+                return f"origin/{base}"
+        return None
+
+    @staticmethod
+    def _git_lines(command):
+        try:
+            return subprocess.check_output(command, stderr=subprocess.DEVNULL).decode().splitlines()
+        except subprocess.CalledProcessError:
+            return []
@@ -0,0 +1,153 @@
+# git_assist/utils/metrics_store.py
+
+import os
+import sqlite3
+import subprocess
+import time
+from contextlib import closing
+from utils.git_repository import GitRepository
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    repo TEXT NOT NULL,
+    branch TEXT NOT NULL,
+    commit_sha TEXT NOT NULL,
+    step TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    duration REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_branch_step ON runs (repo, branch, step, recorded_at DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_commit ON runs (repo, commit_sha);
+CREATE TABLE IF NOT EXISTS coverage (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    counter TEXT NOT NULL,
+    missed INTEGER NOT NULL,
+    covered INTEGER NOT NULL,
+    PRIMARY KEY (run_id, counter)
+);
+CREATE TABLE IF NOT EXISTS sonar_issues (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    severity TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (run_id, severity)
+);
+CREATE TABLE IF NOT EXISTS snyk_findings (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    vuln_id TEXT NOT NULL,
+    package TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    title TEXT,
+    PRIMARY KEY (run_id, vuln_id, package)
+);
+"""
+
+
+class MetricsStore:
+    """SQLite history of coverage, Sonar severities, Snyk findings and step durations.
+
+    Runs are keyed by repository, branch and commit, so each run can be compared
+    with the latest run recorded for the base branch.
+    """
+
+    def __init__(self, db_path: str = "~/.git-assist/metrics.db"):
+        self.db_path = os.path.expanduser(db_path)
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.executescript(SCHEMA)
+
+    def _connect(self):
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        return connection
+
+    @staticmethod
+    def current_revision():
+        """(repo, branch, commit) of the working directory, read from `.git` where possible."""
+        repository = GitRepository.discover()
+        if repository:
+            branch, commit = repository.head()
+            if commit:
+                return repository.toplevel, branch or "HEAD", commit
+        # --abbrev-ref applies to every argument after it, so the plain HEAD (the commit) comes first
+        output = subprocess.check_output(
+            ["git", "rev-parse", "--show-toplevel", "HEAD", "--abbrev-ref", "HEAD"], stderr=subprocess.DEVNULL)
+        repo, commit, branch = output.decode().splitlines()
+        return repo, branch, commit
+
+    def _insert_run(self, connection, revision, step, duration):
+        repo, branch, commit = revision
+        cursor = connection.execute(
+            "INSERT INTO runs (repo, branch, commit_sha, step, recorded_at, duration) VALUES (?, ?, ?, ?, ?, ?)",
+            (repo, branch, commit, step, time.time(), duration))
+        return cursor.lastrowid
+
+    def record_duration(self, revision, step, duration):
+        with closing(self._connect()) as connection, connection:
+            self._insert_run(connection, revision, step, duration)
+
+    def record_sonar(self, revision, counters, severities, duration=None):
+        """counters: {counter type: (missed, covered)}; severities: {severity: count}."""
+        with closing(self._connect()) as connection, connection:
+            run_id = self._insert_run(connection, revision, "sonar", duration)
+            connection.executemany("INSERT INTO coverage VALUES (?, ?, ?, ?)",
+                                   [(run_id, counter, missed, covered)
+                                    for counter, (missed, covered) in counters.items()])
+            connection.executemany("INSERT INTO sonar_issues VALUES (?, ?, ?)",
+                                   [(run_id, severity, count) for severity, count in severities.items()])
+
+    def record_snyk(self, revision, vulnerabilities, duration=None):
+        with closing(self._connect()) as connection, connection:
+            run_id = self._insert_run(connection, revision, "snyk", duration)
+            connection.executemany(
+                "INSERT OR IGNORE INTO snyk_findings VALUES (?, ?, ?, ?, ?)",
+                [(run_id, vuln.get("id", ""), vuln.get("packageName", ""), vuln.get("severity", "unknown"),
+                  vuln.get("title")) for vuln in vulnerabilities])
+
+    def _last_run_id(self, connection, repo, branch, step):
+        row = connection.execute(
+            "SELECT id FROM runs WHERE repo = ? AND branch = ? AND step = ? ORDER BY recorded_at DESC LIMIT 1",
+            (repo, branch, step)).fetchone()
+        return row[0] if row else None
+
+    def find_base_branch(self, revision, candidates, step):
+        """First candidate branch (other than the current one) with a recorded run of step."""
+        repo, branch, _ = revision
+        with closing(self._connect()) as connection:
+            for candidate in candidates:
+                if candidate != branch and self._last_run_id(connection, repo, candidate, step):
+                    return candidate
+        return None
+
+    def last_sonar(self, repo, branch):
+        """({counter: (missed, covered)}, {severity: count}) of the branch's latest Sonar run, or None."""
+        with closing(self._connect()) as connection:
+            run_id = self._last_run_id(connection, repo, branch, "sonar")
+            if run_id is None:
+                return None
+            counters = {counter: (missed, covered) for counter, missed, covered in connection.execute(
+                "SELECT counter, missed, covered FROM coverage WHERE run_id = ?", (run_id,))}
+            severities = dict(connection.execute(
+                "SELECT severity, count FROM sonar_issues WHERE run_id = ?", (run_id,)).fetchall())
+            return counters, severities
+
+    def new_snyk_findings(self, repo, base_branch, vulnerabilities):
+        """Vulnerabilities not present in the base branch's latest Snyk run."""
+        with closing(self._connect()) as connection:
+            run_id = self._last_run_id(connection, repo, base_branch, "snyk")
+            known = set(connection.execute(
+                "SELECT vuln_id, package FROM snyk_findings WHERE run_id = ?", (run_id,)).fetchall())
+        return [vuln for vuln in vulnerabilities if (vuln.get("id", ""), vuln.get("packageName", "")) not in known]
+
+    def coverage_trend(self, repo, branch, counter="INSTRUCTION", since_days=180, limit=20):
+        """[(recorded_at, commit, coverage %)] of recent Sonar runs on the branch, oldest first."""
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT runs.recorded_at, runs.commit_sha, coverage.missed, coverage.covered FROM runs "
+                "JOIN coverage ON coverage.run_id = runs.id AND coverage.counter = ? "
+                "WHERE runs.repo = ? AND runs.branch = ? AND runs.step = 'sonar' AND runs.recorded_at >= ? "
+                "ORDER BY runs.recorded_at DESC LIMIT ?",
+                (counter, repo, branch, time.time() - since_days * 86400, limit)).fetchall()
+        return [(recorded_at, commit, round(covered / (missed + covered) * 100, 2) if missed + covered else 0)
+                for recorded_at, commit, missed, covered in reversed(rows)]
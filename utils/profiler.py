@@ -0,0 +1,91 @@
+# git_assist/utils/profiler.py
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Profiler:
+    """Collects timing spans for steps and subprocesses when profiling is enabled.
+
+    Spans can be exported as Chrome/Perfetto trace JSON (open in chrome://tracing
+    or ui.perfetto.dev) and as a plain-text table of the slowest spans.
+    """
+
+    enabled = False
+    _spans = []
+    _lock = threading.Lock()
+    _origin = time.perf_counter()
+
+    @staticmethod
+    def enable():
+        Profiler.enabled = True
+
+    @staticmethod
+    @contextmanager
+    def span(name, category="step", **args):
+        """Time the enclosed block. The yielded dict can be filled with extra details (exit code, sizes)."""
+        details = dict(args)
+        if not Profiler.enabled:
+            yield details
+            return
+        start = time.perf_counter()
+        try:
+            yield details
+        finally:
+            end = time.perf_counter()
+            with Profiler._lock:
+                Profiler._spans.append({
+                    "name": name,
+                    "category": category,
+                    "start": start - Profiler._origin,
+                    "duration": end - start,
+                    "thread": threading.get_ident(),
+                    "args": details,
+                })
+
+    @staticmethod
+    def spans():
+        with Profiler._lock:
+            return list(Profiler._spans)
+
+    @staticmethod
+    def export(output_dir="git-assist/profile", top=20):
+        """Write trace.json and slowest.txt; returns their paths."""
+        spans = Profiler.spans()
+        os.makedirs(output_dir, exist_ok=True)
+        trace_path = os.path.join(output_dir, "trace.json")
+        table_path = os.path.join(output_dir, "slowest.txt")
+
+        pid = os.getpid()
+        events = [{
+            "name": span["name"],
+            "cat": span["category"],
+            "ph": "X",
+            "ts": round(span["start"] * 1e6),
+            "dur": round(span["duration"] * 1e6),
+            "pid": pid,
+            "tid": span["thread"],
+            "args": span["args"],
+        } for span in spans]
+        with open(trace_path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+        slowest = sorted(spans, key=lambda span: span["duration"], reverse=True)[:top]
+        with open(table_path, "w") as f:
+            f.write(f"{'Seconds':>9}  {'Category':<10}  {'Exit':>4}  {'Output':>10}  Name\n")
+            for span in slowest:
+                exit_code = span["args"].get("exit_code")
+                output_bytes = span["args"].get("output_bytes")
+                f.write(f"{span['duration']:>9.3f}  {span['category']:<10}  "
+                        f"{'-' if exit_code is None else exit_code:>4}  "
+                        f"{'-' if output_bytes is None else output_bytes:>10}  {span['name']}\n")
+            by_category = {}
+            for span in spans:
+                by_category[span["category"]] = by_category.get(span["category"], 0) + span["duration"]
+            f.write("\nTotal seconds per category (nested spans overlap):\n")
+            for category, total in sorted(by_category.items(), key=lambda item: item[1], reverse=True):
+                f.write(f"{total:>9.3f}  {category}\n")
+        return trace_path, table_path
@@ -0,0 +1,32 @@
+# git_assist/utils/prompt_utils.py
+
+import threading
+
+
+class PromptUnavailableError(Exception):
+    """Raised in headless mode when a prompt has no pre-configured answer."""
+
+
+class PromptUtils:
+    """Serialize interactive prompts so steps running in parallel never interleave them.
+
+    In headless mode (see `set_answers`) prompts are answered from a table keyed
+    by prompt name instead of reading stdin.
+    """
+
+    _lock = threading.Lock()
+    _answers = None
+
+    @staticmethod
+    def set_answers(answers):
+        """Switch to headless mode; `answers` maps prompt keys to their replies."""
+        PromptUtils._answers = dict(answers)
+
+    @staticmethod
+    def ask(question, key=None):
+        if PromptUtils._answers is not None:
+            if key in PromptUtils._answers:
+                return PromptUtils._answers[key]
+            raise PromptUnavailableError(f"No answer configured for prompt '{key}': {question.strip()}")
+        with PromptUtils._lock:
+            return input(question)
@@ -1,23 +1,117 @@
 # git_assist/utils/shell_utils.py
 
+import os
+import signal
 import subprocess
+import threading
+from collections import deque
+from utils.profiler import Profiler
 
 class ShellUtils:
+    # Streamed commands still running; each is the leader of its own process group
+    _running = set()
+    _running_lock = threading.Lock()
+
     @staticmethod
     def run_command(command, capture_output=False, check=True, shell=True):
         """Run the shell command and raise error if it fails."""
-        if capture_output:
-            result = subprocess.run(command, shell=shell, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            if check and result.returncode != 0:
-                # Raise error and pass stderr
-                raise subprocess.CalledProcessError(result.returncode, command, output=result.stdout,
-                                                    stderr=result.stderr)
-            return result.stdout.strip()
-        else:
-            result = subprocess.run(command, shell=shell)
-            if check and result.returncode != 0:
-                # Raise error and pass stderr
-                raise subprocess.CalledProcessError(result.returncode, command)
+        with Profiler.span(str(command), "command", command=str(command)) as span:
+            if capture_output:
+                result = subprocess.run(command, shell=shell, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                span["exit_code"] = result.returncode
+                span["output_bytes"] = len(result.stdout) + len(result.stderr)
+                if check and result.returncode != 0:
+                    # Raise error and pass stderr
+                    raise subprocess.CalledProcessError(result.returncode, command, output=result.stdout,
+                                                        stderr=result.stderr)
+                return result.stdout.strip()
+            else:
+                result = subprocess.run(command, shell=shell)
+                span["exit_code"] = result.returncode
+                if check and result.returncode != 0:
+                    # Raise error and pass stderr
+                    raise subprocess.CalledProcessError(result.returncode, command)
+
+    @staticmethod
+    def stream_command(command, consumers, check=True, shell=True, timeout=None, tail_lines=50, merge_stderr=True):
+        """Run the command and hand each output line to every consumer as it is produced.
+
+        stdout and stderr are merged unless `merge_stderr` is False, in which case
+        stderr is discarded (for commands whose stdout must stay machine-readable).
+        Only the last `tail_lines` lines are kept in memory (for the error raised on
+        failure), so memory stays constant whatever the output size. The command runs
+        in its own process group, which is killed as a whole (including children of
+        the shell such as mvn) if it runs longer than `timeout` seconds. Outside the
+        terminal's process group it does not see Ctrl+C; `kill_running()` stops it.
+        """
+        with Profiler.span(str(command), "command", command=str(command)) as span:
+            return ShellUtils._stream(command, consumers, check, shell, timeout, tail_lines, merge_stderr, span)
+
+    @staticmethod
+    def _stream(command, consumers, check, shell, timeout, tail_lines, merge_stderr, span):
+        process = subprocess.Popen(command, shell=shell, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT if merge_stderr else subprocess.DEVNULL,
+                                   text=True, errors="replace", bufsize=1, start_new_session=True)
+        with ShellUtils._running_lock:
+            ShellUtils._running.add(process)
+        timed_out = threading.Event()
+        timer = None
+        if timeout:
+            def _kill():
+                timed_out.set()
+                ShellUtils._kill_group(process)
+            timer = threading.Timer(timeout, _kill)
+            timer.daemon = True
+            timer.start()
+
+        tail = deque(maxlen=tail_lines)
+        try:
+            output_bytes = 0
+            for line in process.stdout:
+                output_bytes += len(line)
+                tail.append(line)
+                for consumer in consumers:
+                    consumer(line)
+            returncode = process.wait()
+            span["exit_code"] = returncode
+            span["output_bytes"] = output_bytes
+        finally:
+            if timer:
+                timer.cancel()
+            if process.poll() is None:
+                # A consumer raised or we were interrupted; don't leave the command running in the background
+                ShellUtils._kill_group(process)
+                process.wait()
+            process.stdout.close()
+            with ShellUtils._running_lock:
+                ShellUtils._running.discard(process)
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, timeout, output="".join(tail))
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command, output="".join(tail))
+        return returncode
+
+    @staticmethod
+    def kill_running():
+        """Kill every streamed command still running, e.g. from the main thread on Ctrl+C while workers stream."""
+        with ShellUtils._running_lock:
+            processes = list(ShellUtils._running)
+        for process in processes:
+            ShellUtils._kill_group(process)
+
+    @staticmethod
+    def _kill_group(process):
+        """Kill the command together with every process it started (the shell's children keep the pipe open)."""
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    @staticmethod
+    def echo(line):
+        """Stream consumer that mirrors output to the console."""
+        print(line, end="")
 
     @staticmethod
     def capture_output(command):
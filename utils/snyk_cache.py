@@ -0,0 +1,63 @@
+# git_assist/utils/snyk_cache.py
+
+import hashlib
+import json
+import subprocess
+import time
+from pathlib import Path
+
+MANIFEST_PATHSPECS = ["pom.xml", ":(glob)**/pom.xml", ".snyk"]
+
+
+class SnykCache:
+    """Reuses Snyk results while the dependency manifests are unchanged.
+
+    The fingerprint is a hash of every tracked or untracked pom.xml (and the
+    .snyk policy file) plus the test mode, since `--all-projects` reports more
+    than a plain `snyk test`. Entries older than `ttl_hours` are ignored so newly
+    disclosed vulnerabilities are still picked up.
+    """
+
+    def __init__(self, cache_dir: str = "git-assist/snyk-cache", ttl_hours: float = 24, max_entries: int = 10):
+        self.cache_file = Path(cache_dir) / "snyk_results.json"
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+
+    def fingerprint(self, all_projects: bool = False):
+        manifests = subprocess.check_output(
+            ["git", "ls-files", "--cached", "--others", "--exclude-standard", "--"] + MANIFEST_PATHSPECS
+        ).decode().splitlines()
+        digest = hashlib.sha256(b"all-projects\0" if all_projects else b"single-project\0")
+        for manifest in sorted(set(manifests)):
+            path = Path(manifest)
+            if path.is_file():
+                digest.update(manifest.encode() + b"\0")
+                digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def _load(self):
+        if not self.cache_file.is_file():
+            return {}
+        try:
+            with self.cache_file.open("r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def lookup(self, fingerprint):
+        entry = self._load().get(fingerprint)
+        if not entry or time.time() - entry["tested_at"] > self.ttl_seconds:
+            return None
+        return entry
+
+    def store(self, fingerprint, vulnerabilities, project_count=1):
+        now = time.time()
+        entries = {key: entry for key, entry in self._load().items() if now - entry["tested_at"] <= self.ttl_seconds}
+        entries[fingerprint] = {"tested_at": now, "vulnerabilities": vulnerabilities, "project_count": project_count}
+        newest = sorted(entries.items(), key=lambda item: item[1]["tested_at"], reverse=True)[:self.max_entries]
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with tmp_file.open("w") as f:
+            json.dump(dict(newest), f)
+        tmp_file.replace(self.cache_file)
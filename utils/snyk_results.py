@@ -0,0 +1,101 @@
+# git_assist/utils/snyk_results.py
+
+import json
+import re
+
+SEVERITY_ORDER = ["critical", "high", "medium", "low"]
+_SIGNIFICANT = re.compile(r'[\\"{}]')
+
+
+class SnykResults:
+    """Incremental ingestion of `snyk test --json` output.
+
+    Accepts both the single-project object and the array produced by
+    `--all-projects`. Each top-level project is decoded as soon as its closing
+    brace arrives, so only one project is held as text at a time.
+    Vulnerabilities are de-duplicated by (id, package) and indexed by severity.
+    """
+
+    def __init__(self):
+        self.vulnerabilities = []
+        self.by_severity = {}
+        self.errors = []
+        self.project_count = 0
+        self._seen = set()
+        self._buffer = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @classmethod
+    def from_vulnerabilities(cls, vulnerabilities, project_count=1):
+        results = cls()
+        results.project_count = project_count
+        for vuln in vulnerabilities:
+            results._add_vulnerability(vuln)
+        return results
+
+    def feed(self, chunk: str):
+        """Consume the next piece of Snyk's output (stream consumer)."""
+        start = 0 if self._depth else None
+        # Index of a character escaped by a backslash (0 if the backslash ended the previous chunk)
+        escaped_at = 0 if self._escaped else -1
+        self._escaped = False
+        for match in _SIGNIFICANT.finditer(chunk):
+            position, char = match.start(), match.group()
+            if position == escaped_at:
+                continue
+            if self._in_string:
+                if char == "\\":
+                    escaped_at = position + 1
+                    self._escaped = escaped_at == len(chunk)
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    start = position
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._buffer.append(chunk[start:position + 1])
+                    self._add_project(json.loads("".join(self._buffer)))
+                    self._buffer = []
+                    start = None
+        if self._depth:
+            self._buffer.append(chunk[start:])
+
+    def close(self):
+        if self._depth or self._in_string:
+            raise json.JSONDecodeError("Truncated Snyk output", "".join(self._buffer), 0)
+        if not self.project_count:
+            raise json.JSONDecodeError("No JSON object in Snyk output", "", 0)
+        return self
+
+    def _add_project(self, project):
+        self.project_count += 1
+        if "error" in project and not project.get("vulnerabilities"):
+            self.errors.append(project["error"])
+        for vuln in project.get("vulnerabilities", []):
+            self._add_vulnerability(vuln)
+
+    def _add_vulnerability(self, vuln):
+        key = (vuln.get("id"), vuln.get("packageName"))
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self.vulnerabilities.append(vuln)
+        self.by_severity.setdefault(vuln.get("severity", "unknown"), []).append(vuln)
+
+    def has_severity(self, severity):
+        return severity in self.by_severity
+
+    def grouped(self):
+        """Vulnerabilities grouped by severity (most severe first), sorted by package and title."""
+        order = SEVERITY_ORDER + sorted(set(self.by_severity) - set(SEVERITY_ORDER))
+        for severity in order:
+            if severity in self.by_severity:
+                yield severity, sorted(self.by_severity[severity],
+                                       key=lambda v: (v.get("packageName", ""), v.get("title", "")))
@@ -0,0 +1,69 @@
+# git_assist/utils/sonar_api.py
+
+import time
+from pathlib import Path
+from utils.http_client import HttpClient
+
+
+class SonarWebApi:
+    """Reads the server-side result of a scan through the SonarQube Web API.
+
+    Uses `report-task.txt` written by sonar-scanner to find the compute-engine
+    task, polls it with exponential backoff, then fetches the quality gate and
+    the open-issue severity facet over one keep-alive HTTP client.
+    """
+
+    def __init__(self, report_task_path: str = ".scannerwork/report-task.txt", token: str = None,
+                 timeout: float = 300, initial_delay: float = 1, max_delay: float = 15):
+        self.report_task_path = Path(report_task_path)
+        self.token = token
+        self.timeout = timeout
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+
+    def read_report_task(self):
+        if not self.report_task_path.is_file():
+            raise FileNotFoundError(f"❌ Sonar report task file missing at {self.report_task_path}.")
+        values = {}
+        with self.report_task_path.open("r") as file:
+            for line in file:
+                if "=" in line:
+                    key, value = line.rstrip("\n").split("=", 1)
+                    values[key] = value
+        return values
+
+    def fetch_results(self):
+        """Return (quality gate status, {severity: count}, dashboard url) once the analysis is processed."""
+        task = self.read_report_task()
+        client = HttpClient(task["serverUrl"], token=self.token)
+        try:
+            analysis_id = self._wait_for_task(client, task["ceTaskId"])
+            gate = client.get_json("/api/qualitygates/project_status", {"analysisId": analysis_id})
+            params = {"componentKeys": task["projectKey"], "resolved": "false", "facets": "severities", "ps": 1}
+            if task.get("branch"):
+                params["branch"] = task["branch"]
+            issues = client.get_json("/api/issues/search", params)
+        finally:
+            client.close()
+
+        severities = {}
+        for facet in issues.get("facets", []):
+            if facet.get("property") == "severities":
+                severities = {value["val"]: value["count"] for value in facet.get("values", [])}
+        return gate["projectStatus"]["status"], severities, task.get("dashboardUrl")
+
+    def _wait_for_task(self, client, task_id):
+        deadline = time.monotonic() + self.timeout
+        delay = self.initial_delay
+        while True:
+            task = client.get_json("/api/ce/task", {"id": task_id})["task"]
+            status = task["status"]
+            if status == "SUCCESS":
+                return task["analysisId"]
+            if status in ("FAILED", "CANCELED"):
+                raise Exception(f"Sonar analysis task {task_id} ended with status {status}: "
+                                f"{task.get('errorMessage', 'no details')}")
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Sonar analysis task {task_id} still {status} after {self.timeout}s.")
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_delay)
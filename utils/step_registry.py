@@ -0,0 +1,152 @@
+# git_assist/utils/step_registry.py
+
+import importlib
+import os
+import sqlite3
+from utils.config_reader import ConfigReader
+from utils.logger import Logger
+
+ENTRY_POINT_GROUP = "git_assist.steps"
+# Optional menu text per plugin step: `<step name> = <description>`; the value is plain text and never imported
+DESCRIPTION_GROUP = "git_assist.step_descriptions"
+
+# name -> (menu description, "module:Class", method). Nothing is imported until a step is used.
+BUILTIN_STEPS = {
+    "build": ("🔧 Run 'mvn clean install'", "modules.maven_build:MavenBuild", "run"),
+    "sonar": ("🧪 Run SonarQube and Jacoco checks", "modules.sonar_checker:SonarChecker", "run"),
+    "snyk": ("🔎 Run Snyk test and generate report", "modules.snyk_checker:SnykChecker", "run"),
+    "commit": ("📝 Stage and commit git changes", "modules.committer:Committer", "stage_and_commit"),
+    "push": ("🚀 Push to remote branch", "modules.pusher:Pusher", "push_to_remote"),
+    "clean": ("🧹 Clean merged remote branches", "modules.branch_cleaner:BranchCleaner", "clean_merged_branches"),
+    "force-build": ("🔁 Force 'mvn clean install' (ignore build cache)", "modules.maven_build:MavenBuild",
+                    "force_run"),
+}
+
+
+class StepContext:
+    """Shared state handed to step classes when they are first built (`from_context`)."""
+
+    def __init__(self, logger: Logger, **overrides):
+        self.logger = logger
+        self.overrides = overrides
+        self._scope = None
+        self._scope_loaded = False
+        self._metrics = None
+        self._metrics_failed = False
+        self._prewarm = None
+
+    @property
+    def config(self):
+        return ConfigReader.load()
+
+    @property
+    def scope(self):
+        """ReactorScope shared by build and Sonar steps, or None when incremental builds are off."""
+        if not self._scope_loaded:
+            self._scope_loaded = True
+            if self.config.incremental_build:
+                from utils.maven_reactor import ReactorScope
+                self._scope = ReactorScope()
+        return self._scope
+
+    @property
+    def metrics(self):
+        """MetricsStore shared by the steps, or None when METRICS_HISTORY is off."""
+        if self._metrics is None and not self._metrics_failed and self.config.metrics_history:
+            from utils.metrics_store import MetricsStore
+            try:
+                self._metrics = MetricsStore(self.config.metrics_db)
+            except (OSError, sqlite3.Error) as e:
+                self._metrics_failed = True  # warn once; the steps run without history
+                self.logger.warn(f"⚠️ Metrics history unavailable: {e}")
+        return self._metrics
+
+    @property
+    def prewarm(self):
+        """DependencyPrewarm shared by the build steps, or None when MAVEN_PREWARM is off."""
+        if self._prewarm is None and self.config.maven_prewarm and os.path.isfile("pom.xml"):
+            from utils.maven_prewarm import DependencyPrewarm, MavenEnvironment
+            self._prewarm = DependencyPrewarm(self.logger, MavenEnvironment.from_config(self.config),
+                                              threads=self.config.maven_prewarm_threads)
+        return self._prewarm
+
+    def start_prewarm(self, steps):
+        """Start downloading Maven dependencies early when a build is among the `steps` about to run."""
+        if self.prewarm and {"build", "force-build"} & set(steps):
+            self.prewarm.start()
+
+    def skip_reasons(self):
+        """Steps that need not run this round: unaffected by the pending change, or passed in watch mode."""
+        reasons = {}
+        if self.config.impact_analysis:
+            from utils.impact_analyzer import ImpactAnalyzer
+            reasons.update(ImpactAnalyzer().analyze().skip_reasons)
+        if self.config.watch_reuse_results:
+            from utils.watch_results import WatchResults
+            for name, result in (WatchResults().for_current_tree() or {}).items():
+                # Watch runs use the configured coverage threshold, not a stricter --min-coverage
+                if name == "sonar" and self.overrides.get("min_coverage") is not None:
+                    continue
+                if result["status"] == "success":
+                    reasons.setdefault(name, "passed in watch mode for this working tree")
+        return reasons
+
+    def reset(self):
+        """Start a new round: the changed-module scope is resolved again on next use."""
+        if self._scope:
+            self._scope.reset()
+
+
+class StepRegistry:
+    """Steps discovered by name, imported and constructed only when first selected.
+
+    Third-party steps register through the `git_assist.steps` entry-point group;
+    the entry point must resolve to a class with `from_context(context)` and
+    `run()`. The menu text comes from the `git_assist.step_descriptions` group,
+    so listing the menu never imports a plugin.
+    """
+
+    def __init__(self, context: StepContext):
+        self.context = context
+        self._steps = dict(BUILTIN_STEPS)
+        self._instances = {}
+
+    def discover_plugins(self):
+        descriptions = {entry_point.name: entry_point.value for entry_point in self._entry_points(DESCRIPTION_GROUP)}
+        for entry_point in self._entry_points(ENTRY_POINT_GROUP):
+            if entry_point.name in self._steps:
+                self.context.logger.warn(f"⚠️ Ignoring plugin step '{entry_point.name}': name already registered.")
+                continue
+            description = descriptions.get(entry_point.name, f"🧩 {entry_point.name}")
+            self._steps[entry_point.name] = (description, entry_point, "run")
+        return self
+
+    @staticmethod
+    def _entry_points(group):
+        from importlib.metadata import entry_points
+
+        discovered = entry_points()
+        if hasattr(discovered, "select"):
+            return discovered.select(group=group)
+        return discovered.get(group, [])  # Python 3.8/3.9 return a dict of groups
+
+    def names(self):
+        return list(self._steps)
+
+    def description(self, name):
+        return self._steps[name][0]
+
+    def get(self, name):
+        """The bound method running step `name`; its class is imported and built on first use."""
+        _, target, method = self._steps[name]
+        key = target if isinstance(target, str) else target.value
+        if key not in self._instances:
+            self._instances[key] = self._load_class(target).from_context(self.context)
+        return getattr(self._instances[key], method)
+
+    @staticmethod
+    def _load_class(target):
+        if not isinstance(target, str):
+            return target.load()
+        module_name, class_name = target.split(":")
+        return getattr(importlib.import_module(module_name), class_name)
@@ -0,0 +1,115 @@
+# git_assist/utils/step_scheduler.py
+
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from utils.logger import Logger
+from utils.profiler import Profiler
+from utils.shell_utils import ShellUtils
+
+
+class StepScheduler:
+    """Run named steps on a worker pool, honouring their declared dependencies.
+
+    A step starts as soon as every step it depends on has succeeded or was skipped.
+    When a step raises, all steps depending on it (directly or transitively) are
+    cancelled. Steps added with a `skip_reason` are not run but count as satisfied.
+    On Ctrl+C the commands the workers are streaming are killed, so the running
+    steps fail fast, and steps that have not started are dropped.
+    """
+
+    SUCCESS = "success"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    SKIPPED = "skipped"
+
+    def __init__(self, logger: Logger, max_workers: int = 4):
+        self.logger = logger
+        self.max_workers = max_workers
+        self._steps = {}
+        self.results = {}
+        self.errors = {}
+        self.skipped = {}
+        self.durations = {}
+
+    def add_step(self, name, func, depends_on=(), skip_reason=None):
+        if name in self._steps:
+            raise ValueError(f"❌ Step '{name}' is already registered.")
+        self._steps[name] = (func, list(depends_on))
+        if skip_reason:
+            self.skipped[name] = skip_reason
+        return self
+
+    def _validate(self):
+        for name, (_, deps) in self._steps.items():
+            for dep in deps:
+                if dep not in self._steps:
+                    raise ValueError(f"❌ Step '{name}' depends on unknown step '{dep}'.")
+
+        # Kahn's algorithm to reject dependency cycles up front
+        remaining = {name: set(deps) for name, (_, deps) in self._steps.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"❌ Dependency cycle between steps: {', '.join(sorted(remaining))}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def _timed(self, name, func):
+        started = time.monotonic()
+        try:
+            with Profiler.span(name, "step"):
+                return func()
+        finally:
+            self.durations[name] = round(time.monotonic() - started, 2)
+
+    def run(self):
+        """Run all steps and return a dict of step name -> status. Raises if any step failed."""
+        self._validate()
+
+        pending = dict(self._steps)
+        running = {}
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while pending or running:
+                for name, (func, deps) in list(pending.items()):
+                    dep_states = [self.results.get(dep) for dep in deps]
+                    if any(state in (self.FAILED, self.CANCELLED) for state in dep_states):
+                        self.logger.warn(f"⏭️ Skipping '{name}': a step it depends on did not succeed.")
+                        self.results[name] = self.CANCELLED
+                        del pending[name]
+                    elif all(state in (self.SUCCESS, self.SKIPPED) for state in dep_states):
+                        if name in self.skipped:
+                            self.logger.highlight(f"⏭️ Skipping '{name}': {self.skipped[name]}.")
+                            self.results[name] = self.SKIPPED
+                        else:
+                            running[pool.submit(self._timed, name, func)] = name
+                        del pending[name]
+
+                if not running:
+                    # Only cancelled or skipped steps were left; loop again to resolve their dependents
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                        self.results[name] = self.SUCCESS
+                    except Exception as e:
+                        self.logger.error(f"❌ Step '{name}' failed: {e}")
+                        self.results[name] = self.FAILED
+                        self.errors[name] = e
+        except KeyboardInterrupt:
+            # Only the main thread sees Ctrl+C; the streamed commands run in their own process groups
+            ShellUtils.kill_running()
+            raise
+        finally:
+            pool.shutdown()
+
+        if self.errors:
+            failed = ", ".join(self.errors)
+            raise Exception(f"Step(s) failed: {failed}")
+        return self.results
@@ -0,0 +1,81 @@
+# git_assist/utils/surefire_parser.py
+
+import os
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+OUTCOMES = ("failure", "error", "skipped")
+
+
+class TestCaseResult:
+    def __init__(self, module, classname, name, time, outcome=None, message=None):
+        self.module = module
+        self.classname = classname
+        self.name = name
+        self.time = time
+        self.outcome = outcome
+        self.message = message
+
+
+class SurefireReport:
+    """Aggregated `TEST-*.xml` results of all modules; each module's reports are parsed on its own thread."""
+
+    def __init__(self):
+        self.cases = []
+        self.class_times = {}
+
+    @staticmethod
+    def find(root=".", newer_than=None):
+        """Report files per module directory, optionally only those written after `newer_than` (epoch seconds)."""
+        reports = {}
+        for path in sorted(Path(root).glob("**/target/surefire-reports/TEST-*.xml")):
+            if newer_than is not None and path.stat().st_mtime < newer_than:
+                continue  # left over from an earlier build of a module that was not rebuilt
+            module = os.path.relpath(path.parent.parent.parent, root)
+            reports.setdefault(module, []).append(path)
+        return reports
+
+    @classmethod
+    def parse(cls, reports, max_workers=4):
+        report = cls()
+        if not reports:
+            return report
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for cases in pool.map(cls._parse_module, reports.keys(), reports.values()):
+                report.cases.extend(cases)
+        for case in report.cases:
+            key = (case.module, case.classname)
+            report.class_times[key] = report.class_times.get(key, 0) + case.time
+        return report
+
+    @staticmethod
+    def _parse_module(module, paths):
+        cases = []
+        for path in paths:
+            case = None
+            for event, element in ET.iterparse(str(path), events=("start", "end")):
+                if event == "start":
+                    if element.tag == "testcase":
+                        case = TestCaseResult(module, element.get("classname", ""), element.get("name", ""),
+                                              float(element.get("time", "0").replace(",", "") or 0))
+                    elif case and element.tag in OUTCOMES:
+                        case.outcome = element.tag
+                        case.message = element.get("message") or element.get("type")
+                elif element.tag == "testcase":
+                    cases.append(case)
+                    case = None
+                    element.clear()
+        return cases
+
+    def count(self, outcome=None):
+        return sum(1 for case in self.cases if case.outcome == outcome) if outcome else len(self.cases)
+
+    def failures(self):
+        return [case for case in self.cases if case.outcome in ("failure", "error")]
+
+    def slowest_classes(self, limit=10):
+        return sorted(self.class_times.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+    def slowest_cases(self, limit=10):
+        return sorted(self.cases, key=lambda case: case.time, reverse=True)[:limit]
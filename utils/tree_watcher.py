@@ -0,0 +1,144 @@
+# git_assist/utils/tree_watcher.py
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import time
+
+IGNORED_DIRS = {".git", "target", "git-assist", ".scannerwork", "node_modules", ".idea"}
+
+IN_MODIFY, IN_ATTRIB, IN_CLOSE_WRITE = 0x2, 0x4, 0x8
+IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x40, 0x80, 0x100, 0x200
+IN_DELETE_SELF, IN_Q_OVERFLOW, IN_ISDIR = 0x400, 0x4000, 0x40000000
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Recursive inotify watch through libc (Linux only)."""
+
+    def __init__(self, root, ignored_dirs):
+        self.root = root
+        self.ignored_dirs = ignored_dirs
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {}
+        self._watch_tree(root)
+
+    def _watch_tree(self, top):
+        for directory, dirnames, _ in os.walk(top):
+            dirnames[:] = [name for name in dirnames if name not in self.ignored_dirs]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                if error == errno.ENOENT:
+                    continue  # removed while walking
+                raise OSError(error, f"inotify_add_watch failed for {directory} (raise fs.inotify.max_user_watches?)")
+            self.watches[wd] = directory
+
+    def read(self, timeout):
+        """Changed paths (relative to the root) seen within `timeout` seconds."""
+        changed = set()
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return changed
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                name = os.fsdecode(data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b"\0"))
+                offset += EVENT_HEADER.size + length
+                if mask & IN_Q_OVERFLOW:
+                    changed.add(".")  # events were lost: treat it as "something changed"
+                    continue
+                directory = self.watches.get(wd)
+                if directory is None:
+                    continue
+                if mask & IN_DELETE_SELF:
+                    del self.watches[wd]
+                    continue
+                if name in self.ignored_dirs and mask & IN_ISDIR:
+                    continue
+                path = os.path.join(directory, name)
+                changed.add(os.path.relpath(path, self.root))
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(path)
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _Poller:
+    """Fallback that compares (mtime, size) snapshots of the tree."""
+
+    def __init__(self, root, ignored_dirs, interval):
+        self.root = root
+        self.ignored_dirs = ignored_dirs
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for directory, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [name for name in dirnames if name not in self.ignored_dirs]
+            for name in filenames:
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.lstat(path)
+                except FileNotFoundError:
+                    continue
+                snapshot[os.path.relpath(path, self.root)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def read(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.interval if deadline is None else max(0, min(self.interval, deadline - time.monotonic()))
+            time.sleep(wait)
+            snapshot = self._scan()
+            changed = {path for path in snapshot.keys() | self.snapshot.keys()
+                       if snapshot.get(path) != self.snapshot.get(path)}
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+class TreeWatcher:
+    """Reports changed files below `root`, using inotify on Linux and polling elsewhere.
+
+    Build output and tool directories (IGNORED_DIRS) are not watched, so the
+    checks started because of a change do not trigger themselves.
+    """
+
+    def __init__(self, root=".", ignored_dirs=IGNORED_DIRS, poll_interval: float = 1.0, use_inotify: bool = True):
+        self.root = os.path.abspath(root)
+        self._backend = None
+        if use_inotify and hasattr(os, "O_CLOEXEC") and os.uname().sysname == "Linux":
+            try:
+                self._backend = _Inotify(self.root, ignored_dirs)
+                self.backend = "inotify"
+            except (OSError, AttributeError):
+                self._backend = None
+        if self._backend is None:
+            self._backend = _Poller(self.root, ignored_dirs, poll_interval)
+            self.backend = "polling"
+
+    def wait(self, timeout=None):
+        """Block until something changes (or `timeout` passes) and return the changed paths."""
+        return self._backend.read(timeout)
+
+    def close(self):
+        self._backend.close()
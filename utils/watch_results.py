@@ -0,0 +1,121 @@
+# git_assist/utils/watch_results.py
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from utils.git_status import TOOL_OUTPUT_DIRS
+from utils.profiler import Profiler
+
+# Tool output written while checks run; never part of the hashed tree
+EXCLUDED_PATHSPECS = [f":(exclude){directory}" for directory in TOOL_OUTPUT_DIRS]
+
+
+class WatchResults:
+    """Check results from watch mode, keyed by a hash of the working tree they ran against.
+
+    The hash is the git tree id of every tracked and untracked (non-ignored)
+    file as it is on disk, built in a scratch index, so it does not depend
+    on what is staged.
+    """
+
+    def __init__(self, results_file: str = "git-assist/watch/results.json", max_entries: int = 20):
+        self.results_file = Path(results_file)
+        self.max_entries = max_entries
+
+    @staticmethod
+    def tree_hash():
+        """Tree id of the working tree as it is on disk.
+
+        `git add` writes a loose blob for every new or modified file it hashes.
+        The scratch index is kept in the git dir between calls, so a file is
+        only hashed again once its stat data changes; blobs of intermediate
+        edits are unreachable and removed by `git gc` (gc.pruneExpire).
+        """
+        git_dir = subprocess.check_output(["git", "rev-parse", "--git-dir"]).decode().strip()
+        scratch_index = os.path.join(git_dir, "git-assist-watch.index")
+        fd, index = tempfile.mkstemp(prefix="git-assist-index-", dir=git_dir)
+        os.close(fd)
+        try:
+            # Start from the last scratch index (or the real one) so git reuses its cached file stats
+            for seed in (scratch_index, os.path.join(git_dir, "index")):
+                if os.path.isfile(seed):
+                    shutil.copyfile(seed, index)
+                    break
+            else:
+                os.unlink(index)
+            env = dict(os.environ, GIT_INDEX_FILE=index)
+            with Profiler.span("git write-tree (working tree)", "git"):
+                subprocess.run(["git", "add", "-A", "--", "."] + EXCLUDED_PATHSPECS, env=env, check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                tree = subprocess.check_output(["git", "write-tree"], env=env).decode().strip()
+            os.replace(index, scratch_index)  # concurrent callers each work on a copy; the last one wins
+            return tree
+        finally:
+            if os.path.exists(index):
+                os.unlink(index)
+
+    @staticmethod
+    def index_tree():
+        result = subprocess.run(["git", "write-tree"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        return result.stdout.decode().strip() or None
+
+    @staticmethod
+    def head_tree():
+        result = subprocess.run(["git", "rev-parse", "--verify", "--quiet", "HEAD^{tree}"], stdout=subprocess.PIPE)
+        return result.stdout.decode().strip() or None
+
+    def exists(self):
+        return self.results_file.is_file()
+
+    def _load(self):
+        if not self.results_file.is_file():
+            return {}
+        try:
+            with self.results_file.open("r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def store(self, tree, steps):
+        entries = self._load()
+        entries[tree] = {"finished_at": time.time(), "steps": steps}
+        newest = sorted(entries.items(), key=lambda item: item[1]["finished_at"], reverse=True)[:self.max_entries]
+        self.results_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.results_file.with_suffix(".tmp")
+        with tmp_file.open("w") as f:
+            json.dump(dict(newest), f, indent=2)
+        tmp_file.replace(self.results_file)
+
+    def get(self, tree):
+        """{step: {"status", "duration", "details"}} recorded for `tree`, or None."""
+        entry = self._load().get(tree)
+        return entry["steps"] if entry else None
+
+    def for_current_tree(self, expected_tree=None):
+        """Results for the working tree as it is now; None without results, or when it differs from `expected_tree`.
+
+        Committer passes the index tree and Pusher the HEAD tree, so results are
+        only used when they cover exactly what is about to be committed or pushed.
+        """
+        if not self.exists():
+            return None  # watch mode never ran here: skip hashing the tree
+        try:
+            tree = self.tree_hash()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        if expected_tree and tree != expected_tree:
+            return None
+        return self.get(tree)
+
+    def checks_for(self, expected_tree):
+        """(checks that passed, checks that failed) in watch mode for `expected_tree`, or None if it was not checked."""
+        steps = self.for_current_tree(expected_tree) if expected_tree else None
+        if steps is None:
+            return None
+        passed = [name for name, step in steps.items() if step["status"] == "success"]
+        failed = [name for name, step in steps.items() if step["status"] in ("failed", "cancelled")]
+        return passed, failed